@@ -8,7 +8,7 @@ import sys
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.config import settings
+from app.config import get_settings
 from app.models import User, Task, Tag, TaskTag
 from sqlmodel import SQLModel
 
@@ -17,7 +17,7 @@ from sqlmodel import SQLModel
 config = context.config
 
 # Set the database URL from settings
-config.set_main_option('sqlalchemy.url', settings.database_url)
+config.set_main_option('sqlalchemy.url', get_settings().database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,40 @@
+"""Add composite indexes for keyset pagination of chat lists
+
+Revision ID: 002_chat_pagination_indexes
+Revises: 1afa28a56b14
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_chat_pagination_indexes'
+down_revision: Union[str, None] = '1afa28a56b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /chat/conversations: WHERE user_id = ? ORDER BY updated_at DESC, id DESC
+    op.create_index(
+        'ix_conversations_user_updated',
+        'conversations',
+        ['user_id', 'updated_at', 'id'],
+        unique=False
+    )
+    # GET /chat/conversations/{id}/messages: WHERE conversation_id = ? ORDER BY id DESC
+    op.create_index(
+        'ix_messages_conversation_id_id',
+        'messages',
+        ['conversation_id', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_conversation_id_id', table_name='messages')
+    op.drop_index('ix_conversations_user_updated', table_name='conversations')
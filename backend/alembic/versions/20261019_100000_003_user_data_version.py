@@ -0,0 +1,82 @@
+"""Add users.data_version, bumped by triggers on any task or tag change
+
+Revision ID: 003_user_data_version
+Revises: 002_chat_pagination_indexes
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_user_data_version'
+down_revision: Union[str, None] = '002_chat_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Statement-level triggers with transition tables: one UPDATE of the owner's
+# users row per statement, however many rows it touched (bulk-by-filter),
+# and none when it touched no rows. A trigger with a transition table can
+# only have one event, hence one trigger per table and operation.
+TRIGGERS = [
+    ('tasks', 'INSERT', 'NEW', 'bump_data_version_from_owned_rows'),
+    ('tasks', 'UPDATE', 'NEW', 'bump_data_version_from_owned_rows'),
+    ('tasks', 'DELETE', 'OLD', 'bump_data_version_from_owned_rows'),
+    ('tags', 'INSERT', 'NEW', 'bump_data_version_from_owned_rows'),
+    ('tags', 'UPDATE', 'NEW', 'bump_data_version_from_owned_rows'),
+    ('tags', 'DELETE', 'OLD', 'bump_data_version_from_owned_rows'),
+    ('task_tags', 'INSERT', 'NEW', 'bump_data_version_from_task_tags'),
+    ('task_tags', 'UPDATE', 'NEW', 'bump_data_version_from_task_tags'),
+    ('task_tags', 'DELETE', 'OLD', 'bump_data_version_from_task_tags'),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('data_version', sa.BigInteger(), nullable=False, server_default='0')
+    )
+
+    # tasks and tags carry user_id
+    op.execute("""
+        CREATE FUNCTION bump_data_version_from_owned_rows() RETURNS trigger AS $$
+        BEGIN
+            UPDATE users SET data_version = data_version + 1
+            WHERE id IN (SELECT user_id FROM changed_rows);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # task_tags only link a user's task to the same user's tag
+    op.execute("""
+        CREATE FUNCTION bump_data_version_from_task_tags() RETURNS trigger AS $$
+        BEGIN
+            UPDATE users SET data_version = data_version + 1
+            WHERE id IN (
+                SELECT tags.user_id FROM tags
+                WHERE tags.id IN (SELECT tag_id FROM changed_rows)
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table, event, transition, function in TRIGGERS:
+        op.execute(f"""
+            CREATE TRIGGER {table}_{event.lower()}_data_version
+            AFTER {event} ON {table}
+            REFERENCING {transition} TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+
+
+def downgrade() -> None:
+    for table, event, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER {table}_{event.lower()}_data_version ON {table}")
+    op.execute("DROP FUNCTION bump_data_version_from_task_tags()")
+    op.execute("DROP FUNCTION bump_data_version_from_owned_rows()")
+    op.drop_column('users', 'data_version')
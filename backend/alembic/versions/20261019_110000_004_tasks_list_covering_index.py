@@ -0,0 +1,36 @@
+"""Add a covering index for the task list view
+
+Revision ID: 004_tasks_list_covering_index
+Revises: 003_user_data_version
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_tasks_list_covering_index'
+down_revision: Union[str, None] = '003_user_data_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /tasks?fields=id,title,completed,priority,due_date (list view):
+    # WHERE user_id = ? ORDER BY created_at DESC, and the completed count,
+    # are answered by an index-only scan, without reading the heap rows
+    # (and their descriptions)
+    op.create_index(
+        'ix_tasks_user_created_list',
+        'tasks',
+        ['user_id', 'created_at'],
+        unique=False,
+        postgresql_include=['id', 'title', 'completed', 'priority', 'due_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_user_created_list', table_name='tasks')
@@ -0,0 +1,95 @@
+"""Add tasks.change_seq and task_tombstones for GET /tasks/changes
+
+Revision ID: 005_task_change_seq
+Revises: 004_tasks_list_covering_index
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_task_change_seq'
+down_revision: Union[str, None] = '004_tasks_list_covering_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every insert/update of a task takes the next value of task_change_seq;
+# every delete writes a tombstone with the next value. Before taking a
+# value, the trigger locks the owner's users row until commit (the
+# data_version trigger of 003 updates that row anyway). Writers of the
+# same user are therefore serialized, so within one user change_seq order
+# is commit order: a client that has seen change_seq N never misses a
+# change <= N committed later.
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE task_change_seq")
+
+    op.add_column('tasks', sa.Column('change_seq', sa.BigInteger(), nullable=True))
+    op.execute("UPDATE tasks SET change_seq = nextval('task_change_seq')")
+    op.alter_column('tasks', 'change_seq', nullable=False)
+    op.create_index('ix_tasks_user_change_seq', 'tasks', ['user_id', 'change_seq'], unique=False)
+
+    op.create_table(
+        'task_tombstones',
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),  # No FK: outlives the user's rows
+        sa.Column('deleted_at', sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint('change_seq')
+    )
+    op.create_index('ix_task_tombstones_user_change_seq', 'task_tombstones', ['user_id', 'change_seq'], unique=False)
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at'], unique=False)
+
+    op.execute("""
+        CREATE FUNCTION assign_task_change_seq() RETURNS trigger AS $$
+        BEGIN
+            PERFORM 1 FROM users WHERE id = NEW.user_id FOR NO KEY UPDATE;
+            NEW.change_seq := nextval('task_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_change_seq
+        BEFORE INSERT OR UPDATE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION assign_task_change_seq()
+    """)
+
+    op.execute("""
+        CREATE FUNCTION record_task_tombstones() RETURNS trigger AS $$
+        BEGIN
+            PERFORM 1 FROM users
+            WHERE id IN (SELECT user_id FROM deleted_rows)
+            ORDER BY id
+            FOR NO KEY UPDATE;
+            INSERT INTO task_tombstones (change_seq, task_id, user_id)
+            SELECT nextval('task_change_seq'), id, user_id FROM deleted_rows;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_delete_tombstones
+        AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS deleted_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION record_task_tombstones()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER tasks_delete_tombstones ON tasks")
+    op.execute("DROP FUNCTION record_task_tombstones()")
+    op.execute("DROP TRIGGER tasks_change_seq ON tasks")
+    op.execute("DROP FUNCTION assign_task_change_seq()")
+    op.drop_index('ix_task_tombstones_deleted_at', table_name='task_tombstones')
+    op.drop_index('ix_task_tombstones_user_change_seq', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_index('ix_tasks_user_change_seq', table_name='tasks')
+    op.drop_column('tasks', 'change_seq')
+    op.execute("DROP SEQUENCE task_change_seq")
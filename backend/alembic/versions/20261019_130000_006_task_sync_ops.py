@@ -0,0 +1,39 @@
+"""Add task_sync_ops for POST /tasks/sync idempotency keys
+
+Revision ID: 006_task_sync_ops
+Revises: 005_task_change_seq
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_task_sync_ops'
+down_revision: Union[str, None] = '005_task_change_seq'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_sync_ops',
+        sa.Column('user_id', sa.String(), nullable=False),  # No FK: pruned by age, like tombstones
+        sa.Column('idempotency_key', sa.String(length=100), nullable=False),
+        sa.Column('op', sa.String(length=20), nullable=False),
+        sa.Column('client_id', sa.String(length=100), nullable=True),
+        sa.Column('task_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'idempotency_key')
+    )
+    op.create_index('ix_task_sync_ops_user_client_id', 'task_sync_ops', ['user_id', 'client_id'], unique=False)
+    op.create_index('ix_task_sync_ops_created_at', 'task_sync_ops', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_sync_ops_created_at', table_name='task_sync_ops')
+    op.drop_index('ix_task_sync_ops_user_client_id', table_name='task_sync_ops')
+    op.drop_table('task_sync_ops')
@@ -18,6 +18,54 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
 
+    # AI chat
+    llm_provider: str = "auto"  # auto | groq | ollama | gemini | replay
+    # Record/replay (see app/services/llm_cassette.py): LLM_PROVIDER=replay
+    # answers from cassettes only; LLM_CASSETTE_RECORD=true saves new
+    # exchanges of the real provider there
+    llm_cassette_dir: str = "cassettes"
+    llm_cassette_record: bool = False
+    chat_list_default_limit: int = 20  # Tasks per list_tasks page
+    chat_tool_token_budget: int = 600  # Max estimated tokens per list_tasks observation
+    # True: one transaction per chat turn (holds a DB connection during LLM calls)
+    # False: short sessions for history, each tool call and persisting messages
+    chat_single_transaction: bool = False
+    # Import the LangChain/LLM stack in the background after startup so the
+    # first chat is not slow; set False on REST-only workers to save memory
+    chat_preload_agent: bool = True
+
+    # Ollama (local LLM)
+    ollama_base_url: str = "http://127.0.0.1:11434"
+    ollama_model: str = "llama3.2"
+    ollama_preload: bool = True  # Load the model into RAM in the background at startup
+    ollama_keep_alive: str = "30m"  # How long Ollama keeps the model loaded after a request (-1 = forever)
+    ollama_startup_timeout: float = 60  # Seconds to wait for `ollama serve` to come up
+    ollama_load_timeout: float = 300  # Seconds allowed for the initial model load
+
+    # SQL per request (Server-Timing header); a request repeating one
+    # statement shape more often than this is logged and counted (0 = off)
+    sql_n_plus_one_threshold: int = 10
+    # Raise NPlusOneQueryError instead (a 500); meant for the test suite
+    sql_n_plus_one_raise: bool = False
+
+    # GET /tasks response cache (per user, in process); 0 disables it
+    task_list_cache_size: int = 2048  # Max cached responses per worker
+    # Invalidate other workers' caches and reach their GET /events streams
+    # via Postgres LISTEN/NOTIFY; required when running several workers or replicas
+    task_list_cache_notify: bool = True
+
+    # GET /events (SSE): comment line sent when idle, so proxies keep the stream open
+    live_events_heartbeat_seconds: float = 15
+
+    # GET /tasks/changes: deleted-task log kept this long; older cursors must resync
+    task_tombstone_retention_days: int = 30
+
+    # Tracing (OpenTelemetry)
+    tracing_exporter: str = "none"  # none | file | otlp | console
+    tracing_file: str = "traces.jsonl"  # TRACING_EXPORTER=file (JSON lines, offline)
+    otlp_endpoint: str = "http://localhost:4318/v1/traces"  # TRACING_EXPORTER=otlp (OTLP/HTTP)
+    tracing_service_name: str = "todo-backend"
+
     @field_validator("database_url", "jwt_algorithm", mode="before")
     @classmethod
     def clean_settings(cls, v: str):
@@ -28,6 +76,11 @@ class Settings(BaseSettings):
                 v = v.replace("postgres://", "postgresql://", 1)
         return v
 
+    @property
+    def async_database_url(self) -> str:
+        """Database URL for the async engine (psycopg 3 driver)."""
+        return self.database_url.replace("postgresql://", "postgresql+psycopg://", 1)
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -36,6 +89,3 @@ class Settings(BaseSettings):
 @lru_cache()
 def get_settings():
     return Settings()
-
-
-settings = get_settings()
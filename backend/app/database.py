@@ -1,23 +1,93 @@
 from sqlmodel import create_engine, Session, SQLModel
-from app.config import settings
-from contextlib import contextmanager
-from typing import Generator
-
-# Create engine with connection pooling (lazy connection)
-engine = create_engine(
-    settings.database_url,
-    echo=settings.environment == "development",
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    connect_args={"connect_timeout": 5}  # 5 second timeout
-)
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.config import get_settings
+from app.utils.metrics import timed_pool_class, instrument_pool
+from app.utils.tracing import instrument_engine
+from app.utils.query_stats import instrument_query_stats
+from functools import lru_cache
+from typing import AsyncGenerator, Generator
+
+# Engines are created on first use, not at import, so importing the app
+# (CLI tools, alembic, benchmarks, worker boot) does not build pools or
+# load the async driver until a request actually needs the database.
+# `engine`, `async_engine` and `AsyncSessionLocal` stay importable names.
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """Sync engine with connection pooling (lazy connection)."""
+    settings = get_settings()
+    sync_engine = create_engine(
+        settings.database_url,
+        echo=settings.environment == "development",
+        poolclass=timed_pool_class(QueuePool, "sync"),  # Checkout wait metric
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,  # Verify connections before using
+        pool_recycle=3600,  # Recycle connections after 1 hour
+        connect_args={"connect_timeout": 5}  # 5 second timeout
+    )
+    instrument_pool(sync_engine.pool, "sync")
+    instrument_engine(sync_engine)  # One span per SQL statement
+    instrument_query_stats(sync_engine)  # Server-Timing / N+1 detection
+    return sync_engine
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """Async engine for coroutine code paths (AI agent tools)."""
+    settings = get_settings()
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        echo=settings.environment == "development",
+        poolclass=timed_pool_class(AsyncAdaptedQueuePool, "async"),
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        connect_args={"connect_timeout": 5}
+    )
+    instrument_pool(async_engine.sync_engine.pool, "async")
+    instrument_engine(async_engine.sync_engine)
+    instrument_query_stats(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache()
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Factory for short-lived async sessions.
+
+    expire_on_commit=False so returned objects stay readable after commit
+    without an implicit (and, under asyncio, illegal) lazy refresh.
+    """
+    return async_sessionmaker(
+        get_async_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Open a new AsyncSession (usage: `async with AsyncSessionLocal() as db`)."""
+    return get_async_sessionmaker()()
+
+
+def __getattr__(name: str):
+    # Backwards compatible module attributes, resolved lazily (PEP 562)
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_db_and_tables():
     """Create database tables. Call this during startup if needed."""
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -27,7 +97,7 @@ def get_session() -> Generator[Session, None, None]:
     Raises:
         HTTPException: If database connection fails
     """
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         try:
             yield session
         except Exception as e:
@@ -35,3 +105,13 @@ def get_session() -> Generator[Session, None, None]:
             raise
         finally:
             session.close()
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency to get an async database session."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
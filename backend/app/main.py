@@ -1,14 +1,79 @@
-from fastapi import FastAPI
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import get_settings
+from app.services.llm_provider import ollama_is_selected
+from app.services.ollama_warmup import ollama_state, warm_ollama_model, OllamaWarmState
+from app.services.task_list_cache import listen_for_invalidations
+from app.services.task_changes import prune_tombstones_periodically
+from app.services.task_sync import prune_sync_ops_periodically
+from app.utils.metrics import PrometheusMiddleware, metrics_response_body, METRICS_CONTENT_TYPE
+from app.utils.tracing import setup_tracing, shutdown_tracing, TracingMiddleware
+from app.utils.query_stats import QueryStatsMiddleware
+
 # Import routers
-from app.routers import auth, tasks, tags, chat
+from app.routers import auth, tasks, tags, chat, events
+
+
+async def _preload_agent_stack():
+    """
+    Import the LangChain/LLM modules in a worker thread after startup.
+
+    The chat router imports them lazily, so the app binds its port without
+    paying for them; this only moves that cost off the first /chat request.
+    """
+    try:
+        await asyncio.to_thread(importlib.import_module, "app.services.agent_service")
+    except Exception as e:
+        print(f"⚠️ Agent preload failed (will retry on first chat): {e}")
+
+
+async def _warm_ollama_if_selected():
+    """
+    Preload the Ollama model if chats will use it.
+
+    Same choice as agent_service.create_llm (select_llm_provider); in auto
+    mode that probes Ollama, hence the worker thread.
+    """
+    if await asyncio.to_thread(ollama_is_selected):
+        await warm_ollama_model()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    # Tracing provider/exporter from TRACING_EXPORTER (no-op spans when "none")
+    setup_tracing()
+    # Background tasks only: the API starts serving immediately
+    background = []
+    if settings.chat_preload_agent:
+        background.append(asyncio.create_task(_preload_agent_stack()))
+    if settings.ollama_preload:
+        background.append(asyncio.create_task(_warm_ollama_if_selected()))
+    if settings.task_list_cache_notify:
+        # Other workers' writes invalidate this worker's GET /tasks cache
+        # and reach its GET /events streams
+        background.append(asyncio.create_task(listen_for_invalidations()))
+    # Retention of the GET /tasks/changes deleted-task log and POST /tasks/sync keys
+    background.append(asyncio.create_task(prune_tombstones_periodically()))
+    background.append(asyncio.create_task(prune_sync_ops_periodically()))
+    yield
+    for task in background:
+        if not task.done():
+            task.cancel()
+    shutdown_tracing()
+
 
 # Initialize FastAPI
 app = FastAPI(
     title="Hackathon Todo API",
     description="Production-grade todo API for Hackathon II",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS setup - Allow frontend to make requests
@@ -18,13 +83,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing", "ETag"],  # Chat list cursor, per-request DB time, list versions
 )
 
+# Request latency by route template and status (exported at /metrics)
+app.add_middleware(PrometheusMiddleware)
+
+# One server span per request; SQL, agent, LLM and tool spans nest under it
+app.add_middleware(TracingMiddleware)
+
+# SQL statement count and DB time per request (Server-Timing header)
+app.add_middleware(QueryStatsMiddleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(tasks.router)
 app.include_router(tags.router)
 app.include_router(chat.router)
+app.include_router(events.router)
 
 @app.get("/")
 async def root():
@@ -38,3 +114,21 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """
+    Readiness probe: 503 while the Ollama model is still loading (the
+    warm-up only runs when chats use Ollama), so traffic (and the first chat)
+    only arrives once it is warm. Reports the LLM warm/cold state; a cold or
+    unavailable Ollama does not block readiness.
+    """
+    if ollama_state.status == OllamaWarmState.WARMING:
+        response.status_code = 503
+        return {"status": "warming", "ollama": ollama_state.as_dict()}
+    return {"status": "ready", "ollama": ollama_state.as_dict()}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    return Response(content=metrics_response_body(), media_type=METRICS_CONTENT_TYPE)
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from app.config import get_settings
 from app.database import create_db_and_tables
 from app.routers import auth_router, tasks_router, tags_router, chat_router
 
@@ -4,17 +4,34 @@
 # Converts MCP tools to LangChain format for use with Ollama LLM
 
 from typing import List, Dict, Any, Optional
+from contextlib import contextmanager, asynccontextmanager
+import asyncio
 from langchain.tools import Tool, StructuredTool
 from pydantic import BaseModel, Field
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.database import get_engine, AsyncSessionLocal
 from app.models.user import User
 from .todo_tools import (
     add_task as _add_task,
     list_tasks as _list_tasks,
     complete_task as _complete_task,
     delete_task as _delete_task,
-    update_task as _update_task
+    update_task as _update_task,
+    add_task_async as _add_task_async,
+    list_tasks_async as _list_tasks_async,
+    complete_task_async as _complete_task_async,
+    delete_task_async as _delete_task_async,
+    update_task_async as _update_task_async,
+    add_tasks as _add_tasks,
+    complete_tasks as _complete_tasks,
+    delete_tasks as _delete_tasks,
+    add_tasks_async as _add_tasks_async,
+    complete_tasks_async as _complete_tasks_async,
+    delete_tasks_async as _delete_tasks_async,
+    bulk_update_by_filter as _bulk_update_by_filter,
+    bulk_update_by_filter_async as _bulk_update_by_filter_async
 )
 
 
@@ -34,6 +51,12 @@ class ListTasksInput(BaseModel):
     """Input schema for list_tasks tool"""
     status: str = Field(default="all", description="Filter by status: 'all', 'pending', or 'completed'. Default is 'all'.")
     priority: Optional[str] = Field(None, description="Optional filter by priority: 'high', 'medium', or 'low'")
+    category: Optional[str] = Field(None, description="Optional filter by exact category name")
+    search: Optional[str] = Field(None, description="Optional text to search for in task titles and descriptions")
+    due_after: Optional[str] = Field(None, description="Optional: only tasks due on or after this date (YYYY-MM-DD)")
+    due_before: Optional[str] = Field(None, description="Optional: only tasks due on or before this date (YYYY-MM-DD)")
+    limit: Optional[int] = Field(None, ge=1, le=100, description="Optional page size (default 20, max 100)")
+    offset: int = Field(default=0, ge=0, description="Number of tasks to skip; use next_offset from a previous result to see more")
 
 
 class CompleteTaskInput(BaseModel):
@@ -56,40 +79,165 @@ class UpdateTaskInput(BaseModel):
     due_date: Optional[str] = Field(None, description="New due date in ISO 8601 format")
 
 
+class AddTasksInput(BaseModel):
+    """Input schema for add_tasks tool"""
+    tasks: List[AddTaskInput] = Field(..., min_length=1, max_length=50, description="The tasks to create, one entry per item the user mentioned")
+
+
+class CompleteTasksInput(BaseModel):
+    """Input schema for complete_tasks tool"""
+    task_ids: List[int] = Field(..., min_length=1, max_length=50, description="The IDs of the tasks to mark as complete")
+    completed: bool = Field(default=True, description="True to mark complete, False to mark incomplete. Default is True.")
+
+
+class DeleteTasksInput(BaseModel):
+    """Input schema for delete_tasks tool"""
+    task_ids: List[int] = Field(..., min_length=1, max_length=50, description="The IDs of the tasks to delete permanently")
+
+
+class BulkUpdateByFilterInput(BaseModel):
+    """Input schema for bulk_update_by_filter tool"""
+    action: str = Field(..., description="What to do with every matching task: 'complete', 'uncomplete', 'update' or 'delete'")
+    status: str = Field(default="all", description="Filter by status: 'all', 'pending', or 'completed'. Default is 'all'.")
+    priority: Optional[str] = Field(None, description="Optional filter by priority: 'high', 'medium', or 'low'")
+    category: Optional[str] = Field(None, description="Optional filter by exact category name")
+    search: Optional[str] = Field(None, description="Optional filter by text in title or description")
+    tag_ids: Optional[List[int]] = Field(None, description="Optional filter by tag IDs (tasks having any of them)")
+    new_priority: Optional[str] = Field(None, description="For action 'update': new priority 'high', 'medium', or 'low'")
+    new_category: Optional[str] = Field(None, description="For action 'update': new category")
+    dry_run: bool = Field(default=False, description="True to only count matching tasks without changing them")
+
+
 # ============================================================================
 # LANGCHAIN TOOL FACTORY
 # ============================================================================
 
-def create_langchain_tools(session: Session, user: User) -> List[Tool]:
+def create_langchain_tools(
+    session: Optional[Session],
+    user: User,
+    unit_of_work: Optional[AsyncSession] = None
+) -> List[Tool]:
     """
     Create LangChain tools with session and user context bound.
 
     This factory function creates tool instances with the database session
     and current user already bound, so the LLM doesn't need to provide them.
 
+    Each tool has a sync ``func`` (bound to ``session``, or to a short-lived
+    Session per call when ``session`` is None) and a native
+    ``coroutine``. Under ``AgentExecutor.ainvoke`` LangChain awaits the
+    coroutine directly, so no thread hop is needed. Every coroutine call opens
+    its own AsyncSession, which makes concurrent tool calls safe (a Session
+    must never be shared across threads or tasks).
+
+    Unit-of-work mode: when ``unit_of_work`` is given, the coroutines run on
+    that caller-owned AsyncSession and only flush; the caller commits (or
+    rolls back) the whole chat turn once. Calls are serialized with a lock
+    because the agent may run several tool calls concurrently.
+
     Args:
-        session: SQLModel database session
+        session: SQLModel database session, or None for per-call sessions
         user: Current authenticated user
+        unit_of_work: Optional AsyncSession owning the chat turn's transaction
 
     Returns:
         List of LangChain Tool objects ready for agent use
     """
 
+    # Sync session scope: the bound session, or one session per call
+    @contextmanager
+    def sync_tool_session():
+        if session is not None:
+            yield session
+        else:
+            with Session(get_engine()) as call_session:
+                yield call_session
+
     # Wrapper functions that bind session and user
     def add_task_bound(**kwargs) -> Dict[str, Any]:
-        return _add_task(session, user, **kwargs)
+        with sync_tool_session() as tool_db:
+            return _add_task(tool_db, user, **kwargs)
 
     def list_tasks_bound(**kwargs) -> Dict[str, Any]:
-        return _list_tasks(session, user, **kwargs)
+        with sync_tool_session() as tool_db:
+            return _list_tasks(tool_db, user, **kwargs)
 
     def complete_task_bound(**kwargs) -> Dict[str, Any]:
-        return _complete_task(session, user, **kwargs)
+        with sync_tool_session() as tool_db:
+            return _complete_task(tool_db, user, **kwargs)
 
     def delete_task_bound(**kwargs) -> Dict[str, Any]:
-        return _delete_task(session, user, **kwargs)
+        with sync_tool_session() as tool_db:
+            return _delete_task(tool_db, user, **kwargs)
 
     def update_task_bound(**kwargs) -> Dict[str, Any]:
-        return _update_task(session, user, **kwargs)
+        with sync_tool_session() as tool_db:
+            return _update_task(tool_db, user, **kwargs)
+
+    def add_tasks_bound(**kwargs) -> Dict[str, Any]:
+        with sync_tool_session() as tool_db:
+            return _add_tasks(tool_db, user, **kwargs)
+
+    def complete_tasks_bound(**kwargs) -> Dict[str, Any]:
+        with sync_tool_session() as tool_db:
+            return _complete_tasks(tool_db, user, **kwargs)
+
+    def delete_tasks_bound(**kwargs) -> Dict[str, Any]:
+        with sync_tool_session() as tool_db:
+            return _delete_tasks(tool_db, user, **kwargs)
+
+    def bulk_update_by_filter_bound(**kwargs) -> Dict[str, Any]:
+        with sync_tool_session() as tool_db:
+            return _bulk_update_by_filter(tool_db, user, **kwargs)
+
+    # Async session scope: shared unit of work, or one session per call
+    commit = unit_of_work is None
+    uow_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def tool_session():
+        if unit_of_work is not None:
+            async with uow_lock:
+                yield unit_of_work
+        else:
+            async with AsyncSessionLocal() as async_session:
+                yield async_session
+
+    async def add_task_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _add_task_async(async_session, user, commit=commit, **kwargs)
+
+    async def list_tasks_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _list_tasks_async(async_session, user, **kwargs)
+
+    async def complete_task_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _complete_task_async(async_session, user, commit=commit, **kwargs)
+
+    async def delete_task_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _delete_task_async(async_session, user, commit=commit, **kwargs)
+
+    async def update_task_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _update_task_async(async_session, user, commit=commit, **kwargs)
+
+    async def add_tasks_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _add_tasks_async(async_session, user, commit=commit, **kwargs)
+
+    async def complete_tasks_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _complete_tasks_async(async_session, user, commit=commit, **kwargs)
+
+    async def delete_tasks_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _delete_tasks_async(async_session, user, commit=commit, **kwargs)
+
+    async def bulk_update_by_filter_async_bound(**kwargs) -> Dict[str, Any]:
+        async with tool_session() as async_session:
+            return await _bulk_update_by_filter_async(async_session, user, commit=commit, **kwargs)
 
     # Create LangChain tools with structured inputs
     tools = [
@@ -101,17 +249,21 @@ def create_langchain_tools(session: Session, user: User) -> List[Tool]:
                 "Examples: 'Add buy groceries', 'Remember to call mom', 'Create task pay bills'"
             ),
             func=add_task_bound,
+            coroutine=add_task_async_bound,
             args_schema=AddTaskInput
         ),
         StructuredTool(
             name="list_tasks",
             description=(
-                "Get a list of the user's tasks. "
-                "Can filter by status (all, pending, completed) or priority (high, medium, low). "
+                "Get a page of the user's tasks. "
+                "Can filter by status (all, pending, completed), priority (high, medium, low), "
+                "category, search text or due date window (due_after/due_before). "
+                "Long results are paged: if the result has 'more', call again with offset=next_offset. "
                 "Use this when the user asks to see, show, or list their tasks. "
                 "Examples: 'Show my tasks', 'What's pending?', 'List high priority tasks'"
             ),
             func=list_tasks_bound,
+            coroutine=list_tasks_async_bound,
             args_schema=ListTasksInput
         ),
         StructuredTool(
@@ -122,6 +274,7 @@ def create_langchain_tools(session: Session, user: User) -> List[Tool]:
                 "Examples: 'Mark task 3 as done', 'Complete the groceries task', 'I finished task 5'"
             ),
             func=complete_task_bound,
+            coroutine=complete_task_async_bound,
             args_schema=CompleteTaskInput
         ),
         StructuredTool(
@@ -132,6 +285,7 @@ def create_langchain_tools(session: Session, user: User) -> List[Tool]:
                 "Examples: 'Delete task 2', 'Remove the meeting task', 'Cancel task 7'"
             ),
             func=delete_task_bound,
+            coroutine=delete_task_async_bound,
             args_schema=DeleteTaskInput
         ),
         StructuredTool(
@@ -142,7 +296,53 @@ def create_langchain_tools(session: Session, user: User) -> List[Tool]:
                 "Examples: 'Change task 1 to high priority', 'Update task 3 title to Call mom tonight', 'Rename task 2'"
             ),
             func=update_task_bound,
+            coroutine=update_task_async_bound,
             args_schema=UpdateTaskInput
+        ),
+        StructuredTool(
+            name="add_tasks",
+            description=(
+                "Create several tasks in one call. "
+                "Use this instead of calling add_task repeatedly when the user mentions more than one item. "
+                "Examples: 'Add milk, eggs and bread', 'Remind me to call mom and pay rent'"
+            ),
+            func=add_tasks_bound,
+            coroutine=add_tasks_async_bound,
+            args_schema=AddTasksInput
+        ),
+        StructuredTool(
+            name="complete_tasks",
+            description=(
+                "Mark several tasks as complete or incomplete in one call. "
+                "Use this instead of calling complete_task repeatedly. "
+                "Examples: 'Complete tasks 3, 4 and 9', 'Mark 1 and 2 as done'"
+            ),
+            func=complete_tasks_bound,
+            coroutine=complete_tasks_async_bound,
+            args_schema=CompleteTasksInput
+        ),
+        StructuredTool(
+            name="delete_tasks",
+            description=(
+                "Delete several tasks permanently in one call. "
+                "Use this instead of calling delete_task repeatedly. "
+                "Examples: 'Delete tasks 2 and 5', 'Remove 7, 8 and 10'"
+            ),
+            func=delete_tasks_bound,
+            coroutine=delete_tasks_async_bound,
+            args_schema=DeleteTasksInput
+        ),
+        StructuredTool(
+            name="bulk_update_by_filter",
+            description=(
+                "Complete, uncomplete, update (priority/category) or delete ALL tasks matching a filter in one step, "
+                "without listing them first. Filters: status, priority, category, search, tag_ids. "
+                "Examples: 'Complete all shopping tasks', 'Delete all completed tasks', "
+                "'Make every work task high priority'"
+            ),
+            func=bulk_update_by_filter_bound,
+            coroutine=bulk_update_by_filter_async_bound,
+            args_schema=BulkUpdateByFilterInput
         )
     ]
 
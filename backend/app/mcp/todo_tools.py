@@ -3,11 +3,21 @@
 # Spec: specs/001-competition-todo-app/spec.md § Phase III (AI Chatbot)
 
 from typing import List, Dict, Any, Optional
-from sqlmodel import Session, select
+from contextlib import asynccontextmanager
+from sqlmodel import Session, select, func
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
+import json
 
-from app.models.task import Task
+from app.config import get_settings
+from app.utils.tracing import traced
+from app.models.task import Task, PriorityEnum
 from app.models.user import User
+from app.services.task_list_cache import invalidate_task_lists
+from app.services.task_queries import (
+    task_filter_clauses, count_by_filter_stmt, update_by_filter_stmt, delete_by_filter_stmt
+)
 
 
 # ============================================================================
@@ -46,7 +56,7 @@ GEMINI_TOOLS = [
     },
     {
         "name": "list_tasks",
-        "description": "Get a list of the user's tasks. Can filter by status (all, pending, completed) or priority.",
+        "description": "Get a page of the user's tasks. Can filter by status (all, pending, completed), priority, category, text search or due date window.",
         "parameters": {
             "type": "object",
             "properties": {
@@ -59,6 +69,30 @@ GEMINI_TOOLS = [
                     "type": "string",
                     "enum": ["high", "medium", "low"],
                     "description": "Filter by priority level"
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by exact category name"
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Only tasks whose title or description contains this text"
+                },
+                "due_after": {
+                    "type": "string",
+                    "description": "Only tasks due on or after this ISO 8601 date"
+                },
+                "due_before": {
+                    "type": "string",
+                    "description": "Only tasks due on or before this ISO 8601 date"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of tasks to return (default 20, max 100)"
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of tasks to skip, for paging through long lists"
                 }
             },
             "required": []
@@ -126,14 +160,417 @@ GEMINI_TOOLS = [
             },
             "required": ["task_id"]
         }
+    },
+    {
+        "name": "add_tasks",
+        "description": "Create several tasks at once. Use this instead of repeated add_task calls when the user lists multiple items (e.g. 'Add milk, eggs and bread').",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "description": "Tasks to create",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string", "description": "Task title"},
+                            "priority": {"type": "string", "enum": ["high", "medium", "low"], "description": "Task priority (default 'medium')"},
+                            "category": {"type": "string", "description": "Optional category"},
+                            "due_date": {"type": "string", "description": "Optional due date in ISO 8601 format"}
+                        },
+                        "required": ["title"]
+                    }
+                }
+            },
+            "required": ["tasks"]
+        }
+    },
+    {
+        "name": "complete_tasks",
+        "description": "Mark several tasks as complete or incomplete at once (e.g. 'Complete tasks 3, 4 and 9').",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "IDs of the tasks to update"
+                },
+                "completed": {
+                    "type": "boolean",
+                    "description": "True to mark complete, False to mark incomplete. Default is True."
+                }
+            },
+            "required": ["task_ids"]
+        }
+    },
+    {
+        "name": "delete_tasks",
+        "description": "Delete several tasks permanently at once (e.g. 'Delete tasks 2 and 5').",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "IDs of the tasks to delete"
+                }
+            },
+            "required": ["task_ids"]
+        }
+    },
+    {
+        "name": "bulk_update_by_filter",
+        "description": "Complete, update or delete ALL tasks matching a filter in one step (e.g. 'complete all shopping tasks', 'delete all completed tasks'). Use dry_run to only count matches.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["complete", "uncomplete", "update", "delete"],
+                    "description": "What to do with the matching tasks"
+                },
+                "status": {
+                    "type": "string",
+                    "enum": ["all", "pending", "completed"],
+                    "description": "Filter by task status (default 'all')"
+                },
+                "priority": {
+                    "type": "string",
+                    "enum": ["high", "medium", "low"],
+                    "description": "Filter by priority level"
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by exact category name"
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Filter by text in title or description"
+                },
+                "tag_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Filter by tag IDs (tasks having any of them)"
+                },
+                "new_priority": {
+                    "type": "string",
+                    "enum": ["high", "medium", "low"],
+                    "description": "For action 'update': priority to set"
+                },
+                "new_category": {
+                    "type": "string",
+                    "description": "For action 'update': category to set"
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "True to only count the matching tasks without changing them"
+                }
+            },
+            "required": ["action"]
+        }
     }
 ]
 
 
+# ============================================================================
+# LIST QUERY HELPERS
+# ============================================================================
+# Shared by list_tasks and list_tasks_async. The observation of list_tasks
+# is fed back into the LLM prompt, so it is paginated, projected to a few
+# short fields and trimmed to a token budget.
+
+MAX_LIST_LIMIT = 100
+PRIORITY_VALUES = ("high", "medium", "low")
+
+
+def _parse_iso_date(value: str, field: str) -> datetime:
+    """Parse an ISO 8601 date/datetime coming from the LLM."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid {field} format: {value}. Use YYYY-MM-DD or ISO 8601.")
+
+
+def _build_list_query(
+    user: User,
+    status: str,
+    priority: Optional[str],
+    category: Optional[str],
+    search: Optional[str],
+    due_after: Optional[str],
+    due_before: Optional[str],
+    limit: Optional[int],
+    offset: int
+):
+    """
+    Build the projected, paginated list query.
+
+    Selects only the columns the LLM needs plus COUNT(*) OVER () so the
+    total match count comes back in the same round trip. COUNT(*) OVER ()
+    is only seen on returned rows, so an empty page past the end needs
+    count_query for the total.
+
+    Returns:
+        (query, count_query, effective_offset)
+
+    Raises:
+        ValueError: On invalid priority or due date values
+    """
+    limit = min(max(limit or get_settings().chat_list_default_limit, 1), MAX_LIST_LIMIT)
+    offset = max(offset or 0, 0)
+
+    if priority and priority not in PRIORITY_VALUES:
+        raise ValueError(f"Invalid priority: {priority}. Use high, medium or low.")
+
+    # CRITICAL: task_filter_clauses always filters by user_id
+    clauses = task_filter_clauses(
+        user.id,
+        completed={"pending": False, "completed": True}.get(status),
+        priority=priority or None,
+        category=category or None,
+        search=search
+    )
+
+    if due_after:
+        clauses.append(Task.due_date >= _parse_iso_date(due_after, "due_after"))
+
+    if due_before:
+        clauses.append(Task.due_date <= _parse_iso_date(due_before, "due_before"))
+
+    query = select(
+        Task.id,
+        Task.title,
+        Task.completed,
+        Task.priority,
+        Task.category,
+        Task.due_date,
+        func.count().over().label("total")
+    ).where(*clauses)
+
+    query = query.order_by(Task.created_at.desc(), Task.id.desc()).offset(offset).limit(limit)
+    return query, count_by_filter_stmt(clauses), offset
+
+
+def _estimate_tokens(payload: Any) -> int:
+    """Cheap token estimate (~4 characters per token for English/JSON)."""
+    return len(json.dumps(payload, default=str)) // 4 + 1
+
+
+def _format_task_page(rows: List[Any], offset: int, total: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Turn list query rows into the compact tool observation.
+
+    Each task only carries id, title, completed and priority, plus category
+    and due date when set. Tasks are added until the token budget is spent;
+    whatever does not fit is reported as a "more" count with the offset to
+    continue from.
+
+    total: match count for an empty page (rows carry it otherwise).
+    """
+    if rows:
+        total = rows[0].total
+    total = total or 0
+    budget = get_settings().chat_tool_token_budget
+
+    task_list = []
+    used_tokens = 0
+    for row in rows:
+        item = {
+            "id": row.id,
+            "title": row.title,
+            "completed": row.completed,
+            "priority": getattr(row.priority, "value", row.priority),
+        }
+        if row.category:
+            item["category"] = row.category
+        if row.due_date:
+            item["due_date"] = row.due_date.date().isoformat()
+
+        item_tokens = _estimate_tokens(item)
+        if task_list and used_tokens + item_tokens > budget:
+            break
+        task_list.append(item)
+        used_tokens += item_tokens
+
+    more = max(total - offset - len(task_list), 0)
+    result = {
+        "success": True,
+        "count": len(task_list),
+        "total": total,
+        "tasks": task_list,
+        "message": f"Found {total} task(s), showing {len(task_list)}"
+    }
+    if more:
+        result["more"] = more
+        result["next_offset"] = offset + len(task_list)
+        result["message"] += f" ({more} more, use offset={offset + len(task_list)})"
+    elif not task_list and total:
+        # The user has matching tasks; this page is just past the end
+        result["message"] = f"Found {total} task(s); offset={offset} is past the end, use offset=0"
+    return result
+
+
+# ============================================================================
+# BATCH STATEMENT HELPERS
+# ============================================================================
+# Shared by the batch tools (add_tasks, complete_tasks, delete_tasks) and
+# their async versions. Each batch is a single multi-row statement with
+# RETURNING, so a multi-item command costs one tool call and one round trip.
+
+MAX_BATCH_SIZE = 50
+
+
+def _check_batch(items: List[Any], what: str) -> None:
+    """Validate batch size. Raises ValueError."""
+    if not items:
+        raise ValueError(f"No {what} given")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"Too many {what}: {len(items)} (max {MAX_BATCH_SIZE})")
+
+
+def _add_tasks_stmt(user: User, tasks: List[Dict[str, Any]]):
+    """Build one INSERT ... VALUES (...), (...) RETURNING for all tasks."""
+    _check_batch(tasks, "tasks")
+    now = datetime.utcnow()
+    rows = []
+    for item in tasks:
+        if hasattr(item, "model_dump"):  # Pydantic input from LangChain
+            item = item.model_dump()
+        title = (item.get("title") or "").strip()
+        if not title:
+            raise ValueError("Every task needs a title")
+        priority = item.get("priority") or "medium"
+        if priority not in PRIORITY_VALUES:
+            raise ValueError(f"Invalid priority: {priority}. Use high, medium or low.")
+        due_date = item.get("due_date")
+        rows.append({
+            "user_id": user.id,
+            "title": title,
+            "priority": PriorityEnum(priority),
+            "category": item.get("category"),
+            "due_date": _parse_iso_date(due_date, "due_date") if due_date else None,
+            "completed": False,
+            "created_at": now,
+            "updated_at": now,
+        })
+    return insert(Task).values(rows).returning(Task.id, Task.title)
+
+
+def _complete_tasks_stmt(user: User, task_ids: List[int], completed: bool):
+    """Build one UPDATE ... WHERE id IN (...) RETURNING for owned tasks."""
+    _check_batch(task_ids, "task ids")
+    clauses = [Task.id.in_(task_ids), Task.user_id == user.id]
+    return update_by_filter_stmt(
+        clauses, {"completed": completed, "updated_at": datetime.utcnow()}
+    ).returning(Task.id, Task.title)
+
+
+def _delete_tasks_stmt(user: User, task_ids: List[int]):
+    """Build one DELETE ... RETURNING for owned tasks (task_tags via CTE)."""
+    _check_batch(task_ids, "task ids")
+    clauses = [Task.id.in_(task_ids), Task.user_id == user.id]
+    return delete_by_filter_stmt(clauses).returning(Task.id, Task.title)
+
+
+BULK_ACTIONS = ("complete", "uncomplete", "update", "delete")
+
+
+def _bulk_by_filter_stmts(
+    user: User,
+    action: str,
+    status: str,
+    priority: Optional[str],
+    category: Optional[str],
+    search: Optional[str],
+    tag_ids: Optional[List[int]],
+    new_priority: Optional[str],
+    new_category: Optional[str]
+):
+    """
+    Build (count_stmt, mutation_stmt) for bulk_update_by_filter.
+
+    Same filter vocabulary as GET /tasks; see app/services/task_queries.py.
+
+    Raises:
+        ValueError: On invalid action/priority or an unfiltered delete
+    """
+    if action not in BULK_ACTIONS:
+        raise ValueError(f"Invalid action: {action}. Use one of: {', '.join(BULK_ACTIONS)}.")
+    for value in (priority, new_priority):
+        if value and value not in PRIORITY_VALUES:
+            raise ValueError(f"Invalid priority: {value}. Use high, medium or low.")
+
+    completed = {"pending": False, "completed": True}.get(status)
+    has_filter = any(v not in (None, [], "") for v in (completed, priority, category, search, tag_ids))
+    if action == "delete" and not has_filter:
+        raise ValueError("Refusing to delete all tasks: give at least one filter")
+
+    clauses = task_filter_clauses(
+        user.id,
+        completed=completed,
+        priority=priority,
+        category=category,
+        search=search,
+        tag_ids=tag_ids
+    )
+
+    if action == "delete":
+        return count_by_filter_stmt(clauses), delete_by_filter_stmt(clauses)
+
+    values: Dict[str, Any] = {"updated_at": datetime.utcnow()}
+    if action == "complete":
+        values["completed"] = True
+    elif action == "uncomplete":
+        values["completed"] = False
+    if new_priority:
+        values["priority"] = PriorityEnum(new_priority)
+    if new_category is not None:
+        values["category"] = new_category
+    if len(values) == 1:
+        raise ValueError("Nothing to update: give new_priority or new_category")
+    return count_by_filter_stmt(clauses), update_by_filter_stmt(clauses, values)
+
+
+def _bulk_by_filter_result(action: str, count: int, dry_run: bool) -> Dict[str, Any]:
+    """Format the bulk_update_by_filter observation."""
+    verb = {
+        "complete": "marked as complete",
+        "uncomplete": "marked as incomplete",
+        "update": "updated",
+        "delete": "deleted",
+    }[action]
+    return {
+        "success": True,
+        "action": action,
+        "dry_run": dry_run,
+        "count": count,
+        "message": f"{count} task(s) would be {verb}" if dry_run else f"{count} task(s) {verb}"
+    }
+
+
+def _batch_result(rows: List[Any], task_ids: List[int], action: str) -> Dict[str, Any]:
+    """Format a batch complete/delete result, reporting ids that were not found."""
+    done = [{"task_id": row.id, "title": row.title} for row in rows]
+    found = {row.id for row in rows}
+    not_found = [task_id for task_id in task_ids if task_id not in found]
+    result = {
+        "success": bool(done),
+        "count": len(done),
+        "tasks": done,
+        "message": f"{len(done)} task(s) {action}"
+    }
+    if not_found:
+        result["not_found"] = not_found
+        result["message"] += f"; not found: {', '.join(str(i) for i in not_found)}"
+    return result
+
+
 # ============================================================================
 # TOOL EXECUTION FUNCTIONS
 # ============================================================================
 
+@traced("tool.add_task")
 def add_task(
     session: Session,
     user: User,
@@ -171,6 +608,7 @@ def add_task(
         )
 
         session.add(task)
+        invalidate_task_lists(session, user.id)
         session.commit()
         session.refresh(task)
 
@@ -191,53 +629,35 @@ def add_task(
         }
 
 
+@traced("tool.list_tasks")
 def list_tasks(
     session: Session,
     user: User,
     status: str = "all",
-    priority: Optional[str] = None
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    due_after: Optional[str] = None,
+    due_before: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
 ) -> Dict[str, Any]:
     """
-    Execute list_tasks tool - Get user's tasks with optional filters.
+    Execute list_tasks tool - Get a page of the user's tasks with filters.
+
+    Returns a compact projection capped to the chat tool token budget
+    (see _format_task_page), so the observation sent back to the LLM stays
+    bounded no matter how many tasks the user owns.
 
     Multi-user isolation: WHERE user_id = user.id
     """
     try:
-        # Base query - CRITICAL: Filter by user_id
-        query = select(Task).where(Task.user_id == user.id)
-
-        # Apply status filter
-        if status == "pending":
-            query = query.where(Task.completed == False)
-        elif status == "completed":
-            query = query.where(Task.completed == True)
-
-        # Apply priority filter
-        if priority:
-            query = query.where(Task.priority == priority)
-
-        # Execute query
-        tasks = session.exec(query.order_by(Task.created_at.desc())).all()
-
-        # Format tasks for AI response
-        task_list = []
-        for task in tasks:
-            task_list.append({
-                "id": task.id,
-                "title": task.title,
-                "completed": task.completed,
-                "priority": task.priority,
-                "category": task.category,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "created_at": task.created_at.isoformat()
-            })
-
-        return {
-            "success": True,
-            "count": len(task_list),
-            "tasks": task_list,
-            "message": f"Found {len(task_list)} task(s)"
-        }
+        query, count_query, offset = _build_list_query(
+            user, status, priority, category, search, due_after, due_before, limit, offset
+        )
+        rows = session.exec(query).all()
+        total = session.exec(count_query).one() if not rows and offset else None
+        return _format_task_page(rows, offset, total)
     except Exception as e:
         return {
             "success": False,
@@ -245,6 +665,7 @@ def list_tasks(
         }
 
 
+@traced("tool.complete_task")
 def complete_task(
     session: Session,
     user: User,
@@ -277,6 +698,7 @@ def complete_task(
         task.updated_at = datetime.utcnow()
 
         session.add(task)
+        invalidate_task_lists(session, user.id)
         session.commit()
         session.refresh(task)
 
@@ -296,6 +718,7 @@ def complete_task(
         }
 
 
+@traced("tool.delete_task")
 def delete_task(
     session: Session,
     user: User,
@@ -327,6 +750,7 @@ def delete_task(
 
         # Delete task
         session.delete(task)
+        invalidate_task_lists(session, user.id)
         session.commit()
 
         return {
@@ -342,6 +766,7 @@ def delete_task(
         }
 
 
+@traced("tool.update_task")
 def update_task(
     session: Session,
     user: User,
@@ -394,6 +819,7 @@ def update_task(
         task.updated_at = datetime.utcnow()
 
         session.add(task)
+        invalidate_task_lists(session, user.id)
         session.commit()
         session.refresh(task)
 
@@ -414,6 +840,557 @@ def update_task(
         }
 
 
+@traced("tool.add_tasks")
+def add_tasks(
+    session: Session,
+    user: User,
+    tasks: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Execute add_tasks tool - Create several tasks in one INSERT.
+
+    Multi-user isolation: every row gets user_id = user.id
+    """
+    try:
+        stmt = _add_tasks_stmt(user, tasks)
+        rows = session.execute(stmt).all()
+        invalidate_task_lists(session, user.id)
+        session.commit()
+
+        created = [{"task_id": row.id, "title": row.title} for row in rows]
+        return {
+            "success": True,
+            "count": len(created),
+            "tasks": created,
+            "message": f"{len(created)} task(s) created: " + ", ".join(f"'{t['title']}' (ID: {t['task_id']})" for t in created)
+        }
+    except Exception as e:
+        session.rollback()
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.complete_tasks")
+def complete_tasks(
+    session: Session,
+    user: User,
+    task_ids: List[int],
+    completed: bool = True
+) -> Dict[str, Any]:
+    """
+    Execute complete_tasks tool - Mark several tasks complete/incomplete.
+
+    Security: UPDATE is restricted to the user's tasks
+    """
+    try:
+        stmt = _complete_tasks_stmt(user, task_ids, completed)
+        rows = session.execute(stmt).all()
+        invalidate_task_lists(session, user.id)
+        session.commit()
+        return _batch_result(rows, task_ids, "marked as complete" if completed else "marked as incomplete")
+    except Exception as e:
+        session.rollback()
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.delete_tasks")
+def delete_tasks(
+    session: Session,
+    user: User,
+    task_ids: List[int]
+) -> Dict[str, Any]:
+    """
+    Execute delete_tasks tool - Delete several tasks permanently.
+
+    Security: DELETE is restricted to the user's tasks
+    """
+    try:
+        stmt = _delete_tasks_stmt(user, task_ids)
+        rows = session.execute(stmt).all()
+        invalidate_task_lists(session, user.id)
+        session.commit()
+        return _batch_result(rows, task_ids, "deleted")
+    except Exception as e:
+        session.rollback()
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.bulk_update_by_filter")
+def bulk_update_by_filter(
+    session: Session,
+    user: User,
+    action: str,
+    status: str = "all",
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    tag_ids: Optional[List[int]] = None,
+    new_priority: Optional[str] = None,
+    new_category: Optional[str] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Execute bulk_update_by_filter tool - Mutate all tasks matching a filter.
+
+    Runs as one UPDATE/DELETE ... WHERE (or a COUNT for dry runs).
+    Security: the filter always includes user_id = user.id
+    """
+    try:
+        count_stmt, mutation_stmt = _bulk_by_filter_stmts(
+            user, action, status, priority, category, search, tag_ids, new_priority, new_category
+        )
+        if dry_run:
+            count = session.exec(count_stmt).one()
+        else:
+            count = session.execute(mutation_stmt).rowcount
+            invalidate_task_lists(session, user.id)
+            session.commit()
+        return _bulk_by_filter_result(action, count, dry_run)
+    except Exception as e:
+        session.rollback()
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# ============================================================================
+# ASYNC TOOL EXECUTION FUNCTIONS
+# ============================================================================
+# Native coroutine versions of the tools above, used by the LangChain agent
+# under AgentExecutor.ainvoke so tool calls run on the event loop instead of
+# being offloaded to a thread executor. Same contract and return shape as the
+# sync versions; ownership is enforced in the WHERE clause.
+# Write tools take commit=False for unit-of-work mode (see _write_scope).
+
+async def _get_owned_task(
+    session: AsyncSession,
+    user: User,
+    task_id: int
+) -> Optional[Task]:
+    """Load a task only if it belongs to the user (single query)."""
+    result = await session.exec(
+        select(Task).where(Task.id == task_id, Task.user_id == user.id)
+    )
+    return result.first()
+
+
+@asynccontextmanager
+async def _write_scope(session: AsyncSession, user: User, commit: bool):
+    """
+    Transaction boundary for a single tool write.
+
+    The user's cached task lists are dropped when the transaction commits
+    (here, or at the end of the chat turn in unit-of-work mode).
+
+    commit=True:  standalone mode - commit on success, rollback on error.
+    commit=False: unit-of-work mode - the caller owns the transaction and
+                  commits once per chat turn. The write runs inside a
+                  SAVEPOINT and is only flushed, so a failing tool rolls back
+                  its own changes without poisoning the rest of the turn.
+
+    Change ORM objects only inside the block: begin_nested() flushes pending
+    changes before the SAVEPOINT, so anything modified earlier is written
+    outside it (and a bad value aborts the whole turn).
+    """
+    invalidate_task_lists(session, user.id)
+    if commit:
+        try:
+            yield
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+    else:
+        async with session.begin_nested():
+            yield
+            await session.flush()
+
+
+@traced("tool.add_task")
+async def add_task_async(
+    session: AsyncSession,
+    user: User,
+    title: str,
+    priority: str = "medium",
+    category: Optional[str] = None,
+    due_date: Optional[str] = None,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async add_task - Create a new task for the user.
+
+    Multi-user isolation: task.user_id = user.id
+    """
+    try:
+        # Validate everything before touching the session (see _write_scope)
+        if priority not in PRIORITY_VALUES:
+            return {
+                "success": False,
+                "error": f"Invalid priority: {priority}. Use high, medium or low."
+            }
+
+        parsed_due_date = None
+        if due_date:
+            try:
+                parsed_due_date = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": f"Invalid due date format: {due_date}. Use YYYY-MM-DD or ISO 8601."
+                }
+
+        task = Task(
+            user_id=user.id,
+            title=title.strip(),
+            priority=priority,
+            category=category,
+            due_date=parsed_due_date,
+            completed=False
+        )
+
+        async with _write_scope(session, user, commit):
+            session.add(task)
+            await session.flush()  # Assigns task.id without a refresh query
+
+            result = {
+                "success": True,
+                "task_id": task.id,
+                "title": task.title,
+                "priority": task.priority,
+                "category": task.category,
+                "due_date": task.due_date.isoformat() if task.due_date else None,
+                "message": f"Task created: '{task.title}' (ID: {task.id})"
+            }
+
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.list_tasks")
+async def list_tasks_async(
+    session: AsyncSession,
+    user: User,
+    status: str = "all",
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    due_after: Optional[str] = None,
+    due_before: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    Async list_tasks - Get a page of the user's tasks with filters.
+
+    Multi-user isolation: WHERE user_id = user.id
+    """
+    try:
+        query, count_query, offset = _build_list_query(
+            user, status, priority, category, search, due_after, due_before, limit, offset
+        )
+        rows = (await session.exec(query)).all()
+        total = (await session.exec(count_query)).one() if not rows and offset else None
+        return _format_task_page(rows, offset, total)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.complete_task")
+async def complete_task_async(
+    session: AsyncSession,
+    user: User,
+    task_id: int,
+    completed: bool = True,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async complete_task - Mark a task as complete/incomplete.
+
+    Security: Task is looked up by id AND user_id
+    """
+    try:
+        task = await _get_owned_task(session, user, task_id)
+
+        if not task:
+            return {
+                "success": False,
+                "error": f"Task {task_id} not found"
+            }
+
+        async with _write_scope(session, user, commit):
+            task.completed = completed
+            task.updated_at = datetime.utcnow()
+            session.add(task)
+
+            # Build the result before commit so no expired attribute is reloaded
+            status_text = "complete" if completed else "incomplete"
+            result = {
+                "success": True,
+                "task_id": task.id,
+                "title": task.title,
+                "completed": task.completed,
+                "message": f"Task marked as {status_text}: '{task.title}'"
+            }
+
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.delete_task")
+async def delete_task_async(
+    session: AsyncSession,
+    user: User,
+    task_id: int,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async delete_task - Delete a task permanently.
+
+    Security: Task is looked up by id AND user_id
+    """
+    try:
+        task = await _get_owned_task(session, user, task_id)
+
+        if not task:
+            return {
+                "success": False,
+                "error": f"Task {task_id} not found"
+            }
+
+        task_title = task.title
+
+        async with _write_scope(session, user, commit):
+            await session.delete(task)
+
+        return {
+            "success": True,
+            "task_id": task_id,
+            "message": f"Task deleted: '{task_title}'"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.update_task")
+async def update_task_async(
+    session: AsyncSession,
+    user: User,
+    task_id: int,
+    title: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    due_date: Optional[str] = None,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async update_task - Update task details.
+
+    Security: Task is looked up by id AND user_id
+    """
+    try:
+        task = await _get_owned_task(session, user, task_id)
+
+        if not task:
+            return {
+                "success": False,
+                "error": f"Task {task_id} not found"
+            }
+
+        # Validate everything before changing the task: in unit-of-work mode
+        # a half-applied update would be flushed by the next tool
+        if title is not None and not title.strip():
+            return {
+                "success": False,
+                "error": "Title cannot be empty"
+            }
+
+        if priority is not None and priority not in PRIORITY_VALUES:
+            return {
+                "success": False,
+                "error": f"Invalid priority: {priority}. Use high, medium or low."
+            }
+
+        parsed_due_date = None
+        if due_date is not None:
+            try:
+                parsed_due_date = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": f"Invalid due date format: {due_date}"
+                }
+
+        async with _write_scope(session, user, commit):
+            if title is not None:
+                task.title = title.strip()
+            if priority is not None:
+                task.priority = priority
+            if category is not None:
+                task.category = category
+            if parsed_due_date is not None:
+                task.due_date = parsed_due_date
+            task.updated_at = datetime.utcnow()
+            session.add(task)
+
+            # Build the result before commit so no expired attribute is reloaded
+            result = {
+                "success": True,
+                "task_id": task.id,
+                "title": task.title,
+                "priority": task.priority,
+                "category": task.category,
+                "due_date": task.due_date.isoformat() if task.due_date else None,
+                "message": f"Task updated: '{task.title}'"
+            }
+
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.add_tasks")
+async def add_tasks_async(
+    session: AsyncSession,
+    user: User,
+    tasks: List[Dict[str, Any]],
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async add_tasks - Create several tasks in one INSERT.
+
+    Multi-user isolation: every row gets user_id = user.id
+    """
+    try:
+        stmt = _add_tasks_stmt(user, tasks)
+        async with _write_scope(session, user, commit):
+            rows = (await session.execute(stmt)).all()
+
+        created = [{"task_id": row.id, "title": row.title} for row in rows]
+        return {
+            "success": True,
+            "count": len(created),
+            "tasks": created,
+            "message": f"{len(created)} task(s) created: " + ", ".join(f"'{t['title']}' (ID: {t['task_id']})" for t in created)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.complete_tasks")
+async def complete_tasks_async(
+    session: AsyncSession,
+    user: User,
+    task_ids: List[int],
+    completed: bool = True,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async complete_tasks - Mark several tasks complete/incomplete.
+
+    Security: UPDATE is restricted to the user's tasks
+    """
+    try:
+        stmt = _complete_tasks_stmt(user, task_ids, completed)
+        async with _write_scope(session, user, commit):
+            rows = (await session.execute(stmt)).all()
+        return _batch_result(rows, task_ids, "marked as complete" if completed else "marked as incomplete")
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.delete_tasks")
+async def delete_tasks_async(
+    session: AsyncSession,
+    user: User,
+    task_ids: List[int],
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async delete_tasks - Delete several tasks permanently.
+
+    Security: DELETE is restricted to the user's tasks
+    """
+    try:
+        stmt = _delete_tasks_stmt(user, task_ids)
+        async with _write_scope(session, user, commit):
+            rows = (await session.execute(stmt)).all()
+        return _batch_result(rows, task_ids, "deleted")
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@traced("tool.bulk_update_by_filter")
+async def bulk_update_by_filter_async(
+    session: AsyncSession,
+    user: User,
+    action: str,
+    status: str = "all",
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    tag_ids: Optional[List[int]] = None,
+    new_priority: Optional[str] = None,
+    new_category: Optional[str] = None,
+    dry_run: bool = False,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async bulk_update_by_filter - Mutate all tasks matching a filter.
+
+    Security: the filter always includes user_id = user.id
+    """
+    try:
+        count_stmt, mutation_stmt = _bulk_by_filter_stmts(
+            user, action, status, priority, category, search, tag_ids, new_priority, new_category
+        )
+        if dry_run:
+            count = (await session.exec(count_stmt)).one()
+        else:
+            async with _write_scope(session, user, commit):
+                count = (await session.execute(mutation_stmt)).rowcount
+        return _bulk_by_filter_result(action, count, dry_run)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 # ============================================================================
 # TOOL DISPATCHER
 # ============================================================================
@@ -434,7 +1411,11 @@ def execute_tool(
         "list_tasks": list_tasks,
         "complete_task": complete_task,
         "delete_task": delete_task,
-        "update_task": update_task
+        "update_task": update_task,
+        "add_tasks": add_tasks,
+        "complete_tasks": complete_tasks,
+        "delete_tasks": delete_tasks,
+        "bulk_update_by_filter": bulk_update_by_filter
     }
 
     if tool_name not in tool_functions:
@@ -446,3 +1427,47 @@ def execute_tool(
     # Execute tool function
     tool_fn = tool_functions[tool_name]
     return tool_fn(session, user, **tool_args)
+
+
+async def execute_tool_async(
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    session: AsyncSession,
+    user: User,
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Async version of execute_tool, used by the async Gemini agent.
+
+    commit=False runs write tools in unit-of-work mode (flush only).
+    """
+    tool_functions = {
+        "add_task": add_task_async,
+        "list_tasks": list_tasks_async,
+        "complete_task": complete_task_async,
+        "delete_task": delete_task_async,
+        "update_task": update_task_async,
+        "add_tasks": add_tasks_async,
+        "complete_tasks": complete_tasks_async,
+        "delete_tasks": delete_tasks_async,
+        "bulk_update_by_filter": bulk_update_by_filter_async
+    }
+
+    if tool_name not in tool_functions:
+        return {
+            "success": False,
+            "error": f"Unknown tool: {tool_name}"
+        }
+
+    tool_fn = tool_functions[tool_name]
+    if tool_name != "list_tasks":  # Read-only tool has no commit flag
+        tool_args = {**tool_args, "commit": commit}
+
+    try:
+        return await tool_fn(session, user, **tool_args)
+    except TypeError as e:
+        # Model sent arguments the tool does not accept
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -1,6 +1,6 @@
 from .user import User
-from .task import Task, PriorityEnum
+from .task import Task, TaskTombstone, TaskSyncOp, PriorityEnum
 from .tag import Tag, TaskTag
 from .conversation import Conversation, Message
 
-__all__ = ["User", "Task", "PriorityEnum", "Tag", "TaskTag", "Conversation", "Message"]
+__all__ = ["User", "Task", "TaskTombstone", "TaskSyncOp", "PriorityEnum", "Tag", "TaskTag", "Conversation", "Message"]
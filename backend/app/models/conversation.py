@@ -3,7 +3,7 @@
 # Stores chat history for stateless conversation management
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import TIMESTAMP, Text
+from sqlalchemy import TIMESTAMP, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from typing import Optional
@@ -17,6 +17,10 @@ class Conversation(SQLModel, table=True):
     Conversations persist across sessions (stateless server design).
     """
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Keyset pagination: WHERE user_id = ? ORDER BY updated_at DESC, id DESC
+        Index("ix_conversations_user_updated", "user_id", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", nullable=False, index=True, max_length=255)
@@ -40,6 +44,10 @@ class Message(SQLModel, table=True):
     Tool calls stored as JSONB for debugging MCP tool usage.
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # Keyset pagination: WHERE conversation_id = ? ORDER BY id DESC
+        Index("ix_messages_conversation_id_id", "conversation_id", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     conversation_id: int = Field(
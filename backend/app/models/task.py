@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
+from sqlalchemy import BigInteger, Column, FetchedValue, Index
 from sqlmodel import Field, SQLModel, Relationship
 
 if TYPE_CHECKING:
@@ -16,6 +17,20 @@ class PriorityEnum(str, Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # List view (GET /tasks?fields=...): index-only scans
+        Index(
+            "ix_tasks_user_created_list", "user_id", "created_at",
+            postgresql_include=["id", "title", "completed", "priority", "due_date"],
+        ),
+        # GET /tasks/changes: WHERE user_id = ? AND change_seq > ? ORDER BY change_seq
+        Index("ix_tasks_user_change_seq", "user_id", "change_seq"),
+        # GET /tasks/stats: one aggregate over the user's tasks, index-only
+        Index(
+            "ix_tasks_user_stats", "user_id",
+            postgresql_include=["completed", "priority", "category", "due_date", "estimated_minutes"],
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", index=True)
@@ -28,7 +43,41 @@ class Task(SQLModel, table=True):
     estimated_minutes: Optional[int] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Set by a database trigger on every insert/update (migration 005)
+    change_seq: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=False),
+    )
     
     # Relationships
     user: "User" = Relationship(back_populates="tasks")
     task_tags: list["TaskTag"] = Relationship(back_populates="task", sa_relationship_kwargs={"cascade": "all, delete"})
+
+
+class TaskTombstone(SQLModel, table=True):
+    """A deleted task, written by a database trigger (migration 005) for GET /tasks/changes."""
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_user_change_seq", "user_id", "change_seq"),
+    )
+
+    change_seq: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    task_id: int
+    user_id: str
+    deleted_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class TaskSyncOp(SQLModel, table=True):
+    """An applied POST /tasks/sync operation, by idempotency key (replays are skipped)."""
+    __tablename__ = "task_sync_ops"
+    __table_args__ = (
+        # Resolves client ids of earlier batches to server task ids
+        Index("ix_task_sync_ops_user_client_id", "user_id", "client_id"),
+    )
+
+    user_id: str = Field(primary_key=True)
+    idempotency_key: str = Field(primary_key=True, max_length=100)
+    op: str = Field(max_length=20)
+    client_id: Optional[str] = Field(default=None, max_length=100)
+    task_id: Optional[int] = Field(default=None)  # None: created and deleted in the same batch
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -15,6 +15,8 @@ class User(SQLModel, table=True):
     name: Optional[str] = Field(default=None, max_length=255)
     password_hash: str = Field(max_length=255)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Bumped by database triggers on every task/tag change (ETag of list endpoints)
+    data_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     
     # Relationships
     tasks: list["Task"] = Relationship(back_populates="user", sa_relationship_kwargs={"cascade": "all, delete"})
@@ -2,17 +2,22 @@
 # Phase III: AI Chatbot - Stateless Chat Endpoint with LangChain + Ollama
 # Spec: specs/001-competition-todo-app/phase3.md
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
+from sqlalchemy import update, tuple_, true, func, outerjoin
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+import base64
 
-from app.database import get_session
+from app.config import get_settings
+from app.database import get_session, AsyncSessionLocal
 from app.models.user import User
 from app.models.conversation import Conversation, Message
-from app.utils.dependencies import get_current_user
-from app.services.agent_service import create_agent, run_agent
+from app.utils.dependencies import get_current_user, get_current_user_detached
+from app.services.ollama_warmup import ollama_state
+from app.utils.tracing import traced
 
 
 # ============================================================================
@@ -42,27 +47,122 @@ import httpx
 @router.get("/ollama-health")
 async def ollama_health():
     """Diagnostic endpoint to check Ollama connectivity."""
+    url = f"{get_settings().ollama_base_url}/api/tags"
     try:
         async with httpx.AsyncClient() as client:
-            response = await client.get("http://127.0.0.1:11434/api/tags", timeout=2.0)
+            response = await client.get(url, timeout=2.0)
             return {
                 "status": "connected",
                 "ollama_response": response.json(),
-                "url": "http://127.0.0.1:11434/api/tags"
+                "url": url,
+                "warmup": ollama_state.as_dict()
             }
     except Exception as e:
         return {
             "status": "error",
             "message": str(e),
-            "url": "http://127.0.0.1:11434/api/tags"
+            "url": url,
+            "warmup": ollama_state.as_dict()
         }
 
 
+@traced("chat.load_history")
+async def _load_turn_context(
+    db: AsyncSession,
+    conversation_id: Optional[int],
+    user: User
+) -> List[Dict[str, str]]:
+    """
+    Verify conversation ownership and load its history (read-only).
+
+    Raises:
+        HTTPException: 404 if the conversation is missing or not the user's
+    """
+    if not conversation_id:
+        return []
+
+    conversation = await db.get(Conversation, conversation_id)
+
+    # Verify ownership (multi-user isolation)
+    if not conversation or conversation.user_id != user.id:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    # Get all messages in this conversation (ordered by time)
+    history_messages = (await db.exec(
+        select(Message)
+        .where(Message.conversation_id == conversation_id)
+        .order_by(Message.created_at.asc())
+    )).all()
+
+    # Format for LangChain agent
+    return [
+        {"role": msg.role, "content": msg.content}
+        for msg in history_messages
+    ]
+
+
+@traced("chat.persist_turn")
+async def _persist_turn(
+    db: AsyncSession,
+    conversation_id: Optional[int],
+    user: User,
+    user_text: str,
+    ai_response_text: str,
+    tool_calls: List[Dict[str, Any]]
+) -> int:
+    """
+    Save the conversation (created on the first turn) and both messages,
+    then commit. Returns the conversation id.
+    """
+    now = datetime.utcnow()
+
+    if conversation_id:
+        # Update conversation timestamp
+        await db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(updated_at=now)
+        )
+    else:
+        # Create new conversation (flush assigns the id)
+        conversation = Conversation(
+            user_id=user.id,
+            title=user_text[:50],  # Use first 50 chars as title
+            created_at=now,
+            updated_at=now
+        )
+        db.add(conversation)
+        await db.flush()
+        conversation_id = conversation.id
+
+    # Save user message
+    db.add(Message(
+        conversation_id=conversation_id,
+        user_id=user.id,
+        role="user",
+        content=user_text,
+        tool_calls=None,
+        created_at=now
+    ))
+
+    # Save AI response
+    db.add(Message(
+        conversation_id=conversation_id,
+        user_id=user.id,
+        role="assistant",
+        content=ai_response_text,
+        tool_calls={"tools": tool_calls} if tool_calls else None,
+        created_at=datetime.utcnow()
+    ))
+
+    await db.commit()
+    return conversation_id
+
+
 @router.post("", response_model=ChatResponse, status_code=200)
 async def send_chat_message(
     request: ChatRequest,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_detached),
 ):
     """
     Stateless chat endpoint - Send message to AI assistant using LangChain + Ollama.
@@ -80,165 +180,221 @@ async def send_chat_message(
     4. Save user message + AI response to database
     5. Return AI response + conversation_id + tool_calls
 
+    **Database sessions**:
+    By default no connection is held while the LLM is thinking: history is
+    loaded in one short session, each tool call uses its own session, and
+    the conversation and messages are saved in a final short transaction.
+    With CHAT_SINGLE_TRANSACTION=true the whole turn (including tool writes)
+    runs as one unit of work on one session and is committed once, at the
+    cost of holding a pooled connection for the full agent run.
+
     **Multi-user isolation**: Users can only access their own conversations
 
     Spec: specs/001-competition-todo-app/phase3.md
     """
-    try:
-        # ====================================================================
-        # STEP 1: Get or Create Conversation
-        # ====================================================================
-
-        conversation = None
-
-        if request.conversation_id:
-            # Load existing conversation
-            conversation = session.get(Conversation, request.conversation_id)
-
-            if not conversation:
-                raise HTTPException(status_code=404, detail="Conversation not found")
-
-            # Verify ownership (multi-user isolation)
-            if conversation.user_id != current_user.id:
-                raise HTTPException(status_code=404, detail="Conversation not found")
-
-            # Update timestamp
-            conversation.updated_at = datetime.utcnow()
+    # Imported on first chat (or by the startup warm-up), not at app import:
+    # the LangChain/LLM stack dominates import time and worker memory.
+    from app.services.agent_service import create_agent, run_agent
 
+    try:
+        if get_settings().chat_single_transaction:
+            # One transaction for the whole turn (unit of work)
+            async with AsyncSessionLocal() as db:
+                conversation_history = await _load_turn_context(
+                    db, request.conversation_id, current_user
+                )
+                agent = create_agent(None, current_user, unit_of_work=db)
+                agent_result = await run_agent(
+                    agent_executor=agent,
+                    user_message=request.message,
+                    chat_history=conversation_history
+                )
+                if agent_result.get("error"):
+                    # The turn failed: undo the tool writes it made so far,
+                    # keep only the conversation and its messages
+                    await db.rollback()
+                conversation_id = await _persist_turn(
+                    db,
+                    request.conversation_id,
+                    current_user,
+                    request.message,
+                    agent_result["response"],
+                    agent_result.get("tool_calls", [])
+                )
         else:
-            # Create new conversation
-            conversation = Conversation(
-                user_id=current_user.id,
-                title=request.message[:50],  # Use first 50 chars as title
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+            # STEP 1: Load history, then release the connection
+            async with AsyncSessionLocal() as db:
+                conversation_history = await _load_turn_context(
+                    db, request.conversation_id, current_user
+                )
+
+            # STEP 2-3: Run agent; each tool call opens its own session
+            agent = create_agent(None, current_user)
+            agent_result = await run_agent(
+                agent_executor=agent,
+                user_message=request.message,
+                chat_history=conversation_history
             )
-            session.add(conversation)
-            session.commit()
-            session.refresh(conversation)
-
-        # ====================================================================
-        # STEP 2: Load Conversation History
-        # ====================================================================
-
-        # Get all messages in this conversation (ordered by time)
-        history_messages = session.exec(
-            select(Message)
-            .where(Message.conversation_id == conversation.id)
-            .order_by(Message.created_at.asc())
-        ).all()
-
-        # Format for LangChain agent
-        conversation_history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in history_messages
-        ]
-
-        # ====================================================================
-        # STEP 3: Create Agent and Run
-        # ====================================================================
-
-        # Create agent (stateless, recreated each request)
-        agent = create_agent(session, current_user)
-
-        # Run agent with conversation history
-        agent_result = await run_agent(
-            agent_executor=agent,
-            user_message=request.message,
-            chat_history=conversation_history
-        )
 
-        ai_response_text = agent_result["response"]
-        tool_calls = agent_result.get("tool_calls", [])
-
-        # ====================================================================
-        # STEP 4: Save Messages to Database
-        # ====================================================================
-
-        # Save user message
-        user_message = Message(
-            conversation_id=conversation.id,
-            user_id=current_user.id,
-            role="user",
-            content=request.message,
-            tool_calls=None,
-            created_at=datetime.utcnow()
-        )
-        session.add(user_message)
-
-        # Save AI response
-        assistant_message = Message(
-            conversation_id=conversation.id,
-            user_id=current_user.id,
-            role="assistant",
-            content=ai_response_text,
-            tool_calls={"tools": tool_calls} if tool_calls else None,
-            created_at=datetime.utcnow()
-        )
-        session.add(assistant_message)
+            # STEP 4: Save conversation + messages in one short transaction
+            async with AsyncSessionLocal() as db:
+                conversation_id = await _persist_turn(
+                    db,
+                    request.conversation_id,
+                    current_user,
+                    request.message,
+                    agent_result["response"],
+                    agent_result.get("tool_calls", [])
+                )
 
-        # Update conversation timestamp
-        conversation.updated_at = datetime.utcnow()
-        session.add(conversation)
-
-        session.commit()
-
-        # ====================================================================
         # STEP 5: Return Response
-        # ====================================================================
-
+        tool_calls = agent_result.get("tool_calls", [])
         return ChatResponse(
-            conversation_id=conversation.id,
-            response=ai_response_text,
+            conversation_id=conversation_id,
+            response=agent_result["response"],
             tool_calls=tool_calls if tool_calls else None
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        session.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Error processing chat message: {str(e)}"
         )
 
 
+PREVIEW_LENGTH = 120  # Characters of the last message in list previews
+
+
+def _encode_cursor(updated_at: datetime, conversation_id: int) -> str:
+    """Opaque keyset cursor for conversation listing."""
+    raw = f"{updated_at.isoformat()}|{conversation_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a conversation cursor. Raises HTTPException(400) if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, conversation_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(updated_at), int(conversation_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/conversations", response_model=List[Dict[str, Any]])
 def list_conversations(
+    response: Response,
+    before: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    include_preview: bool = Query(False, description="Add last_message, last_role and message_count"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
     """
-    List all conversations for the authenticated user.
+    List conversations for the authenticated user, most recent first.
+
+    Keyset pagination: pass the X-Next-Cursor response header back as
+    `before` to get the next (older) page. The header is absent on the last
+    page. Ordering (updated_at DESC, id DESC) is served by the
+    ix_conversations_user_updated index.
+
+    include_preview=true adds each conversation's latest message (truncated
+    to PREVIEW_LENGTH characters), its role and the message count. They are
+    computed in the same query with two LATERAL subqueries, both served by
+    ix_messages_conversation_id_id, so the sidebar needs no per-conversation
+    follow-up requests.
 
-    Returns conversations ordered by most recent first.
     Multi-user isolation: Only return user's own conversations.
     """
-    conversations = session.exec(
-        select(Conversation)
-        .where(Conversation.user_id == current_user.id)
-        .order_by(Conversation.updated_at.desc())
+    query = select(
+        Conversation.id,
+        Conversation.title,
+        Conversation.created_at,
+        Conversation.updated_at
+    ).where(Conversation.user_id == current_user.id)
+
+    if include_preview:
+        last_message = (
+            select(
+                func.left(Message.content, PREVIEW_LENGTH).label("last_message"),
+                Message.role.label("last_role")
+            )
+            .where(Message.conversation_id == Conversation.id)
+            .order_by(Message.id.desc())
+            .limit(1)
+            .lateral("last_message")
+        )
+        message_count = (
+            select(func.count().label("message_count"))
+            .where(Message.conversation_id == Conversation.id)
+            .lateral("message_count")
+        )
+        query = (
+            query
+            .add_columns(
+                last_message.c.last_message,
+                last_message.c.last_role,
+                message_count.c.message_count
+            )
+            .select_from(
+                outerjoin(Conversation, last_message, true())
+                .outerjoin(message_count, true())
+            )
+        )
+
+    if before:
+        cursor_updated_at, cursor_id = _decode_cursor(before)
+        query = query.where(
+            tuple_(Conversation.updated_at, Conversation.id) < tuple_(cursor_updated_at, cursor_id)
+        )
+
+    # Fetch one extra row to know whether another page exists
+    rows = session.exec(
+        query
+        .order_by(Conversation.updated_at.desc(), Conversation.id.desc())
+        .limit(limit + 1)
     ).all()
 
-    return [
-        {
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].updated_at, rows[-1].id)
+
+    conversations = []
+    for conv in rows:
+        item = {
             "id": conv.id,
             "title": conv.title,
             "created_at": conv.created_at.isoformat(),
             "updated_at": conv.updated_at.isoformat()
         }
-        for conv in conversations
-    ]
+        if include_preview:
+            item["last_message"] = conv.last_message
+            item["last_role"] = conv.last_role
+            item["message_count"] = conv.message_count
+        conversations.append(item)
+
+    return conversations
 
 
 @router.get("/conversations/{conversation_id}/messages", response_model=List[Dict[str, Any]])
 def get_conversation_messages(
     conversation_id: int,
+    response: Response,
+    before: Optional[int] = Query(None, description="Return messages older than this message id (X-Next-Cursor)"),
+    limit: int = Query(100, ge=1, le=500),
+    include_tool_calls: bool = Query(True, description="Set to false to leave out the tool_calls JSON"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get all messages in a conversation.
+    Get the latest messages in a conversation, oldest first.
+
+    Keyset pagination: returns up to `limit` messages; if older ones exist,
+    the X-Next-Cursor header holds the value to pass as `before`.
+    Ordering by id is served by the ix_messages_conversation_id_id index.
+    With include_tool_calls=false the JSONB column is not even read.
 
     Multi-user isolation: Verify conversation belongs to user.
     """
@@ -251,23 +407,36 @@ def get_conversation_messages(
     if conversation.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Get messages
-    messages = session.exec(
-        select(Message)
-        .where(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at.asc())
+    columns = [Message.id, Message.role, Message.content, Message.created_at]
+    if include_tool_calls:
+        columns.append(Message.tool_calls)
+
+    query = select(*columns).where(Message.conversation_id == conversation_id)
+    if before is not None:
+        query = query.where(Message.id < before)
+
+    # Newest page first from the index, then flip to chronological order
+    rows = session.exec(
+        query.order_by(Message.id.desc()).limit(limit + 1)
     ).all()
 
-    return [
-        {
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = str(rows[-1].id)
+
+    messages = []
+    for msg in reversed(rows):
+        item = {
             "id": msg.id,
             "role": msg.role,
             "content": msg.content,
-            "tool_calls": msg.tool_calls,
             "created_at": msg.created_at.isoformat()
         }
-        for msg in messages
-    ]
+        if include_tool_calls:
+            item["tool_calls"] = msg.tool_calls
+        messages.append(item)
+
+    return messages
 
 
 @router.delete("/conversations/{conversation_id}", status_code=204)
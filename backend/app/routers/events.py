@@ -0,0 +1,47 @@
+# File: backend/app/routers/events.py
+# Live task/tag change push (Server-Sent Events), see services/live_events.py
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.config import get_settings
+from app.services.live_events import live_events
+from app.utils.dependencies import get_stream_user_id
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+# Reconnect delay the browser's EventSource uses after a dropped stream (ms)
+RETRY_MS = 3000
+
+
+async def _event_stream(user_id: str):
+    # "ready" on every (re)connect: changes made while disconnected were
+    # not pushed, so the client refreshes once before relying on events
+    yield f"retry: {RETRY_MS}\nevent: ready\ndata: {{}}\n\n"
+    async for kinds in live_events.subscribe(user_id, get_settings().live_events_heartbeat_seconds):
+        if not kinds:
+            yield ": ping\n\n"
+            continue
+        for kind in sorted(kinds):
+            yield f'event: {kind}\ndata: {{"type": "{kind}"}}\n\n'
+
+
+@router.get("/")
+async def stream_events(user_id: str = Depends(get_stream_user_id)):
+    """
+    Server-Sent Events: the user's task and tag changes, from any client,
+    tab, worker or the AI assistant.
+
+    Events: `ready` (connected; refresh once), `tasks` (call GET
+    /tasks/changes), `tags` (refetch GET /tags). Bursts of writes are
+    coalesced into one event per kind. Replaces polling the lists.
+
+    Authenticate with the Authorization header or, from EventSource,
+    ?access_token=<jwt>.
+    """
+    return StreamingResponse(
+        _event_stream(user_id),
+        media_type="text/event-stream",
+        # no-transform/X-Accel-Buffering: proxies must not buffer the stream
+        headers={"Cache-Control": "no-store, no-transform", "X-Accel-Buffering": "no"},
+    )
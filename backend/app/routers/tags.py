@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlmodel import Session, select
 from typing import List
 
@@ -7,6 +7,8 @@ from app.models.user import User
 from app.models.tag import Tag
 from app.schemas.tag import TagCreate, TagUpdate, TagResponse
 from app.utils.dependencies import get_current_user
+from app.utils.http_cache import conditional_get
+from app.services.task_list_cache import invalidate_task_lists, record_change
 
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
@@ -39,6 +41,7 @@ async def create_tag(
     )
 
     session.add(tag)
+    record_change(session, current_user.id, "tags")
     session.commit()
     session.refresh(tag)
 
@@ -47,10 +50,16 @@ async def create_tag(
 
 @router.get("/", response_model=List[TagResponse])
 async def list_tags(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """Get all tags for the current user."""
+    """Get all tags for the current user (304 if If-None-Match matches the ETag)."""
+    not_modified = conditional_get(request, response, current_user)
+    if not_modified is not None:
+        return not_modified
+
     tags = session.exec(
         select(Tag)
         .where(Tag.user_id == current_user.id)
@@ -127,6 +136,7 @@ async def update_tag(
         setattr(tag, field, value)
 
     session.add(tag)
+    record_change(session, current_user.id, "tags")
     session.commit()
     session.refresh(tag)
 
@@ -155,6 +165,9 @@ async def delete_tag(
         )
 
     session.delete(tag)
+    # Its task_tags go with it, which changes GET /tasks?tag_ids=... results
+    invalidate_task_lists(session, current_user.id)
+    record_change(session, current_user.id, "tags")
     session.commit()
 
     return None
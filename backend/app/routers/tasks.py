@@ -1,18 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select, func, or_
-from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import delete
+from sqlmodel import Session, select, func
+from typing import Optional, List, Union
 from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from app.database import get_session
 from app.models.user import User
 from app.models.task import Task, PriorityEnum
 from app.models.tag import Tag, TaskTag
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
-from app.utils.dependencies import get_current_user
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, TaskSparseListResponse, TaskChangesResponse,
+    TaskBulkByFilterRequest, TaskBulkByFilterResponse, TaskSyncRequest, TaskSyncResponse, TaskStatsResponse
+)
+from app.services.task_queries import (
+    NOT_NULL_TASK_FIELDS, task_filter_clauses, count_by_filter_stmt, update_by_filter_stmt,
+    delete_by_filter_stmt
+)
+from app.services.task_changes import (
+    CursorExpiredError, changes_since, changes_json, decode_cursor, encode_cursor
+)
+from app.services.task_json import parse_fields, task_columns, task_list_json
+from app.services.task_stats import task_stats
+from app.services.task_sync import apply_sync_operations
+from app.services.task_list_cache import task_list_cache, task_list_params, invalidate_task_lists
+from app.utils.dependencies import get_current_user, get_current_user_id, load_user
+from app.utils.http_cache import conditional_get_for_etag, etag_headers, user_data_etag
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
+def _owned_tag_ids(session: Session, user_id: str, tag_ids: List[int]) -> List[int]:
+    """The given tag ids that belong to the user (one query), in request order."""
+    owned = set(session.exec(
+        select(Tag.id).where(Tag.id.in_(tag_ids), Tag.user_id == user_id)
+    ).all()) if tag_ids else set()
+    return [tag_id for tag_id in dict.fromkeys(tag_ids) if tag_id in owned]
+
+
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
@@ -32,26 +57,27 @@ async def create_task(
     )
 
     session.add(task)
+    invalidate_task_lists(session, current_user.id)
     session.commit()
     session.refresh(task)
 
     # Add tags if provided
     if task_data.tag_ids:
-        for tag_id in task_data.tag_ids:
-            # Verify tag belongs to user
-            tag = session.get(Tag, tag_id)
-            if tag and tag.user_id == current_user.id:
-                task_tag = TaskTag(task_id=task.id, tag_id=tag_id)
-                session.add(task_tag)
+        # Only the user's own tags
+        for tag_id in _owned_tag_ids(session, current_user.id, task_data.tag_ids):
+            session.add(TaskTag(task_id=task.id, tag_id=tag_id))
 
+        invalidate_task_lists(session, current_user.id)
         session.commit()
         session.refresh(task)
 
     return task
 
 
-@router.get("/", response_model=TaskListResponse)
+@router.get("/", response_model=Union[TaskListResponse, TaskSparseListResponse])
 async def list_tasks(
+    request: Request,
+    response: Response,
     completed: Optional[bool] = None,
     priority: Optional[PriorityEnum] = None,
     category: Optional[str] = None,
@@ -61,7 +87,8 @@ async def list_tasks(
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    current_user: User = Depends(get_current_user),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. id,title,completed,priority,due_date"),
+    user_id: str = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -75,33 +102,49 @@ async def list_tasks(
     - tag_ids: Filter by tag IDs (multiple allowed)
     - sort_by: Sort field (created_at, due_date, priority, title)
     - sort_order: Sort direction (asc, desc)
-    """
-    # Base query
-    query = select(Task).where(Task.user_id == current_user.id)
-
-    # Apply filters
-    if completed is not None:
-        query = query.where(Task.completed == completed)
 
-    if priority is not None:
-        query = query.where(Task.priority == priority)
+    Sparse fieldsets: fields=id,title,completed returns (and selects) only
+    those task fields; id is always included. Omit for full tasks.
 
-    if category is not None:
-        query = query.where(Task.category == category)
-
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Task.title.ilike(search_pattern),
-                Task.description.ilike(search_pattern)
-            )
+    Sends an ETag; a matching If-None-Match gets 304 without running the
+    list queries. Responses are cached per user (see task_list_cache): a hit
+    is served without touching the database.
+    """
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    params = task_list_params(
+        completed=completed, priority=priority, category=category, search=search,
+        tag_ids=tag_ids, sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit,
+        fields=selected_fields
+    )
+    cached = task_list_cache.get(user_id, params) if task_list_cache.enabled else None
+    if cached is not None:
+        etag, body = cached
+        not_modified = conditional_get_for_etag(request, response, etag)
+        return not_modified or Response(body, media_type="application/json", headers=etag_headers(etag))
+
+    generation = task_list_cache.generation(user_id)
+    current_user = load_user(session, user_id)
+    etag = user_data_etag(current_user)
+    not_modified = conditional_get_for_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Base query with filters (shared with bulk-by-filter and the AI tools);
+    # only the requested columns, encoded without ORM objects (task_json)
+    query = select(*task_columns(selected_fields)).where(
+        *task_filter_clauses(
+            current_user.id,
+            completed=completed,
+            priority=priority,
+            category=category,
+            search=search,
+            tag_ids=tag_ids
         )
-
-    if tag_ids:
-        # Filter tasks that have ANY of the specified tags
-        subquery = select(TaskTag.task_id).where(TaskTag.tag_id.in_(tag_ids))
-        query = query.where(Task.id.in_(subquery))
+    )
 
     # Get total count before pagination
     count_query = select(func.count()).select_from(query.subquery())
@@ -143,15 +186,94 @@ async def list_tasks(
     # Apply pagination
     query = query.offset(skip).limit(limit)
 
-    # Execute query
-    tasks = session.exec(query).all()
+    # Execute query (execute, not exec: rows stay tuples even for fields=id)
+    rows = session.execute(query).all()
 
-    return TaskListResponse(
-        tasks=tasks,
-        total=total,
-        completed=completed_count,
-        pending=pending_count
-    )
+    body = task_list_json(rows, total, completed_count, pending_count, selected_fields)
+    if task_list_cache.enabled:
+        task_list_cache.put(user_id, params, generation, etag, body)
+
+    return Response(body, media_type="application/json", headers=etag_headers(etag))
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+async def list_task_changes(
+    since: Optional[str] = Query(None, description="Cursor from the previous call; omit for a full initial sync"),
+    limit: int = Query(500, ge=1, le=1000),
+    user_id: str = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+):
+    """
+    Incremental refresh: tasks created/updated and ids deleted since `since`.
+
+    Without `since`, every task is returned (page through with has_more).
+    Keep the returned cursor and call again on refresh; one edit costs a
+    single task in the response instead of the whole list.
+
+    410 Gone: the cursor is older than the deleted-task log (or invalid);
+    reload the full list and restart without `since`.
+    """
+    try:
+        since_seq = decode_cursor(since) if since else 0
+    except CursorExpiredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"{e}: reload the task list and sync again without 'since'"
+        )
+
+    load_user(session, user_id)
+    rows, deleted, last_seq, has_more = changes_since(session, user_id, since_seq, limit)
+
+    body = changes_json(rows, deleted, encode_cursor(last_seq), has_more)
+    return Response(body, media_type="application/json", headers={"Cache-Control": "no-store"})
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    tz: str = Query("UTC", description="IANA time zone for due_today/due_this_week, e.g. Europe/Berlin"),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Dashboard statistics over all of the user's tasks, in one aggregate query.
+
+    Counts by completion, priority and category, pending tasks overdue /
+    due today / due within 7 days, and the estimated minutes still open.
+    """
+    try:
+        zone = ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown time zone: {tz}"
+        )
+
+    return task_stats(session, current_user.id, zone)
+
+
+@router.post("/sync", response_model=TaskSyncResponse)
+async def sync_tasks(
+    request: TaskSyncRequest,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Apply a queue of offline changes (create/update/complete/delete) in one request.
+
+    Operations are applied in order, in a single transaction. New tasks carry
+    a client-generated `client_id`; later operations (in this batch or a
+    later one) can target them by that id before the client knows the
+    server id, which is returned in `id_map`.
+
+    Every operation has an `idempotency_key`: sending the same queue again
+    after a lost response reports the already applied operations as
+    "duplicate" instead of applying them twice. Each result is one of
+    applied, duplicate, not_found or invalid; one failing operation does not
+    block the others.
+    """
+    id_map, results = apply_sync_operations(session, current_user.id, request.operations)
+    session.commit()
+    return TaskSyncResponse(id_map=id_map, results=results)
 
 
 @router.patch("/bulk-update", response_model=List[TaskResponse])
@@ -185,15 +307,80 @@ async def bulk_update_tasks(
         task.updated_at = datetime.utcnow()
         session.add(task)
 
+    invalidate_task_lists(session, current_user.id)
     session.commit()
 
-    # Refresh all tasks
-    for task in tasks:
-        session.refresh(task)
+    # Reload the expired tasks in one query (not a refresh per task)
+    session.exec(select(Task).where(Task.id.in_(task_ids))).all()
 
     return tasks
 
 
+@router.patch("/bulk-by-filter", response_model=TaskBulkByFilterResponse)
+async def bulk_mutate_by_filter(
+    request: TaskBulkByFilterRequest,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Update or delete every task matching a filter in one statement.
+
+    Uses the same filter vocabulary as GET /tasks (completed, priority,
+    category, search, tag_ids), e.g. "complete all shopping tasks" or
+    "delete all completed tasks". Runs as a single UPDATE/DELETE ... WHERE.
+
+    - action="update": apply `changes` (tag_ids are ignored)
+    - action="delete": requires at least one filter
+    - dry_run=true: only return how many tasks would be affected
+    """
+    task_filter = request.filter
+    clauses = task_filter_clauses(current_user.id, **task_filter.model_dump())
+
+    if request.action == "update":
+        if request.changes is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'changes' is required for action 'update'"
+            )
+        values = request.changes.model_dump(exclude_unset=True, exclude={"tag_ids"})
+        if not values:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'changes' must set at least one field"
+            )
+        nulls = [name for name in NOT_NULL_TASK_FIELDS if name in values and values[name] is None]
+        if nulls:
+            raise HTTPException(
+                status_code=422,  # Like request validation errors
+                detail=f"'changes' cannot set {', '.join(nulls)} to null"
+            )
+        values["updated_at"] = datetime.utcnow()
+    elif not any(v not in (None, [], "") for v in task_filter.model_dump().values()):
+        # Same test as the agent's bulk tool: task_filter_clauses drops empty
+        # search/tag_ids, so they would leave only the user_id clause
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Refusing to delete all tasks: provide at least one filter"
+        )
+
+    if request.dry_run:
+        matched = session.exec(count_by_filter_stmt(clauses)).one()
+    else:
+        if request.action == "update":
+            result = session.execute(update_by_filter_stmt(clauses, values))
+        else:
+            result = session.execute(delete_by_filter_stmt(clauses))
+        invalidate_task_lists(session, current_user.id)
+        session.commit()
+        matched = result.rowcount
+
+    return TaskBulkByFilterResponse(
+        action=request.action,
+        dry_run=request.dry_run,
+        matched=matched
+    )
+
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
@@ -249,19 +436,13 @@ async def update_task(
 
     # Update tags if provided
     if task_data.tag_ids is not None:
-        # Remove existing tags
-        session.exec(select(TaskTag).where(TaskTag.task_id == task_id)).all()
-        for task_tag in session.exec(select(TaskTag).where(TaskTag.task_id == task_id)):
-            session.delete(task_tag)
-
-        # Add new tags
-        for tag_id in task_data.tag_ids:
-            tag = session.get(Tag, tag_id)
-            if tag and tag.user_id == current_user.id:
-                task_tag = TaskTag(task_id=task.id, tag_id=tag_id)
-                session.add(task_tag)
+        # Replace the existing tags with the user's own tags among tag_ids
+        session.execute(delete(TaskTag).where(TaskTag.task_id == task_id))
+        for tag_id in _owned_tag_ids(session, current_user.id, task_data.tag_ids):
+            session.add(TaskTag(task_id=task.id, tag_id=tag_id))
 
     session.add(task)
+    invalidate_task_lists(session, current_user.id)
     session.commit()
     session.refresh(task)
 
@@ -290,6 +471,7 @@ async def delete_task(
         )
 
     session.delete(task)
+    invalidate_task_lists(session, current_user.id)
     session.commit()
 
     return None
@@ -303,22 +485,19 @@ async def bulk_delete_tasks(
 ):
     """Delete multiple tasks at once."""
     # Verify all tasks belong to user
-    tasks = session.exec(
-        select(Task).where(
-            Task.id.in_(task_ids),
-            Task.user_id == current_user.id
-        )
-    ).all()
+    clauses = [Task.id.in_(task_ids), Task.user_id == current_user.id]
+    owned = session.exec(count_by_filter_stmt(clauses)).one()
 
-    if len(tasks) != len(task_ids):
+    if owned != len(task_ids):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Some tasks do not exist or you don't have permission to delete them"
         )
 
-    for task in tasks:
-        session.delete(task)
+    # One DELETE for the tasks and their task_tags (not a cascade load per task)
+    session.execute(delete_by_filter_stmt(clauses))
 
+    invalidate_task_lists(session, current_user.id)
     session.commit()
 
     return None
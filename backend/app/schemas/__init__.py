@@ -1,9 +1,13 @@
 from .user import UserCreate, UserResponse, LoginRequest
-from .task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
+from .task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse,
+    TaskFilter, TaskBulkByFilterRequest, TaskBulkByFilterResponse
+)
 from .tag import TagCreate, TagUpdate, TagResponse
 
 __all__ = [
     "UserCreate", "UserResponse", "LoginRequest",
     "TaskCreate", "TaskUpdate", "TaskResponse", "TaskListResponse",
+    "TaskFilter", "TaskBulkByFilterRequest", "TaskBulkByFilterResponse",
     "TagCreate", "TagUpdate", "TagResponse"
 ]
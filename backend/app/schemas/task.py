@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal, Dict
 from pydantic import BaseModel, Field
 from app.models.task import PriorityEnum
 
@@ -57,3 +57,111 @@ class TaskListResponse(BaseModel):
     total: int
     completed: int
     pending: int
+
+
+class TaskSparseResponse(BaseModel):
+    """A task with only the fields requested via GET /tasks?fields=... (id always)."""
+    id: int
+    user_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    completed: Optional[bool] = None
+    priority: Optional[PriorityEnum] = None
+    category: Optional[str] = None
+    due_date: Optional[datetime] = None
+    estimated_minutes: Optional[int] = None
+    tags: Optional[List[TagResponse]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TaskSparseListResponse(BaseModel):
+    tasks: List[TaskSparseResponse]
+    total: int
+    completed: int
+    pending: int
+
+
+class TaskChangesResponse(BaseModel):
+    """GET /tasks/changes: apply `changed` (upsert by id), then `deleted`."""
+    changed: List[TaskResponse]
+    deleted: List[int]  # Ids of tasks deleted since the cursor
+    cursor: str  # Pass as `since` on the next call
+    has_more: bool  # More changes pending: call again right away with `cursor`
+
+
+class TaskStatsBucket(BaseModel):
+    total: int
+    completed: int
+    pending: int
+
+
+class TaskCategoryStats(TaskStatsBucket):
+    category: Optional[str]  # None: tasks without a category
+
+
+class TaskStatsResponse(TaskStatsBucket):
+    """GET /tasks/stats: counts over all of the user's tasks (not a page)."""
+    by_priority: Dict[PriorityEnum, TaskStatsBucket]
+    by_category: List[TaskCategoryStats]  # Largest first
+    # Pending tasks only; today/this week (today + 6 days) in the requested tz
+    overdue: int
+    due_today: int
+    due_this_week: int
+    estimated_minutes_remaining: int  # Sum over pending tasks
+
+
+class TaskFilter(BaseModel):
+    """Same filter vocabulary as GET /tasks."""
+    completed: Optional[bool] = None
+    priority: Optional[PriorityEnum] = None
+    category: Optional[str] = None
+    search: Optional[str] = None
+    tag_ids: Optional[List[int]] = None
+
+
+class TaskBulkByFilterRequest(BaseModel):
+    filter: TaskFilter = Field(default_factory=TaskFilter)
+    action: Literal["update", "delete"] = "update"
+    changes: Optional[TaskUpdate] = None  # Required for action="update" (tag_ids ignored)
+    dry_run: bool = False
+
+
+class TaskBulkByFilterResponse(BaseModel):
+    action: str
+    dry_run: bool
+    matched: int  # Tasks matching the filter (affected rows when not a dry run)
+
+
+class TaskSyncOperation(BaseModel):
+    """
+    One queued client change for POST /tasks/sync.
+
+    The target is `task_id` (a server id) or `client_id` (the id the client
+    gave a task it created, in this batch or an earlier one). A create
+    needs `client_id` and `task`; an update needs `changes`.
+    """
+    op: Literal["create", "update", "complete", "delete"]
+    idempotency_key: str = Field(min_length=1, max_length=100)
+    client_id: Optional[str] = Field(default=None, min_length=1, max_length=100)
+    task_id: Optional[int] = None
+    task: Optional[TaskCreate] = None  # op="create" (tag_ids ignored)
+    changes: Optional[TaskUpdate] = None  # op="update" (tag_ids ignored)
+    completed: bool = True  # op="complete"; false reopens the task
+
+
+class TaskSyncRequest(BaseModel):
+    operations: List[TaskSyncOperation] = Field(min_length=1, max_length=500)
+
+
+class TaskSyncResult(BaseModel):
+    index: int  # Position in `operations`
+    op: str
+    status: Literal["applied", "duplicate", "not_found", "invalid"]
+    task_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class TaskSyncResponse(BaseModel):
+    id_map: Dict[str, int]  # client_id -> server task id
+    results: List[TaskSyncResult]
@@ -4,18 +4,27 @@
 # Implements stateless agent that uses MCP tools to manage tasks
 # PRODUCTION: Uses Groq API as fallback when Ollama isn't available
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from uuid import UUID
 import os
-from langchain_ollama import ChatOllama
-from langchain_groq import ChatGroq
+import time
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import LLMResult
 from sqlmodel import Session
-import httpx
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.config import get_settings
 from app.models.user import User
 from app.mcp.langchain_tools import create_langchain_tools
+from app.services.llm_provider import select_llm_provider
+from app.services.ollama_warmup import ollama_state, keep_alive_value
+from app.utils.metrics import AGENT_ITERATIONS, observe_llm_call, observe_tool_call
+from app.utils.tracing import tracer
+from opentelemetry.trace import Status, StatusCode
 
 
 # ============================================================================
@@ -26,72 +35,136 @@ SYSTEM_PROMPT = """You are a helpful task management assistant.
 
 Available tools:
 - add_task(title, priority, category, due_date): Create a new task
-- list_tasks(completed): Show tasks
+- list_tasks(status, priority, category, search, due_after, due_before, limit, offset): Show a page of tasks
 - complete_task(task_id, completed): Mark done/undone
 - delete_task(task_id): Remove a task
 - update_task(task_id, ...): Modify task details
+- add_tasks(tasks), complete_tasks(task_ids), delete_tasks(task_ids): Same actions for several tasks in ONE call
+- bulk_update_by_filter(action, status, priority, category, search, ...): Complete/update/delete ALL tasks matching a filter
 
 CRITICAL:
 1. If the user asks for a task action (add, list, delete, etc.), you MUST call the appropriate tool.
-2. If the user is just saying hello, asking general questions, or small talk, just respond normally without calling any tools.
-3. Be brief and professional (max 2 sentences)."""
+2. When the user names several items or task IDs, use the batch tool (add_tasks, complete_tasks, delete_tasks) once instead of repeating single-task calls.
+3. If the user is just saying hello, asking general questions, or small talk, just respond normally without calling any tools.
+4. Be brief and professional (max 2 sentences)."""
 
 
 # ============================================================================
 # AGENT FACTORY
 # ============================================================================
 
-def _check_ollama_available() -> bool:
-    """Check if Ollama is running and accessible (for local dev)."""
-    try:
-        # Use 127.0.0.1 for container stability
-        response = httpx.get("http://127.0.0.1:11434/api/tags", timeout=1.0)
-        return response.status_code == 200
-    except:
-        return False
+def create_llm() -> Tuple[str, Optional[BaseChatModel]]:
+    """
+    Pick the LLM backend and build its chat model.
 
+    LLM_PROVIDER=replay serves recorded cassettes (no network, no model);
+    LLM_CASSETTE_RECORD=true records the real provider's exchanges.
+    """
+    from app.services.llm_cassette import CassetteChatModel
 
-def create_agent(session: Session, user: User) -> AgentExecutor:
+    settings = get_settings()
+    if settings.llm_provider.lower() == "replay":
+        print("⚪ Using recorded LLM cassettes (replay)")
+        return "replay", CassetteChatModel(cassette_dir=settings.llm_cassette_dir)
+
+    provider, llm = _create_provider_llm()
+    if settings.llm_cassette_record:
+        if llm is None:
+            print(f"⚠️ LLM_CASSETTE_RECORD is not supported for {provider}; not recording")
+        else:
+            llm = CassetteChatModel(cassette_dir=settings.llm_cassette_dir, inner=llm)
+    return provider, llm
+
+
+def _create_provider_llm() -> Tuple[str, Optional[BaseChatModel]]:
     """
-    Create a LangChain agent with LLM and MCP tools.
+    Build the chat model of a real LLM backend.
 
-    Auto-detects environment:
+    The backend is LLM_PROVIDER or auto-detected (see select_llm_provider):
     - Production/Cloud: Uses Groq API if GROQ_API_KEY set (HIGH PRIORITY)
-    - Local development: Uses Ollama (llama3.2) if running
+    - Local development: Uses Ollama (OLLAMA_MODEL, llama3.2) if running
+    - Gemini: if GEMINI_API_KEY set
+
+    Returns (provider, llm). llm is None for gemini, which runs its own
+    function-calling loop (AsyncGeminiAgent) instead of a LangChain model.
     """
+    provider = select_llm_provider()
+    settings = get_settings()
 
-    groq_api_key = os.getenv("GROQ_API_KEY", "").strip()
-    
     # Priority 1: Groq API (Fast, reliable, best for production)
-    if groq_api_key:
+    if provider == "groq":
         print("🔵 Using Groq API (Production/High Performance)")
-        llm = ChatGroq(
+        # Provider packages are imported only for the backend in use
+        from langchain_groq import ChatGroq
+        return provider, ChatGroq(
             model="llama-3.3-70b-versatile",
             temperature=0.3,
             max_tokens=200,
-            groq_api_key=groq_api_key,
+            groq_api_key=os.getenv("GROQ_API_KEY", "").strip(),
         )
     # Priority 2: Ollama (Local development or fallback)
-    elif _check_ollama_available():
+    elif provider == "ollama":
         print("🟢 Using Ollama (Local/Fallback)")
-        llm = ChatOllama(
-            model="llama3.2",
+        from langchain_ollama import ChatOllama
+        ollama_state.mark_used()
+        return provider, ChatOllama(
+            model=settings.ollama_model,
             temperature=0.3,
-            base_url="http://127.0.0.1:11434",
+            base_url=settings.ollama_base_url,
+            keep_alive=keep_alive_value(),  # Same as the warm-up, so the model stays loaded
             num_predict=200,
             top_k=10,
             top_p=0.9,
             repeat_penalty=1.1,
             num_ctx=2048,
         )
+    # Priority 3: Gemini (native async function-calling loop, no LangChain)
+    elif provider == "gemini":
+        print("🟣 Using Gemini API (Async function calling)")
+        return provider, None
     else:
         raise ValueError(
             "No LLM provider available! Please set GROQ_API_KEY in environment variables "
             "for production performance. (https://console.groq.com)"
         )
 
+
+def create_agent(
+    session: Optional[Session],
+    user: User,
+    unit_of_work: Optional[AsyncSession] = None,
+    llm: Optional[BaseChatModel] = None
+) -> AgentExecutor:
+    """
+    Create a LangChain agent with LLM and MCP tools.
+
+    The LLM comes from create_llm() unless llm is given (benchmarks and
+    tests pass a replay model). For Gemini an AsyncGeminiAgent is returned;
+    it has the same ainvoke() contract as AgentExecutor.
+
+    If unit_of_work is given, tool writes are only flushed to that session
+    and the caller commits the chat turn once. With session=None and no
+    unit_of_work, every tool call uses its own short-lived session, so no
+    connection is held while the LLM is generating.
+    """
+
+    if llm is not None:
+        provider = llm._llm_type
+    else:
+        provider, llm = create_llm()
+
+    if llm is None:
+        # Imported lazily: google-generativeai is only needed for this backend
+        from app.utils.gemini_client import AsyncGeminiAgent
+        return AsyncGeminiAgent(
+            user,
+            unit_of_work=unit_of_work,
+            max_iterations=5,
+            max_execution_time=25,
+        )
+
     # Create tools with bound session and user
-    tools = create_langchain_tools(session, user)
+    tools = create_langchain_tools(session, user, unit_of_work=unit_of_work)
 
     # Create prompt template with system message and chat history
     prompt = ChatPromptTemplate.from_messages([
@@ -118,11 +191,104 @@ def create_agent(session: Session, user: User) -> AgentExecutor:
         return_intermediate_steps=True,
         max_execution_time=25,  # Increased for slow cold-starts
         early_stopping_method="force",
+        metadata={"llm_provider": provider},  # Metrics label (see run_agent)
     )
 
     return agent_executor
 
 
+# ============================================================================
+# AGENT METRICS & TRACING
+# ============================================================================
+
+class AgentTelemetryCallback(BaseCallbackHandler):
+    """
+    Per-turn callback passed to AgentExecutor.ainvoke(config={"callbacks": ...}).
+
+    It propagates to every child run, so it sees each LLM call (latency,
+    tokens, one llm.<provider> span) and each tool run (latency; the tool
+    span itself comes from @traced in todo_tools). llm_calls is the number
+    of agent iterations for the turn.
+    """
+
+    run_inline = True  # Cheap bookkeeping: no thread-pool hop per event
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.llm_calls = 0
+        self._started: Dict[UUID, float] = {}
+        self._tool_names: Dict[UUID, str] = {}
+        self._spans: Dict[UUID, Any] = {}
+
+    # LLM calls -------------------------------------------------------------
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_llm(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_llm(run_id)
+
+    def _start_llm(self, run_id: UUID) -> None:
+        self.llm_calls += 1
+        self._started[run_id] = time.perf_counter()
+        # Child of the current span (agent.run); not made current itself
+        self._spans[run_id] = tracer.start_span(
+            f"llm.{self.provider}",
+            attributes={"llm.provider": self.provider, "agent.iteration": self.llm_calls}
+        )
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        prompt_tokens, completion_tokens = _token_usage(response)
+        observe_llm_call(self.provider, time.perf_counter() - started, prompt_tokens, completion_tokens)
+        span = self._spans.pop(run_id, None)
+        if span is not None:
+            span.set_attribute("llm.prompt_tokens", prompt_tokens or 0)
+            span.set_attribute("llm.completion_tokens", completion_tokens or 0)
+            span.end()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            observe_llm_call(self.provider, time.perf_counter() - started)
+        span = self._spans.pop(run_id, None)
+        if span is not None:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+    # Tools -----------------------------------------------------------------
+
+    def on_tool_start(self, serialized, input_str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.perf_counter()
+        self._tool_names[run_id] = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id, ok=not (isinstance(output, dict) and output.get("success") is False))
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id, ok=False)
+
+    def _finish_tool(self, run_id: UUID, ok: bool) -> None:
+        started = self._started.pop(run_id, None)
+        name = self._tool_names.pop(run_id, "unknown")
+        if started is not None:
+            observe_tool_call(name, time.perf_counter() - started, ok=ok)
+
+
+def _token_usage(response: LLMResult):
+    """(prompt, completion) tokens from usage_metadata or llm_output, if reported."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                return usage.get("input_tokens"), usage.get("output_tokens")
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("prompt_tokens"), token_usage.get("completion_tokens")
+
+
 # ============================================================================
 # AGENT RUNNER
 # ============================================================================
@@ -160,12 +326,22 @@ async def run_agent(
             elif msg["role"] == "assistant":
                 lc_history.append(AIMessage(content=msg["content"]))
 
+    provider = (getattr(agent_executor, "metadata", None) or {}).get("llm_provider", "unknown")
+    telemetry = AgentTelemetryCallback(provider)
+
     # Run agent
     try:
-        result = await agent_executor.ainvoke({
-            "input": user_message,
-            "chat_history": lc_history
-        })
+        with tracer.start_as_current_span("agent.run", attributes={"llm.provider": provider}) as span:
+            result = await agent_executor.ainvoke(
+                {
+                    "input": user_message,
+                    "chat_history": lc_history
+                },
+                config={"callbacks": [telemetry]}
+            )
+            iterations = result.get("iterations", telemetry.llm_calls)
+            span.set_attribute("agent.iterations", iterations)
+        AGENT_ITERATIONS.labels(provider).observe(iterations)
 
         # Extract tool calls from intermediate steps
         tool_calls = []
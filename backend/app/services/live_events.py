@@ -0,0 +1,89 @@
+# File: backend/app/services/live_events.py
+# Per-user push of change events to open GET /events streams (SSE)
+#
+# Events are signals, not data: "tasks" (a task or its tags changed) and
+# "tags" (a tag was created, renamed or deleted). A client answers "tasks"
+# with GET /tasks/changes and "tags" with a revalidating GET /tags, so the
+# stream never disagrees with the REST responses and each event fits in a
+# Postgres NOTIFY payload.
+#
+# Producers: the commit hooks of task_list_cache publish the kinds a
+# session recorded (record_change / invalidate_task_lists), once it has
+# committed, and its NOTIFY listener publishes other workers' changes.
+# Every write path (REST, the AI tools, sync, bulk-by-filter) therefore
+# reaches every worker's streams without code of its own.
+#
+# A subscriber keeps only the set of kinds not yet sent: a burst of writes
+# becomes one event per kind, and a slow client costs no memory.
+
+import asyncio
+import threading
+from typing import AsyncIterator, Dict, Iterable, Set
+
+from app.utils.metrics import LIVE_EVENT_STREAMS
+
+EVENT_KINDS = ("tasks", "tags")
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.pending: Set[str] = set()
+        self.wakeup = asyncio.Event()
+
+    def push(self, kinds: Iterable[str]) -> None:
+        """Runs on the subscriber's event loop."""
+        self.pending.update(kinds)
+        self.wakeup.set()
+
+
+class LiveEventHub:
+    """Open streams by user; publish() may be called from any thread."""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[_Subscriber]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, user_id: str, *kinds: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(subscriber.push, kinds)
+
+    def publish_all(self, *kinds: str) -> None:
+        """Every stream (after missed notifications: clients resync)."""
+        with self._lock:
+            subscribers = [subscriber for group in self._subscribers.values() for subscriber in group]
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(subscriber.push, kinds)
+
+    async def subscribe(self, user_id: str, heartbeat_seconds: float) -> AsyncIterator[Set[str]]:
+        """
+        Yield sets of changed kinds for user_id; an empty set every
+        heartbeat_seconds without changes (keeps proxies from closing the stream).
+        """
+        subscriber = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+        LIVE_EVENT_STREAMS.inc()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield set()
+                    continue
+                subscriber.wakeup.clear()
+                kinds, subscriber.pending = subscriber.pending, set()
+                yield kinds
+        finally:
+            LIVE_EVENT_STREAMS.dec()
+            with self._lock:
+                group = self._subscribers.get(user_id)
+                if group is not None:
+                    group.discard(subscriber)
+                    if not group:
+                        del self._subscribers[user_id]
+
+
+live_events = LiveEventHub()
@@ -0,0 +1,127 @@
+# File: backend/app/services/llm_cassette.py
+# Record/replay LLM backend for offline development and tests
+#
+# LLM_PROVIDER=replay answers every model call from cassette files, with no
+# network and no model. LLM_CASSETTE_RECORD=true wraps the real provider and
+# writes each request/response pair it has not seen yet. A cassette is one
+# JSON file per request, named after the hash of what was sent to the model
+# (messages, tool schemas, stop words), so a replayed turn takes exactly the
+# path it took when it was recorded and any prompt or tool change shows up as
+# a missing cassette instead of a silently different answer.
+
+import hashlib
+import json
+import os
+import re
+from typing import List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, messages_from_dict, message_to_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# Task ids and timestamps in tool results differ from one database to the
+# next: numbers in tool output are not part of the key
+_NUMBER = re.compile(r"\d+")
+
+
+class CassetteMissError(LookupError):
+    """No cassette recorded for this request (replay mode)."""
+
+
+def request_key(messages: List[BaseMessage], tools: Optional[list], stop: Optional[List[str]]) -> str:
+    """Stable hash of one model request."""
+    payload = {
+        "messages": [
+            {
+                "type": message.type,
+                "content": _NUMBER.sub("#", str(message.content)) if message.type == "tool" else message.content,
+                "tool_calls": [
+                    {"name": call["name"], "args": call["args"], "id": call.get("id")}
+                    for call in getattr(message, "tool_calls", None) or []
+                ],
+                "tool_call_id": getattr(message, "tool_call_id", None),
+            }
+            for message in messages
+        ],
+        "tools": tools or [],
+        "stop": stop or [],
+    }
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+class CassetteChatModel(BaseChatModel):
+    """
+    Chat model serving responses from cassette files.
+
+    With inner=None (replay) a request without a cassette raises
+    CassetteMissError. With an inner model (record) known requests are
+    replayed and new ones are sent to inner and saved.
+    """
+
+    cassette_dir: str
+    inner: Optional[BaseChatModel] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay" if self.inner is None else self.inner._llm_type
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cassette_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[ChatResult]:
+        try:
+            with open(self._path(key)) as f:
+                cassette = json.load(f)
+        except FileNotFoundError:
+            return None
+        message = messages_from_dict([cassette["response"]])[0]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _save(self, key: str, messages: List[BaseMessage], message: BaseMessage) -> None:
+        os.makedirs(self.cassette_dir, exist_ok=True)
+        cassette = {
+            "provider": self.inner._llm_type,
+            "request": [message_to_dict(m) for m in messages],
+            "response": message_to_dict(message),
+        }
+        # Write then rename: parallel test workers never read half a file
+        tmp = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(cassette, f, indent=2, default=str)
+        os.replace(tmp, self._path(key))
+
+    def _miss(self, key: str) -> CassetteMissError:
+        return CassetteMissError(
+            f"No LLM cassette {key}.json in {self.cassette_dir}. Record it with "
+            "LLM_CASSETTE_RECORD=true and a real LLM_PROVIDER."
+        )
+
+    def _bound_inner(self, tools: Optional[list]):
+        return self.inner.bind_tools(tools) if tools else self.inner
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        key = request_key(messages, tools, stop)
+        result = self._load(key)
+        if result is not None:
+            return result
+        if self.inner is None:
+            raise self._miss(key)
+        message = self._bound_inner(tools).invoke(messages, stop=stop)
+        self._save(key, messages, message)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        key = request_key(messages, tools, stop)
+        result = self._load(key)
+        if result is not None:
+            return result
+        if self.inner is None:
+            raise self._miss(key)
+        message = await self._bound_inner(tools).ainvoke(messages, stop=stop)
+        self._save(key, messages, message)
+        return ChatResult(generations=[ChatGeneration(message=message)])
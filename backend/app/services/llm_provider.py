@@ -0,0 +1,67 @@
+# File: backend/app/services/llm_provider.py
+# Which LLM backend serves chats: LLM_PROVIDER, or auto-detected
+#
+# agent_service.create_llm builds the model of the selected provider; the
+# app lifespan preloads the Ollama model only when Ollama is the one
+# selected. Both use select_llm_provider(), so they cannot disagree.
+# Imports no LangChain or provider package.
+
+import os
+from typing import Optional
+
+import httpx
+
+from app.config import get_settings
+from app.services.ollama_warmup import ollama_state
+
+
+def ollama_available() -> bool:
+    """Check if Ollama is running and accessible (for local dev)."""
+    # Answered the warm-up or a probe in the last PROBE_TTL_SECONDS: skip
+    # the probe (only briefly, so a dead Ollama is noticed)
+    if ollama_state.seen_recently():
+        return True
+    try:
+        response = httpx.get(f"{get_settings().ollama_base_url}/api/tags", timeout=1.0)
+    except Exception:
+        return False
+    if response.status_code == 200:
+        ollama_state.mark_seen()
+        return True
+    return False
+
+
+def select_llm_provider(ollama_fallback: bool = False) -> Optional[str]:
+    """
+    The provider chats use, or None if there is none.
+
+    LLM_PROVIDER if set (groq and gemini need their API key), otherwise
+    "auto" picks in priority order:
+    - groq: GROQ_API_KEY set (production)
+    - ollama: answering at OLLAMA_BASE_URL (local development)
+    - gemini: GEMINI_API_KEY set
+
+    ollama_fallback: in auto mode with neither key set, pick ollama even if
+    it is not answering yet - nothing else could serve chats, and start.sh
+    starts `ollama serve` alongside the app.
+    """
+    groq_api_key = os.getenv("GROQ_API_KEY", "").strip()
+    gemini_api_key = os.getenv("GEMINI_API_KEY", "").strip()
+    provider = get_settings().llm_provider.lower()
+
+    if provider == "auto":
+        if groq_api_key:
+            return "groq"
+        if ollama_available():
+            return "ollama"
+        if gemini_api_key:
+            return "gemini"
+        return "ollama" if ollama_fallback else None
+    if (provider == "groq" and not groq_api_key) or (provider == "gemini" and not gemini_api_key):
+        return None
+    return provider
+
+
+def ollama_is_selected() -> bool:
+    """Whether chats use Ollama (probes it in auto mode: call off the event loop)."""
+    return select_llm_provider(ollama_fallback=True) == "ollama"
@@ -0,0 +1,165 @@
+# File: backend/app/services/ollama_warmup.py
+# Ollama model preload and keep-alive management
+#
+# start.sh starts `ollama serve` in the background and uvicorn right away.
+# When chats use Ollama (services/llm_provider.py), the app lifespan runs
+# warm_ollama_model() as a background task: it waits for the Ollama API,
+# then loads the model into RAM with a one-token generate call and
+# OLLAMA_KEEP_ALIVE, so the first chat does not pay the model load. Chat requests send the same keep_alive (see agent_service),
+# which keeps Ollama from unloading the model after its 5 minute default.
+
+import asyncio
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import get_settings
+
+
+# ============================================================================
+# WARM-UP STATE
+# ============================================================================
+
+# A successful warm-up or probe lets auto mode skip probing for this long
+PROBE_TTL_SECONDS = 30
+
+
+class OllamaWarmState:
+    """Process-local warm/cold state, reported by GET /ready."""
+
+    COLD = "cold"  # Warm-up not started (or OLLAMA_PRELOAD=false)
+    WARMING = "warming"  # Waiting for the API / loading the model
+    WARM = "warm"  # Model loaded with the configured keep_alive
+    UNAVAILABLE = "unavailable"  # Ollama not reachable or model load failed
+
+    def __init__(self):
+        self.status = self.COLD
+        self.error: Optional[str] = None
+        self.load_ms: Optional[float] = None
+        self.warmed_at: Optional[datetime] = None
+        self.last_used: Optional[float] = None  # time.monotonic() of the last load/chat
+        self.last_seen: Optional[float] = None  # time.monotonic() Ollama last answered
+
+    @property
+    def is_warm(self) -> bool:
+        """Loaded, and not unloaded since: keep_alive has not run out after the last use."""
+        if self.status != self.WARM or self.last_used is None:
+            return False
+        keep_alive = keep_alive_seconds()
+        return keep_alive is None or time.monotonic() - self.last_used < keep_alive
+
+    def mark_used(self) -> None:
+        """A chat request to Ollama (restarts its keep_alive timer)."""
+        self.last_used = time.monotonic()
+
+    def mark_seen(self) -> None:
+        self.last_seen = time.monotonic()
+
+    def seen_recently(self) -> bool:
+        return self.last_seen is not None and time.monotonic() - self.last_seen < PROBE_TTL_SECONDS
+
+    def as_dict(self) -> Dict[str, Any]:
+        settings = get_settings()
+        return {
+            # A warm model that keep_alive has unloaded since is cold again
+            "status": self.COLD if self.status == self.WARM and not self.is_warm else self.status,
+            "model": settings.ollama_model,
+            "keep_alive": settings.ollama_keep_alive,
+            "load_ms": self.load_ms,
+            "warmed_at": self.warmed_at.isoformat() if self.warmed_at else None,
+            "error": self.error,
+        }
+
+
+ollama_state = OllamaWarmState()
+
+
+def keep_alive_value():
+    """OLLAMA_KEEP_ALIVE as Ollama expects it: "30m", "1h" or seconds (-1 = forever)."""
+    value = get_settings().ollama_keep_alive.strip()
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def keep_alive_seconds() -> Optional[float]:
+    """OLLAMA_KEEP_ALIVE in seconds (Go duration like "1h30m" or a number); None = forever."""
+    value = keep_alive_value()
+    if isinstance(value, int):
+        return None if value < 0 else value
+    if value.startswith("-"):
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return 300  # Unparseable: Ollama's default
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+# ============================================================================
+# WARM-UP TASK
+# ============================================================================
+
+async def _wait_for_api(client: httpx.AsyncClient, timeout: float) -> bool:
+    """Poll /api/tags until Ollama answers or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get("/api/tags", timeout=2.0)
+            if response.status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(1)
+    return False
+
+
+async def warm_ollama_model() -> None:
+    """
+    Load settings.ollama_model into Ollama and pin it with keep_alive.
+
+    Never raises: failures are recorded in ollama_state and the app keeps
+    serving (Groq/Gemini still work, Ollama is probed again per chat).
+    """
+    settings = get_settings()
+    ollama_state.status = OllamaWarmState.WARMING
+    ollama_state.error = None
+    try:
+        async with httpx.AsyncClient(base_url=settings.ollama_base_url) as client:
+            if not await _wait_for_api(client, settings.ollama_startup_timeout):
+                ollama_state.status = OllamaWarmState.UNAVAILABLE
+                ollama_state.error = f"Ollama API not reachable at {settings.ollama_base_url}"
+                return
+
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": settings.ollama_model,
+                    "prompt": "hi",
+                    "stream": False,
+                    "keep_alive": keep_alive_value(),
+                    "options": {"num_predict": 1},
+                },
+                # Loading a model from disk can take a while on small CPUs
+                timeout=settings.ollama_load_timeout,
+            )
+            response.raise_for_status()
+
+        ollama_state.load_ms = round((time.perf_counter() - started) * 1000, 1)
+        ollama_state.warmed_at = datetime.now(timezone.utc)
+        ollama_state.mark_used()
+        ollama_state.mark_seen()
+        ollama_state.status = OllamaWarmState.WARM
+        print(f"🟢 Ollama model {settings.ollama_model} warm in {ollama_state.load_ms} ms")
+    except asyncio.CancelledError:
+        ollama_state.status = OllamaWarmState.COLD
+        raise
+    except Exception as e:
+        ollama_state.status = OllamaWarmState.UNAVAILABLE
+        ollama_state.error = str(e)
+        print(f"⚠️ Ollama warm-up failed: {e}")
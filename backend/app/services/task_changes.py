@@ -0,0 +1,119 @@
+# File: backend/app/services/task_changes.py
+# Delta sync for GET /tasks/changes: changed tasks and tombstones since a cursor
+#
+# tasks.change_seq is assigned by a trigger on every insert/update and
+# task_tombstones gets a row (with its own change_seq) for every delete,
+# whichever path made the change (migration 005). Within one user,
+# change_seq order is commit order, so "everything after N" is complete.
+#
+# The cursor is opaque to clients: the last change_seq they have seen plus
+# the time it was issued. Tombstones older than TASK_TOMBSTONE_RETENTION_DAYS
+# are pruned; a cursor issued before that horizon may have missed deletes,
+# so it is rejected (CursorExpiredError) and the client reloads GET /tasks.
+
+import asyncio
+import base64
+import time
+from datetime import datetime, timedelta
+from typing import Any, List, Sequence, Tuple
+
+import orjson
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.database import get_engine
+from app.models.task import Task, TaskTombstone
+from app.services.task_json import TASK_RESPONSE_COLUMNS
+
+_ROW_FIELDS = tuple(column.key for column in TASK_RESPONSE_COLUMNS)
+
+
+class CursorExpiredError(ValueError):
+    """The cursor is older than the tombstone retention (or malformed)."""
+
+
+def encode_cursor(change_seq: int) -> str:
+    raw = f"{change_seq}:{int(time.time())}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """change_seq of a cursor; CursorExpiredError if unusable."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        change_seq, issued_at = (int(part) for part in raw.split(":"))
+    except ValueError:
+        raise CursorExpiredError("Invalid cursor")
+    if time.time() - issued_at > get_settings().task_tombstone_retention_days * 86400:
+        raise CursorExpiredError("Cursor expired")
+    return change_seq
+
+
+def changes_since(
+    session: Session,
+    user_id: str,
+    since: int,
+    limit: int
+) -> Tuple[List[Sequence[Any]], List[int], int, bool]:
+    """
+    Up to `limit` changes after change_seq `since`, oldest first.
+
+    Returns (task rows of TASK_RESPONSE_COLUMNS, deleted task ids, change_seq
+    of the last change returned (since if none), has_more). since=0 returns
+    every live task: an initial full sync through the same endpoint.
+    """
+    rows = session.execute(
+        select(*TASK_RESPONSE_COLUMNS, Task.change_seq)
+        .where(Task.user_id == user_id, Task.change_seq > since)
+        .order_by(Task.change_seq)
+        .limit(limit + 1)
+    ).all()
+    tombstones = [] if since == 0 else session.execute(
+        select(TaskTombstone.change_seq, TaskTombstone.task_id)
+        .where(TaskTombstone.user_id == user_id, TaskTombstone.change_seq > since)
+        .order_by(TaskTombstone.change_seq)
+        .limit(limit + 1)
+    ).all()
+
+    # Merge both streams by change_seq and cut at `limit`
+    merged = sorted(
+        [(row[-1], row[:-1], None) for row in rows] + [(seq, None, task_id) for seq, task_id in tombstones],
+        key=lambda change: change[0],
+    )
+    has_more = len(merged) > limit
+    merged = merged[:limit]
+
+    changed = [task for _, task, _ in merged if task is not None]
+    deleted = [task_id for _, _, task_id in merged if task_id is not None]
+    last_seq = merged[-1][0] if merged else since
+    return changed, deleted, last_seq, has_more
+
+
+def changes_json(rows: List[Sequence[Any]], deleted: List[int], cursor: str, has_more: bool) -> bytes:
+    """TaskChangesResponse JSON (same task encoding as task_json)."""
+    return orjson.dumps({
+        "changed": [dict(zip(_ROW_FIELDS, row), tags=()) for row in rows],
+        "deleted": deleted,
+        "cursor": cursor,
+        "has_more": has_more,
+    })
+
+
+def prune_tombstones() -> int:
+    """Delete tombstones older than the retention; returns how many."""
+    horizon = datetime.utcnow() - timedelta(days=get_settings().task_tombstone_retention_days)
+    with Session(get_engine()) as session:
+        result = session.execute(delete(TaskTombstone).where(TaskTombstone.deleted_at < horizon))
+        session.commit()
+        return result.rowcount
+
+
+async def prune_tombstones_periodically(interval_seconds: float = 3600) -> None:
+    """Lifespan background task: prune_tombstones() every hour."""
+    while True:
+        try:
+            await asyncio.to_thread(prune_tombstones)
+        except Exception as e:
+            print(f"⚠️ Tombstone pruning failed: {e}")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,74 @@
+# File: backend/app/services/task_json.py
+# Fast JSON path for GET /tasks: row tuples encoded with orjson, sparse fieldsets
+#
+# The list endpoint selects exactly the TaskResponse columns and encodes the
+# rows directly, skipping ORM object hydration, TaskResponse validation
+# (from_attributes) and Pydantic serialization. The output is the same JSON
+# document as TaskListResponse. The OpenAPI schema still comes from the
+# endpoint's response_model. See benchmarks/task_list_serialization.py.
+#
+# GET /tasks?fields=id,title,completed selects and encodes only those
+# columns (sparse fieldsets), so long descriptions are neither read nor sent.
+
+from typing import Any, Optional, Sequence, Tuple
+
+import orjson
+
+from app.models.task import Task
+from app.schemas.task import TaskResponse
+
+# Column list derived from the response schema, so the two cannot drift
+# apart: a TaskResponse field without a Task column fails at import time.
+# `tags` is not a Task column; TaskResponse always reports it empty.
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+_ROW_FIELDS = tuple(name for name in TASK_FIELDS if name != "tags")
+TASK_RESPONSE_COLUMNS = tuple(getattr(Task, name) for name in _ROW_FIELDS)
+_NO_TAGS = ()
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a `fields=` value ("id,title,completed").
+
+    Returns the field names in schema order, id always included, or None
+    for all fields. Raises ValueError naming unknown fields.
+    """
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(TASK_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(sorted(unknown))}. Allowed: {', '.join(TASK_FIELDS)}"
+        )
+    requested.add("id")
+    return tuple(name for name in TASK_FIELDS if name in requested)
+
+
+def task_columns(fields: Optional[Tuple[str, ...]] = None) -> tuple:
+    """SELECT list for the requested fields (parse_fields result; None = all)."""
+    if fields is None:
+        return TASK_RESPONSE_COLUMNS
+    return tuple(getattr(Task, name) for name in fields if name != "tags")
+
+
+def task_list_json(
+    rows: Sequence[Sequence[Any]],
+    total: int,
+    completed: int,
+    pending: int,
+    fields: Optional[Tuple[str, ...]] = None
+) -> bytes:
+    """TaskListResponse JSON from rows of task_columns(fields)."""
+    row_fields = _ROW_FIELDS if fields is None else tuple(name for name in fields if name != "tags")
+    if fields is None or "tags" in fields:
+        tasks = [dict(zip(row_fields, row), tags=_NO_TAGS) for row in rows]
+    else:
+        tasks = [dict(zip(row_fields, row)) for row in rows]
+    # orjson encodes datetimes (ISO 8601, like Pydantic) and str enums natively
+    return orjson.dumps({
+        "tasks": tasks,
+        "total": total,
+        "completed": completed,
+        "pending": pending,
+    })
@@ -0,0 +1,216 @@
+# File: backend/app/services/task_list_cache.py
+# In-process cache of serialized GET /tasks responses, per user
+#
+# Key: (user_id, normalized filter/sort/page params). Value: the JSON body
+# and its ETag. A hit is answered without touching Postgres: not even the
+# user row is loaded (the JWT already names the user).
+#
+# Invalidation is explicit. Every write path that can change a task list
+# (routers/tasks.py, routers/tags.py, mcp/todo_tools.py) calls
+# invalidate_task_lists(session, user_id) before committing. The user's
+# entries are dropped when that session commits, never earlier, so a
+# concurrent reader cannot re-cache the pre-commit rows. A per-user
+# generation number also rejects results whose query started before the
+# commit.
+#
+# Cross-worker (TASK_LIST_CACHE_NOTIFY=true, needed with several workers or
+# replicas): the same commit sends a Postgres NOTIFY (delivered only if the
+# transaction commits). Every worker LISTENs and drops that user's entries.
+# Between the commit and the notification, another worker may serve the old
+# list for a few milliseconds.
+#
+# The same hooks feed GET /events (services/live_events.py): each change is
+# recorded with its kind ("tasks", or "tags" from routers/tags.py via
+# record_change) and pushed to the user's open streams in every worker.
+
+import asyncio
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.services.live_events import EVENT_KINDS, live_events
+from app.utils.metrics import TASK_LIST_CACHE_REQUESTS
+
+NOTIFY_CHANNEL = "task_list_cache"
+_PENDING_KEY = "task_list_invalidations"
+
+# Identifies this process in NOTIFY payloads, so it skips its own messages
+WORKER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class TaskListCache:
+    """Size-bounded LRU of (etag, body) per (user_id, params) key. Thread-safe."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = max_entries  # None: TASK_LIST_CACHE_SIZE, read on first use
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[str, bytes]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[Tuple[str, Hashable]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0  # Bumped by clear()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is None:
+            self._max_entries = get_settings().task_list_cache_size
+        return self._max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def generation(self, user_id: str) -> Tuple[int, int]:
+        """Read before running the list queries; pass to put()."""
+        return self._epoch, self._generations.get(user_id, 0)
+
+    def get(self, user_id: str, params: Hashable) -> Optional[Tuple[str, bytes]]:
+        key = (user_id, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        TASK_LIST_CACHE_REQUESTS.labels("hit" if entry else "miss").inc()
+        return entry
+
+    def put(self, user_id: str, params: Hashable, generation: Tuple[int, int], etag: str, body: bytes) -> None:
+        key = (user_id, params)
+        with self._lock:
+            # The user's tasks changed (or the cache was cleared) while this
+            # result was being built
+            if self.generation(user_id) != generation:
+                return
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                (old_user, old_params), _ = self._entries.popitem(last=False)
+                self._discard_key(old_user, (old_user, old_params))
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for key in self._keys_by_user.pop(user_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _discard_key(self, user_id: str, key: Tuple[str, Hashable]) -> None:
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+task_list_cache = TaskListCache()
+
+
+def task_list_params(**params) -> Hashable:
+    """Normalized cache key part: equivalent filters share one entry."""
+    if params.get("search"):
+        params["search"] = params["search"].lower()  # ILIKE: case does not matter
+    if params.get("tag_ids"):
+        params["tag_ids"] = tuple(sorted(set(params["tag_ids"])))
+    return tuple(sorted((name, value) for name, value in params.items() if value is not None))
+
+
+# ============================================================================
+# INVALIDATION
+# ============================================================================
+
+def invalidate_task_lists(session, user_id: str) -> None:
+    """
+    Drop the user's cached task lists once this session's transaction commits.
+
+    Works with Session and AsyncSession (their .info is shared). Call it in
+    the same transaction as the write, before commit.
+    """
+    record_change(session, user_id, "tasks")
+
+
+def record_change(session, user_id: str, kind: str) -> None:
+    """
+    Announce a change of `kind` (EVENT_KINDS) once this session commits.
+
+    Either kind also invalidates the task list cache: tag writes bump
+    users.data_version too, and a cached response must carry the same
+    ETag as a freshly built one (every worker answers alike).
+    """
+    session.info.setdefault(_PENDING_KEY, set()).add((user_id, kind))
+
+
+def _apply_change(user_id: str, kind: str) -> None:
+    task_list_cache.invalidate(user_id)
+    live_events.publish(user_id, kind)
+
+
+# SQLAlchemy also fires these hooks when a SAVEPOINT (begin_nested, one per
+# tool in a chat turn) is released or rolled back. Only the outermost
+# transaction counts: before that the rows are not visible to other
+# sessions, and a failed savepoint must not drop what earlier ones recorded.
+
+@event.listens_for(Session, "before_commit")
+def _notify_other_workers(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    pending = session.info.get(_PENDING_KEY)
+    if not pending or not get_settings().task_list_cache_notify:
+        return
+    # NOTIFY is transactional: listeners only hear it if the commit succeeds
+    for user_id, kind in pending:
+        session.execute(select(func.pg_notify(NOTIFY_CHANNEL, f"{WORKER_ID}:{kind}:{user_id}")))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    for user_id, kind in session.info.pop(_PENDING_KEY, ()):
+        _apply_change(user_id, kind)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def listen_for_invalidations() -> None:
+    """
+    LISTEN for other workers' changes (lifespan background task).
+
+    Reconnects after errors; on every (re)connect the whole cache is dropped
+    and every open stream is told to resync, because notifications sent
+    while disconnected are lost.
+    """
+    import psycopg
+
+    dsn = get_settings().database_url.replace("postgresql+psycopg2://", "postgresql://", 1)
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                task_list_cache.clear()
+                live_events.publish_all(*EVENT_KINDS)
+                async for notification in conn.notifies():
+                    worker_id, _, change = notification.payload.partition(":")
+                    kind, _, user_id = change.partition(":")
+                    if worker_id != WORKER_ID:
+                        _apply_change(user_id, kind)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ Task list cache listener disconnected: {e}")
+            task_list_cache.clear()
+            await asyncio.sleep(5)
@@ -0,0 +1,97 @@
+# File: backend/app/services/task_queries.py
+# Shared task filter vocabulary and set-based statements
+# Used by routers/tasks.py (REST) and mcp/todo_tools.py (AI agent tools)
+
+from typing import List, Optional, Dict, Any
+from sqlmodel import select, or_, func
+from sqlalchemy import update, delete
+
+from app.models.task import Task
+from app.models.tag import TaskTag
+
+# Task columns an update may not set to null (NOT NULL in the schema)
+NOT_NULL_TASK_FIELDS = ("title", "completed", "priority")
+
+
+def task_filter_clauses(
+    user_id: str,
+    completed: Optional[bool] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    tag_ids: Optional[List[int]] = None
+) -> list:
+    """
+    Build WHERE clauses for the task filter vocabulary of GET /tasks.
+
+    Multi-user isolation: the first clause is always user_id = user_id.
+
+    Filters:
+    - completed: Filter by completion status
+    - priority: Filter by priority level (high, medium, low)
+    - category: Filter by category name
+    - search: Search in title and description
+    - tag_ids: Tasks that have ANY of the specified tags
+    """
+    clauses = [Task.user_id == user_id]
+
+    if completed is not None:
+        clauses.append(Task.completed == completed)
+
+    if priority is not None:
+        clauses.append(Task.priority == priority)
+
+    if category is not None:
+        clauses.append(Task.category == category)
+
+    if search:
+        search_pattern = f"%{search}%"
+        clauses.append(
+            or_(
+                Task.title.ilike(search_pattern),
+                Task.description.ilike(search_pattern)
+            )
+        )
+
+    if tag_ids:
+        subquery = select(TaskTag.task_id).where(TaskTag.tag_id.in_(tag_ids))
+        clauses.append(Task.id.in_(subquery))
+
+    return clauses
+
+
+def count_by_filter_stmt(clauses: list):
+    """SELECT count(*) of the tasks matching the clauses (dry run)."""
+    return select(func.count()).select_from(Task).where(*clauses)
+
+
+def update_by_filter_stmt(clauses: list, values: Dict[str, Any]):
+    """Single UPDATE tasks SET ... WHERE <clauses>."""
+    return (
+        update(Task)
+        .where(*clauses)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_by_filter_stmt(clauses: list):
+    """
+    Single DELETE FROM tasks WHERE <clauses>.
+
+    task_tags rows of the matched tasks are removed in a data-modifying CTE
+    of the same statement (foreign keys are checked at statement end).
+    """
+    matched_ids = select(Task.id).where(*clauses)
+    deleted_tags = (
+        delete(TaskTag)
+        .where(TaskTag.task_id.in_(matched_ids))
+        .returning(TaskTag.id)
+        .cte("deleted_task_tags")
+    )
+    return (
+        delete(Task)
+        .where(*clauses)
+        .add_cte(deleted_tags)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,81 @@
+# File: backend/app/services/task_stats.py
+# GET /tasks/stats: the dashboard numbers in one aggregate query
+#
+# One statement, one scan of the user's tasks (an index-only scan of
+# ix_tasks_user_stats, migration 007):
+#   SELECT grouping(priority, category), priority, category,
+#          count(*), count(*) FILTER (WHERE completed), ...
+#   FROM tasks WHERE user_id = ?
+#   GROUP BY GROUPING SETS ((), priority, category)
+# returns the overall row, one row per priority and one per category.
+#
+# Due-date buckets count pending tasks only and use the client's calendar
+# day (due dates are stored as naive UTC, like every timestamp here).
+
+from datetime import datetime, timedelta
+from typing import Any, Dict
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, tuple_
+from sqlmodel import Session, select
+
+from app.models.task import Task
+
+# grouping(priority, category): a bit is set for each column rolled up
+_OVERALL, _BY_PRIORITY, _BY_CATEGORY = 0b11, 0b01, 0b10
+
+
+def _bucket(row) -> Dict[str, int]:
+    return {"total": row.total, "completed": row.completed, "pending": row.total - row.completed}
+
+
+def task_stats(session: Session, user_id: str, tz: ZoneInfo) -> Dict[str, Any]:
+    """TaskStatsResponse fields for the user; "today" is the current day in tz."""
+    now = datetime.utcnow()
+    local_midnight = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+    today_start = local_midnight.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+    tomorrow_start = today_start + timedelta(days=1)
+    week_end = today_start + timedelta(days=7)
+
+    pending = Task.completed.is_(False)
+    rows = session.execute(
+        select(
+            func.grouping(Task.priority, Task.category).label("grouping"),
+            Task.priority,
+            Task.category,
+            func.count().label("total"),
+            func.count().filter(Task.completed.is_(True)).label("completed"),
+            func.count().filter(pending, Task.due_date < now).label("overdue"),
+            func.count().filter(
+                pending, Task.due_date >= today_start, Task.due_date < tomorrow_start
+            ).label("due_today"),
+            func.count().filter(
+                pending, Task.due_date >= today_start, Task.due_date < week_end
+            ).label("due_this_week"),
+            func.coalesce(func.sum(Task.estimated_minutes).filter(pending), 0).label("minutes"),
+        )
+        .where(Task.user_id == user_id)
+        .group_by(func.grouping_sets(tuple_(), Task.priority, Task.category))
+    ).all()
+
+    stats: Dict[str, Any] = {
+        "total": 0, "completed": 0, "pending": 0,
+        "by_priority": {}, "by_category": [],
+        "overdue": 0, "due_today": 0, "due_this_week": 0,
+        "estimated_minutes_remaining": 0,
+    }
+    for row in rows:
+        if row.grouping == _OVERALL:
+            stats.update(
+                _bucket(row),
+                overdue=row.overdue,
+                due_today=row.due_today,
+                due_this_week=row.due_this_week,
+                estimated_minutes_remaining=row.minutes,
+            )
+        elif row.grouping == _BY_PRIORITY:
+            stats["by_priority"][row.priority] = _bucket(row)
+        elif row.grouping == _BY_CATEGORY:
+            stats["by_category"].append(dict(_bucket(row), category=row.category))
+    stats["by_category"].sort(key=lambda group: (-group["total"], group["category"] or ""))
+    return stats
@@ -0,0 +1,255 @@
+# File: backend/app/services/task_sync.py
+# POST /tasks/sync: apply a client's queued offline changes in one transaction
+#
+# The batch is folded in memory first: every operation is resolved to its
+# target task and the operations on one target are merged in order (a
+# create followed by updates becomes one inserted row, anything followed
+# by a delete becomes one delete). What remains is run as set-based
+# statements, however many operations there were:
+#   INSERT tasks VALUES (...), (...) RETURNING id       new tasks
+#   UPDATE tasks FROM (VALUES ...)                     one per set of changed columns
+#   DELETE FROM tasks WHERE id IN (...)                deleted tasks (+ task_tags)
+#   INSERT task_sync_ops VALUES (...), (...)           idempotency keys
+#
+# Every applied operation is recorded under its idempotency key. A replay
+# (the client lost the response and sends the queue again) reports those
+# operations as "duplicate" and applies only the rest. Operations that were
+# not applied (not_found, invalid) are not recorded: nothing changed, so
+# retrying them is harmless. Keys are kept as long as tombstones
+# (TASK_TOMBSTONE_RETENTION_DAYS): a client offline for longer has to
+# reload its list anyway.
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Integer, cast, column, delete, insert, or_, and_, update, values
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.database import get_engine
+from app.models.task import Task, TaskSyncOp
+from app.models.user import User
+from app.schemas.task import TaskSyncOperation, TaskSyncResult
+from app.services.task_list_cache import invalidate_task_lists
+from app.services.task_queries import NOT_NULL_TASK_FIELDS, delete_by_filter_stmt
+
+
+class _Target:
+    """A task touched by the batch, with the net effect of its operations."""
+
+    def __init__(self, task_id: Optional[int] = None, client_id: Optional[str] = None):
+        self.task_id = task_id  # None until a new task is inserted
+        self.client_id = client_id  # Set for tasks created in this batch
+        self.values: Dict[str, Any] = {}
+        self.deleted = False
+
+
+def apply_sync_operations(
+    session: Session,
+    user_id: str,
+    operations: List[TaskSyncOperation]
+) -> Tuple[Dict[str, int], List[TaskSyncResult]]:
+    """
+    Apply the operations in order; returns (client_id -> task id, per-op results).
+
+    Does not commit: the caller commits (or rolls back) the whole batch.
+    """
+    # Serialize with the user's other writers (the change_seq trigger takes
+    # the same lock): a concurrent replay of this batch waits, then sees
+    # its keys as recorded
+    session.execute(select(User.id).where(User.id == user_id).with_for_update(key_share=True))
+
+    keys = [operation.idempotency_key for operation in operations]
+    client_ids = {operation.client_id for operation in operations if operation.client_id}
+    recorded = session.execute(
+        select(TaskSyncOp.idempotency_key, TaskSyncOp.op, TaskSyncOp.client_id, TaskSyncOp.task_id)
+        .where(
+            TaskSyncOp.user_id == user_id,
+            or_(
+                TaskSyncOp.idempotency_key.in_(keys),
+                and_(TaskSyncOp.op == "create", TaskSyncOp.client_id.in_(client_ids)),
+            ),
+        )
+    ).all()
+    done = {key: task_id for key, _, _, task_id in recorded if key in keys}
+    known_clients = {client_id: task_id for _, op, client_id, task_id in recorded if op == "create"}
+
+    referenced = {operation.task_id for operation in operations if operation.task_id is not None}
+    referenced.update(task_id for task_id in known_clients.values() if task_id is not None)
+    owned = set(session.execute(
+        select(Task.id).where(Task.user_id == user_id, Task.id.in_(referenced))
+    ).scalars()) if referenced else set()
+
+    # ------------------------------------------------------------------
+    # Fold the operations into one net change per target
+    # ------------------------------------------------------------------
+    targets: Dict[Tuple[str, Any], _Target] = {}
+    applied: List[Tuple[TaskSyncOperation, _Target]] = []
+    results: List[Tuple[TaskSyncResult, Optional[_Target]]] = []
+    seen_keys: Dict[str, _Target] = {}
+
+    def resolve(operation: TaskSyncOperation) -> Optional[_Target]:
+        if operation.task_id is not None:
+            key = ("task", operation.task_id)
+            if operation.task_id not in owned:
+                return None
+        elif ("client", operation.client_id) in targets:
+            return targets[("client", operation.client_id)]
+        elif known_clients.get(operation.client_id) in owned:
+            key = ("task", known_clients[operation.client_id])
+        else:
+            return None
+        return targets.setdefault(key, _Target(task_id=key[1]))
+
+    for index, operation in enumerate(operations):
+        result = TaskSyncResult(index=index, op=operation.op, status="applied")
+        key = operation.idempotency_key
+
+        if key in done:
+            result.status, result.task_id = "duplicate", done[key]
+            results.append((result, None))
+            continue
+        if key in seen_keys:
+            result.status = "duplicate"
+            results.append((result, seen_keys[key]))
+            continue
+
+        target, error = None, None
+        if operation.op == "create":
+            if not operation.client_id or operation.task is None:
+                error = "create needs client_id and task"
+            elif operation.client_id in known_clients:
+                result.status, result.task_id = "duplicate", known_clients[operation.client_id]
+                results.append((result, None))
+                continue
+            elif ("client", operation.client_id) in targets:
+                error = f"client_id {operation.client_id!r} is already used in this batch"
+            else:
+                target = _Target(client_id=operation.client_id)
+                targets[("client", operation.client_id)] = target
+                target.values = operation.task.model_dump(exclude={"tag_ids"})
+        elif operation.task_id is None and not operation.client_id:
+            error = f"{operation.op} needs task_id or client_id"
+        elif operation.op == "update" and not (operation.changes and operation.changes.model_fields_set - {"tag_ids"}):
+            error = "update needs changes"
+        else:
+            target = resolve(operation)
+            if target is None or target.deleted:
+                result.status = "not_found"
+                results.append((result, None))
+                continue
+            if operation.op == "update":
+                changes = operation.changes.model_dump(exclude_unset=True, exclude={"tag_ids"})
+                nulls = [name for name in NOT_NULL_TASK_FIELDS if name in changes and changes[name] is None]
+                if nulls:
+                    error = f"{', '.join(nulls)} cannot be null"
+                else:
+                    target.values.update(changes)
+            elif operation.op == "complete":
+                target.values["completed"] = operation.completed
+            else:
+                target.deleted = True
+
+        if error:
+            result.status, result.error = "invalid", error
+            results.append((result, None))
+            continue
+        seen_keys[key] = target
+        applied.append((operation, target))
+        results.append((result, target))
+
+    # ------------------------------------------------------------------
+    # Run the net changes as set-based statements
+    # ------------------------------------------------------------------
+    now = datetime.utcnow()
+
+    created = [target for target in targets.values() if target.client_id and not target.deleted]
+    if created:
+        rows = [
+            {
+                "user_id": user_id, "description": None, "category": None, "due_date": None,
+                "estimated_minutes": None, "completed": False,
+                **target.values, "created_at": now, "updated_at": now,
+            }
+            for target in created
+        ]
+        new_ids = session.execute(
+            insert(Task.__table__).returning(Task.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+        for target, task_id in zip(created, new_ids):
+            target.task_id = task_id
+
+    by_columns: Dict[Tuple[str, ...], List[_Target]] = {}
+    for target in targets.values():
+        if not target.client_id and not target.deleted and target.values:
+            by_columns.setdefault(tuple(sorted(target.values)), []).append(target)
+    for names, group in by_columns.items():
+        session.execute(_update_from_values_stmt(user_id, names, group, now))
+
+    deleted_ids = [target.task_id for target in targets.values() if target.deleted and not target.client_id]
+    if deleted_ids:
+        session.execute(delete_by_filter_stmt([Task.user_id == user_id, Task.id.in_(deleted_ids)]))
+
+    if applied:
+        # Core inserts (not ORM bulk): one multi-row INSERT even when some rows have nulls
+        session.execute(insert(TaskSyncOp.__table__), [
+            {
+                "user_id": user_id,
+                "idempotency_key": operation.idempotency_key,
+                "op": operation.op,
+                "client_id": operation.client_id if operation.op == "create" else None,
+                "task_id": target.task_id,
+                "created_at": now,
+            }
+            for operation, target in applied
+        ])
+        invalidate_task_lists(session, user_id)
+
+    for result, target in results:
+        if target is not None:
+            result.task_id = target.task_id
+
+    id_map = {target.client_id: target.task_id for target in created}
+    for operation in operations:
+        task_id = known_clients.get(operation.client_id)
+        if task_id is not None:
+            id_map.setdefault(operation.client_id, task_id)
+    return id_map, [result for result, _ in results]
+
+
+def _update_from_values_stmt(user_id: str, names: Tuple[str, ...], targets: List[_Target], now: datetime):
+    """UPDATE tasks SET <names> = v.<names> FROM (VALUES (id, ...), ...) v WHERE id = v.id."""
+    table = Task.__table__
+    changes = values(
+        column("id", Integer), *(column(name, table.c[name].type) for name in names),
+        name="changes",
+    ).data([(target.task_id, *(target.values[name] for name in names)) for target in targets])
+    # VALUES columns are typed by Postgres from the literals (text for
+    # enums and all-null columns), hence the casts back to the column types
+    assignments = {name: cast(changes.c[name], table.c[name].type) for name in names}
+    return (
+        update(Task)
+        .where(Task.id == changes.c.id, Task.user_id == user_id)
+        .values(**assignments, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def prune_sync_ops() -> int:
+    """Delete idempotency keys older than the tombstone retention; returns how many."""
+    horizon = datetime.utcnow() - timedelta(days=get_settings().task_tombstone_retention_days)
+    with Session(get_engine()) as session:
+        result = session.execute(delete(TaskSyncOp).where(TaskSyncOp.created_at < horizon))
+        session.commit()
+        return result.rowcount
+
+
+async def prune_sync_ops_periodically(interval_seconds: float = 3600) -> None:
+    """Lifespan background task: prune_sync_ops() every hour."""
+    while True:
+        try:
+            await asyncio.to_thread(prune_sync_ops)
+        except Exception as e:
+            print(f"⚠️ Sync key pruning failed: {e}")
+        await asyncio.sleep(interval_seconds)
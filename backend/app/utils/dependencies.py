@@ -1,11 +1,14 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
-from app.database import get_session
+from sqlmodel import Session
+from app.database import get_engine, get_session
 from app.models.user import User
 from app.utils.security import verify_token
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -25,6 +28,56 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return load_user(session, user_id)
+
+
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """
+    The authenticated user's id from the JWT alone, without a database query.
+
+    For endpoints that can answer from a per-user cache (GET /tasks); they
+    must load the user with load_user() before touching the database.
+    """
+    user_id = verify_token(credentials.credentials)
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return user_id
+
+
+async def get_stream_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    access_token: Optional[str] = Query(None, description="JWT, for clients that cannot send headers (EventSource)"),
+) -> str:
+    """
+    get_current_user_id for streaming endpoints (GET /events).
+
+    Browsers' EventSource cannot set an Authorization header, so the token
+    may also come as ?access_token=. No database query: an open stream
+    must not hold a pooled connection.
+    """
+    token = credentials.credentials if credentials else access_token
+    user_id = verify_token(token) if token else None
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return user_id
+
+
+def load_user(session: Session, user_id: str) -> User:
+    """Load the user named by a verified token (401 if it no longer exists)."""
     user = session.get(User, user_id)
     if user is None:
         raise HTTPException(
@@ -32,5 +85,40 @@ async def get_current_user(
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+    return user
+
+
+async def get_current_user_detached(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> User:
+    """
+    Like get_current_user, but loads the user in a short-lived session that
+    is closed before the endpoint runs.
+
+    Use it for long-running endpoints (AI chat) that must not hold a pooled
+    connection for the whole request. The returned User is detached: only
+    its loaded columns are available.
+    """
+    token = credentials.credentials
+    user_id = verify_token(token)
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    with Session(get_engine()) as session:
+        user = session.get(User, user_id)
+        if user is not None:
+            session.expunge(user)
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     return user
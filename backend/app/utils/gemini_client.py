@@ -3,29 +3,40 @@
 # Spec: specs/001-competition-todo-app/spec.md § Phase III (AI Chatbot)
 
 import google.generativeai as genai
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, NamedTuple
+import asyncio
+import json
 import os
+import time
+from functools import lru_cache
 
-from app.mcp.todo_tools import GEMINI_TOOLS
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.user import User
+from app.mcp.todo_tools import GEMINI_TOOLS, execute_tool_async
+from app.utils.metrics import observe_llm_call, observe_tool_call
+from app.utils.tracing import tracer
 
 
 # ============================================================================
 # GEMINI API CONFIGURATION
 # ============================================================================
 
-# Initialize Gemini API with user's API key
+# The API key is applied on first use (see _configure_genai), not at import
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-genai.configure(api_key=GEMINI_API_KEY)
 
 # Model configuration
 MODEL_NAME = "gemini-1.5-flash"  # Free tier, fast, function calling support
 
-# System instructions for the AI assistant
-SYSTEM_INSTRUCTION = """You are a helpful AI assistant integrated into a todo list application.
+# System instructions for the AI assistant. The tool list comes from the
+# declarations, so every tool the model is given is named here.
+_TOOL_NAMES = ", ".join(tool["name"] for tool in GEMINI_TOOLS)
+SYSTEM_INSTRUCTION = f"""You are a helpful AI assistant integrated into a todo list application.
 
 Your role:
 - Help users manage their tasks through natural conversation
-- Use the provided tools (add_task, list_tasks, complete_task, delete_task, update_task) to interact with their todo list
+- Use the provided tools ({_TOOL_NAMES}) to interact with their todo list
 - Be conversational and friendly
 - Confirm actions after completing them
 - If users ask questions unrelated to tasks, answer politely but gently remind them this is a todo app
@@ -36,11 +47,43 @@ When users say things like:
 - "Mark task 3 as done" → Use complete_task tool
 - "Delete task 5" → Use delete_task tool
 - "Change task 2 to 'Call mom tonight'" → Use update_task tool
+- "Add milk, eggs and bread" → Use add_tasks tool (one call for all items)
+- "Complete tasks 3, 4 and 9" → Use complete_tasks tool
+- "Delete tasks 2 and 5" → Use delete_tasks tool
+- "Complete all shopping tasks" / "Delete all completed tasks" → Use bulk_update_by_filter tool
+
+When the user names several items or task IDs, call the batch tool once instead of
+repeating single-task calls. For "all tasks that ..." use bulk_update_by_filter
+instead of listing the tasks first.
 
 Always confirm what you did after using a tool.
 Be concise but friendly."""
 
 
+def _gemini_schema(value: Any) -> Any:
+    """
+    Adapt the JSON-schema style GEMINI_TOOLS to the SDK's Schema proto,
+    whose type enum is upper case (OBJECT, STRING, ...).
+    """
+    if isinstance(value, dict):
+        return {
+            key: item.upper() if key == "type" and isinstance(item, str) else _gemini_schema(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_gemini_schema(item) for item in value]
+    return value
+
+
+FUNCTION_DECLARATIONS = _gemini_schema(GEMINI_TOOLS)
+
+
+@lru_cache()
+def _configure_genai() -> None:
+    """Initialize Gemini API with user's API key (once per process)."""
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+
+
 # ============================================================================
 # GEMINI CLIENT
 # ============================================================================
@@ -55,9 +98,10 @@ class GeminiClient:
 
     def __init__(self):
         """Initialize Gemini model with tools and configuration"""
+        _configure_genai()
         self.model = genai.GenerativeModel(
             model_name=MODEL_NAME,
-            tools=GEMINI_TOOLS,
+            tools=FUNCTION_DECLARATIONS,
             system_instruction=SYSTEM_INSTRUCTION
         )
 
@@ -187,9 +231,168 @@ class GeminiClient:
             return str(tool_result)
 
 
+# ============================================================================
+# ASYNC AGENT (native function-calling loop)
+# ============================================================================
+
+class GeminiToolCall(NamedTuple):
+    """Mirrors the .tool/.tool_input fields of a LangChain AgentAction."""
+    tool: str
+    tool_input: Dict[str, Any]
+
+
+def _plain_args(value: Any) -> Any:
+    """
+    Convert function-call args (protobuf Struct) to plain Python values.
+
+    Struct numbers are doubles, so whole numbers become ints again
+    (task ids).
+    """
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return {key: _plain_args(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) or (hasattr(value, "__iter__") and not isinstance(value, str)):
+        return [_plain_args(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class AsyncGeminiAgent:
+    """
+    Async Gemini backend for the chat agent.
+
+    Uses the SDK's async API (send_message_async) so the event loop is never
+    blocked, and runs the function-calling loop itself: every function call
+    in a model turn is executed with execute_tool_async - parallel calls
+    concurrently, each on its own AsyncSession - and all results are sent
+    back in a single message. The chat session is built once per turn and
+    reused for every step of the loop.
+
+    ainvoke() follows the AgentExecutor contract used by run_agent:
+    takes {"input", "chat_history"} and returns {"output",
+    "intermediate_steps"}, plus "iterations" (LLM calls) for metrics.
+    LLM and tool latency are recorded here since there are no LangChain
+    callbacks on this path (tool spans come from @traced in todo_tools).
+    """
+
+    metadata = {"llm_provider": "gemini"}
+
+    def __init__(
+        self,
+        user: User,
+        unit_of_work: Optional[AsyncSession] = None,
+        max_iterations: int = 5,
+        max_execution_time: float = 25
+    ):
+        self.user = user
+        self.unit_of_work = unit_of_work
+        self.max_iterations = max_iterations
+        self.max_execution_time = max_execution_time
+        _configure_genai()
+        self.model = genai.GenerativeModel(
+            model_name=MODEL_NAME,
+            tools=FUNCTION_DECLARATIONS,
+            system_instruction=SYSTEM_INSTRUCTION
+        )
+
+    async def _execute(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one function call on its own session (or the unit of work)."""
+        started = time.perf_counter()
+        if self.unit_of_work is not None:
+            result = await execute_tool_async(name, args, self.unit_of_work, self.user, commit=False)
+        else:
+            async with AsyncSessionLocal() as session:
+                result = await execute_tool_async(name, args, session, self.user)
+        observe_tool_call(name, time.perf_counter() - started, ok=result.get("success") is not False)
+        return result
+
+    async def _send(self, chat_session, content):
+        """send_message_async with latency and token metrics and an llm.gemini span."""
+        with tracer.start_as_current_span("llm.gemini", attributes={"llm.provider": "gemini"}) as span:
+            started = time.perf_counter()
+            response = await chat_session.send_message_async(content)
+            usage = getattr(response, "usage_metadata", None)
+            prompt_tokens = getattr(usage, "prompt_token_count", None)
+            completion_tokens = getattr(usage, "candidates_token_count", None)
+            span.set_attribute("llm.prompt_tokens", prompt_tokens or 0)
+            span.set_attribute("llm.completion_tokens", completion_tokens or 0)
+        observe_llm_call("gemini", time.perf_counter() - started, prompt_tokens, completion_tokens)
+        return response
+
+    async def _execute_all(self, calls: List[GeminiToolCall]) -> List[Dict[str, Any]]:
+        """Run a model turn's function calls; concurrently unless sharing a session."""
+        if self.unit_of_work is not None:
+            return [await self._execute(call.tool, call.tool_input) for call in calls]
+        return await asyncio.gather(*(self._execute(call.tool, call.tool_input) for call in calls))
+
+    async def _run(
+        self,
+        message: str,
+        history: List[Dict[str, Any]],
+        intermediate_steps: List[Any]
+    ) -> Dict[str, Any]:
+        chat_session = self.model.start_chat(history=history)
+        response = await self._send(chat_session, message)
+
+        for iteration in range(1, self.max_iterations + 1):
+            parts = response.candidates[0].content.parts if response.candidates else []
+            calls = [
+                GeminiToolCall(part.function_call.name, _plain_args(part.function_call.args))
+                for part in parts
+                if getattr(part, "function_call", None) and part.function_call.name
+            ]
+            if not calls:
+                text = "".join(part.text for part in parts if getattr(part, "text", None))
+                return {"output": text, "intermediate_steps": intermediate_steps, "iterations": iteration}
+
+            results = await self._execute_all(calls)
+            intermediate_steps.extend(zip(calls, results))
+
+            # Struct values must be plain JSON types (enums -> strings)
+            response = await self._send(chat_session, [
+                genai.protos.Part(function_response=genai.protos.FunctionResponse(
+                    name=call.tool,
+                    response=json.loads(json.dumps(result, default=str))
+                ))
+                for call, result in zip(calls, results)
+            ])
+
+        return {
+            "output": "Agent stopped due to max iterations.",
+            "intermediate_steps": intermediate_steps,
+            "iterations": self.max_iterations + 1
+        }
+
+    async def ainvoke(self, inputs: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run one chat turn. chat_history holds LangChain messages; config is ignored."""
+        history = [
+            {
+                "role": "user" if msg.type == "human" else "model",
+                "parts": [msg.content]
+            }
+            for msg in inputs.get("chat_history") or []
+        ]
+        # Filled as tools run, so a timeout still reports the completed calls
+        intermediate_steps: List[Any] = []
+        try:
+            return await asyncio.wait_for(
+                self._run(inputs["input"], history, intermediate_steps),
+                timeout=self.max_execution_time
+            )
+        except asyncio.TimeoutError:
+            # Same result as AgentExecutor(early_stopping_method="force") at
+            # max_execution_time (wait_for's TimeoutError has no message)
+            return {
+                "output": "Agent stopped due to iteration limit or time limit.",
+                "intermediate_steps": intermediate_steps,
+            }
+
+
 # ============================================================================
 # SINGLETON INSTANCE
 # ============================================================================
 
-# Create a single instance to reuse across requests
-gemini_client = GeminiClient()
+@lru_cache()
+def get_gemini_client() -> GeminiClient:
+    """Single instance reused across requests, created on first call."""
+    return GeminiClient()
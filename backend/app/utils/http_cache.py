@@ -0,0 +1,62 @@
+# File: backend/app/utils/http_cache.py
+# Conditional GETs (ETag / If-None-Match) for the per-user list endpoints
+#
+# users.data_version is bumped by database triggers on every task, tag and
+# task_tag change (migration 003), whichever path made it: REST, the AI
+# tools, bulk-by-filter. The current user is already loaded for auth, so a
+# revalidation that ends in 304 costs no query beyond that.
+#
+# The version is read before the list queries run. A write committed in
+# between can only make the body newer than its ETag, which costs the
+# client one extra 200 later, never a stale 304.
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.models.user import User
+
+# Browsers (axios/XHR included) store the response and revalidate it on every
+# use: the 304 replaces the body the frontend refetches on window focus
+CACHE_CONTROL = "private, no-cache"
+
+
+def user_data_etag(user: User) -> str:
+    """Weak ETag of everything the user can list: identity + data version."""
+    # The user part keeps a shared browser from matching another account's cache
+    owner = hashlib.sha256(user.id.encode()).hexdigest()[:12]
+    return f'W/"{owner}-{user.data_version}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def conditional_get(request: Request, response: Response, user: User) -> Optional[Response]:
+    """
+    Set ETag/Cache-Control on the response; return a 304 if the client's copy is current.
+
+    Call it first thing in a list endpoint and return its result when not None.
+    """
+    return conditional_get_for_etag(request, response, user_data_etag(user))
+
+
+def conditional_get_for_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """conditional_get() for an ETag computed earlier (cached responses)."""
+    headers = etag_headers(etag)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
@@ -0,0 +1,215 @@
+# File: backend/app/utils/metrics.py
+# Prometheus metrics: HTTP latency, DB pool, LLM calls, agent iterations, tools,
+# task list cache, N+1 queries
+#
+# Exposed at GET /metrics (see main.py). With several uvicorn/gunicorn
+# workers set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory so
+# /metrics aggregates all worker processes.
+
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+
+# ============================================================================
+# METRIC DEFINITIONS
+# ============================================================================
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection (includes new connects)",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30),
+)
+POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative: pool not yet filled)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+LLM_LATENCY = Histogram(
+    "llm_request_duration_seconds",
+    "Latency of a single LLM call",
+    ["provider"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "Tokens reported by the LLM provider",
+    ["provider", "kind"],  # kind: prompt | completion
+)
+AGENT_ITERATIONS = Histogram(
+    "agent_iterations_per_turn",
+    "LLM calls made by the agent for one chat turn",
+    ["provider"],
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10),
+)
+TOOL_LATENCY = Histogram(
+    "agent_tool_duration_seconds",
+    "Agent tool execution latency by tool name",
+    ["tool", "outcome"],  # outcome: ok | error
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+TASK_LIST_CACHE_REQUESTS = Counter(
+    "task_list_cache_requests_total",
+    "GET /tasks lookups in the per-user response cache",
+    ["result"],  # result: hit | miss
+)
+
+LIVE_EVENT_STREAMS = Gauge(
+    "live_event_streams",
+    "Open GET /events streams in this worker",
+)
+
+SQL_N_PLUS_ONE = Counter(
+    "sql_n_plus_one_total",
+    "Requests repeating one SQL statement shape more than SQL_N_PLUS_ONE_THRESHOLD times",
+)
+
+
+def observe_llm_call(
+    provider: str,
+    seconds: float,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None
+) -> None:
+    """Record one LLM call (used by AgentTelemetryCallback and AsyncGeminiAgent)."""
+    LLM_LATENCY.labels(provider).observe(seconds)
+    if prompt_tokens:
+        LLM_TOKENS.labels(provider, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(provider, "completion").inc(completion_tokens)
+
+
+def observe_tool_call(tool: str, seconds: float, ok: bool = True) -> None:
+    """Record one tool execution."""
+    TOOL_LATENCY.labels(tool, "ok" if ok else "error").observe(seconds)
+
+
+# ============================================================================
+# HTTP MIDDLEWARE
+# ============================================================================
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware recording request latency by route template.
+
+    The label is the matched route's path ("/tasks/{task_id}"), never the raw
+    URL, so label cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app, skip_paths=("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the (shared) scope
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", "<unmatched>"),
+                str(status_code),
+            ).observe(time.perf_counter() - start)
+
+
+def metrics_response_body() -> bytes:
+    """Prometheus text exposition of all metrics (all workers in multiprocess mode)."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+
+# ============================================================================
+# DB POOL INSTRUMENTATION
+# ============================================================================
+
+def timed_pool_class(base: type, name: str) -> type:
+    """
+    Subclass a SQLAlchemy pool class so checkout wait time is observed.
+
+    _do_get() is where a checkout blocks on an exhausted pool (or opens a
+    new connection), so its duration is the wait a request pays for a
+    connection. Pass the result as create_engine(poolclass=...).
+    """
+    class TimedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                POOL_CHECKOUT_WAIT.labels(name).observe(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def instrument_pool(pool: Pool, name: str) -> None:
+    """Keep the in-use / overflow / size gauges current via pool events."""
+    in_use = POOL_IN_USE.labels(name)
+    overflow = POOL_OVERFLOW.labels(name)
+    POOL_SIZE.labels(name).set(pool.size())
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        in_use.inc()
+        overflow.set(pool.overflow())
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        in_use.dec()
+        overflow.set(pool.overflow())
+
@@ -0,0 +1,148 @@
+# File: backend/app/utils/query_stats.py
+# Per-request SQL statement counter, Server-Timing header and N+1 detection
+#
+# QueryStatsMiddleware puts a RequestQueryStats in a context variable; the
+# cursor execute events of both engines (see instrument_query_stats) add
+# every statement run on behalf of that request - sync handlers in the
+# threadpool and async agent tools included, since the context is copied.
+#
+# Response header:
+#   Server-Timing: db;dur=12.40;desc="7 queries", app;dur=48.10
+#
+# A request running the same statement shape more than
+# SQL_N_PLUS_ONE_THRESHOLD times is logged and counted (sql_n_plus_one_total).
+# With SQL_N_PLUS_ONE_RAISE=true (the test suite) it raises NPlusOneQueryError
+# at the offending statement instead - a 500 with a traceback pointing at the
+# loop - unless the request has already committed: failing then would report
+# an error for a write that happened.
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.utils.metrics import SQL_N_PLUS_ONE
+
+
+class NPlusOneQueryError(RuntimeError):
+    """One request repeated the same SQL statement shape too many times."""
+
+
+class RequestQueryStats:
+    """SQL statements and DB time of one request."""
+
+    __slots__ = ("count", "db_seconds", "shapes", "reported", "committed")
+
+    def __init__(self):
+        self.count = 0
+        self.db_seconds = 0.0
+        self.shapes: Counter = Counter()
+        self.reported = False  # One N+1 report (or error) per request
+        self.committed = False  # A transaction of this request has committed
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.count} queries", '
+            f"app;dur={total_seconds * 1000:.2f}"
+        )
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists (POSTCOMPILE) differ only in the number of placeholders
+_IN_LIST = re.compile(r"IN \((?:%\([^)]*\)s(?:, )?)+\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with whitespace and IN-list lengths normalized."""
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def n_plus_one_threshold() -> int:
+    """Repeats of one statement shape per request before an N+1 is reported (0 = off)."""
+    return get_settings().sql_n_plus_one_threshold
+
+
+# ============================================================================
+# ENGINE EVENTS
+# ============================================================================
+
+def instrument_query_stats(engine: Engine) -> None:
+    """Count statements and DB time per request. For an AsyncEngine pass .sync_engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and _current_stats.get() is not None:
+            context._query_stats_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = getattr(context, "_query_stats_start", None)
+        if stats is None or started is None:
+            return
+        stats.count += 1
+        stats.db_seconds += time.perf_counter() - started
+
+        threshold = n_plus_one_threshold()
+        if not threshold:
+            return
+        shape = statement_shape(statement)
+        stats.shapes[shape] += 1
+        if stats.shapes[shape] <= threshold or stats.reported:
+            return
+        stats.reported = True  # Once; the rollback must not re-trigger it
+        SQL_N_PLUS_ONE.inc()
+        message = (
+            f"N+1 query: statement executed {stats.shapes[shape]} times in one request "
+            f"(SQL_N_PLUS_ONE_THRESHOLD={threshold}): {shape[:300]}"
+        )
+        if get_settings().sql_n_plus_one_raise and not stats.committed:
+            raise NPlusOneQueryError(message)
+        print(f"⚠️ {message}")
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    stats = _current_stats.get()
+    if stats is not None and not session.in_nested_transaction():
+        stats.committed = True
+
+
+# ============================================================================
+# HTTP MIDDLEWARE
+# ============================================================================
+
+class QueryStatsMiddleware:
+    """ASGI middleware collecting RequestQueryStats and adding Server-Timing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing(time.perf_counter() - start).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from passlib.context import CryptContext
 import jwt
-from app.config import settings
+from app.config import get_settings
 
 # Bcrypt password hashing with cost factor 12 (security requirement)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
@@ -25,6 +25,7 @@ def create_access_token(user_id: str) -> tuple[str, datetime]:
     Returns:
         tuple: (token, expiration_datetime)
     """
+    settings = get_settings()
     expires_at = datetime.utcnow() + timedelta(days=settings.jwt_expiration_days)
     payload = {
         "sub": user_id,
@@ -42,6 +43,7 @@ def verify_token(token: str) -> Optional[str]:
     Returns:
         str: user_id if token is valid, None otherwise
     """
+    settings = get_settings()
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         user_id: str = payload.get("sub")
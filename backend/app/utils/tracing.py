@@ -0,0 +1,238 @@
+# File: backend/app/utils/tracing.py
+# OpenTelemetry tracing: router, SQL, agent, LLM and tool spans
+#
+# Spans are created through the OpenTelemetry API everywhere; until
+# setup_tracing() installs an SDK provider they are no-ops, so tracing costs
+# nothing when TRACING_EXPORTER=none (the default).
+#
+# Exporters (TRACING_EXPORTER):
+#   file    - JSON lines in TRACING_FILE, works offline (default traces.jsonl)
+#   otlp    - OTLP/HTTP to OTLP_ENDPOINT (local collector, Jaeger, Tempo, ...)
+#   console - pretty-printed spans on stdout
+#
+# Span tree of a chat turn:
+#   POST /chat
+#     chat.load_history -> SQL SELECT ...
+#     agent.run
+#       llm.groq (tokens)            tool.list_tasks -> SQL SELECT ...
+#     chat.persist_turn -> SQL INSERT ...
+
+import functools
+import inspect
+import json
+import threading
+from typing import Any, Callable, Optional, Sequence
+
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+
+tracer = trace.get_tracer("todo-backend")
+
+SQL_STATEMENT_MAX_CHARS = 500
+
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+class JsonLinesSpanExporter:
+    """SpanExporter writing one JSON object per finished span to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = [json.dumps(json.loads(span.to_json()), separators=(",", ":")) for span in spans]
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def setup_tracing() -> bool:
+    """
+    Install the SDK tracer provider for settings.tracing_exporter.
+
+    Returns False (spans stay no-ops) when tracing is off or the SDK /
+    exporter packages are not installed.
+    """
+    settings = get_settings()
+    exporter_name = settings.tracing_exporter.lower()
+    if exporter_name == "none":
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+        if exporter_name == "otlp":
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            exporter = OTLPSpanExporter(endpoint=settings.otlp_endpoint)
+        elif exporter_name == "file":
+            exporter = JsonLinesSpanExporter(settings.tracing_file)
+        elif exporter_name == "console":
+            exporter = ConsoleSpanExporter()
+        else:
+            print(f"⚠️ Unknown TRACING_EXPORTER={settings.tracing_exporter!r}, tracing disabled")
+            return False
+    except ImportError as e:
+        print(f"⚠️ Tracing disabled, OpenTelemetry SDK/exporter not installed: {e}")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.tracing_service_name}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    print(f"🔭 Tracing enabled ({exporter_name})")
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans (BatchSpanProcessor) on application shutdown."""
+    provider = trace.get_tracer_provider()
+    if hasattr(provider, "shutdown"):
+        provider.shutdown()
+
+
+# ============================================================================
+# FUNCTION SPANS
+# ============================================================================
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator: run the function (sync or async) inside a span.
+
+    Tool functions return {"success": ...}; that flag is recorded as the
+    tool.success attribute and a failed result marks the span as an error.
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        def record(span, result):
+            if isinstance(result, dict) and "success" in result:
+                span.set_attribute("tool.success", bool(result["success"]))
+                if result["success"] is False:
+                    span.set_status(Status(StatusCode.ERROR, str(result.get("error", ""))[:200]))
+            return result
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(span_name) as span:
+                    return record(span, await fn(*args, **kwargs))
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name) as span:
+                return record(span, fn(*args, **kwargs))
+        return wrapper
+
+    return decorator
+
+
+# ============================================================================
+# HTTP MIDDLEWARE
+# ============================================================================
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per request.
+
+    The span is renamed to "METHOD /route/{template}" once the router has
+    matched, so every handler (and the SQL it runs) is one subtree.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}",
+            kind=trace.SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None and hasattr(route, "path"):
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+
+
+# ============================================================================
+# SQL SPANS (ENGINE EVENTS)
+# ============================================================================
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    One CLIENT span per SQL statement via cursor execute events.
+
+    For an AsyncEngine pass async_engine.sync_engine.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if not _sdk_installed():
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        span = tracer.start_span(
+            f"SQL {operation}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.operation": operation,
+                "db.statement": statement[:SQL_STATEMENT_MAX_CHARS],
+            },
+        )
+        if context is not None:
+            context._otel_span = span
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_otel_span", None)
+        if span is not None:
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                span.set_attribute("db.rowcount", cursor.rowcount)
+            span.end()
+            context._otel_span = None
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, "_otel_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+            context._otel_span = None
+
+
+def _sdk_installed() -> bool:
+    """True once setup_tracing() replaced the default no-op provider."""
+    return not isinstance(trace.get_tracer_provider(), (trace.ProxyTracerProvider, trace.NoOpTracerProvider))
@@ -0,0 +1,258 @@
+# File: backend/benchmarks/chat_latency.py
+# Chat latency benchmark: replay recorded LLM transcripts through the agent
+#
+# Usage (from backend/, DATABASE_URL and JWT_SECRET set):
+#   python benchmarks/chat_latency.py                   # compare with the stored baseline
+#   python benchmarks/chat_latency.py --save            # accept current numbers as baseline
+#   python benchmarks/chat_latency.py --time-scale 0    # no simulated LLM latency (CI)
+#
+# Every scenario in data/chat_transcripts.json is run through the real
+# create_agent()/run_agent() path: the SYSTEM_PROMPT, the tool schemas from
+# langchain_tools.py and the real tools against Postgres. Only the model is
+# replaced by TranscriptChatModel, which returns the recorded responses in
+# order, sleeping for the recorded latency adjusted for the prompt size
+# actually sent. A longer system prompt or tool description therefore
+# shows up as more prompt tokens and more wall time, and a transcript
+# recorded from another model shows its LLM calls per turn.
+#
+# Reported per scenario: LLM calls, prompt/completion tokens, tool calls,
+# wall time (median of --repeat runs).
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from sqlalchemy import delete, insert, select
+from sqlmodel import Session
+
+from app.database import get_engine
+from app.models.tag import TaskTag
+from app.models.task import Task
+from app.models.user import User
+from app.services.agent_service import create_agent, run_agent
+from loadtest.seed import task_row
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TRANSCRIPTS = os.path.join(DATA_DIR, "chat_transcripts.json")
+BASELINE = os.path.join(DATA_DIR, "chat_baseline.json")
+
+BENCH_USER_ID = "benchmark-chat-user"
+BENCH_TASK_COUNT = 40
+
+
+def estimate_tokens(text: str) -> int:
+    """Same ~4 characters per token estimate as the tools' token budget."""
+    return max(1, len(text) // 4)
+
+
+# ============================================================================
+# REPLAY MODEL
+# ============================================================================
+
+class TranscriptChatModel(BaseChatModel):
+    """
+    Chat model returning a scenario's recorded responses in order.
+
+    Latency per call = recorded latency_ms + (prompt tokens sent - prompt
+    tokens at recording time) * prefill_ms_per_token, times time_scale.
+    Calls beyond the recording get a short final answer (and are counted).
+    """
+
+    responses: List[Dict[str, Any]]
+    time_scale: float = 1.0
+    prefill_ms_per_token: float = 0.1
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _next(self, messages: List[BaseMessage], tools: Optional[list]):
+        recorded = self.responses[self.calls] if self.calls < len(self.responses) else {
+            "latency_ms": 300, "prompt_tokens": 0, "completion_tokens": 5, "content": "Done."
+        }
+        self.calls += 1
+
+        prompt_text = json.dumps(tools or []) + "".join(
+            str(message.content) + json.dumps(getattr(message, "tool_calls", None) or [])
+            for message in messages
+        )
+        prompt_tokens = estimate_tokens(prompt_text)
+        completion_tokens = recorded.get("completion_tokens", 0)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+        extra_prefill_ms = (prompt_tokens - recorded.get("prompt_tokens", prompt_tokens)) * self.prefill_ms_per_token
+        delay = max(0.0, recorded["latency_ms"] + extra_prefill_ms) * self.time_scale / 1000
+
+        message = AIMessage(
+            content=recorded.get("content", ""),
+            tool_calls=[
+                {"name": call["name"], "args": call["args"], "id": f"call_{self.calls}_{i}"}
+                for i, call in enumerate(recorded.get("tool_calls", []))
+            ],
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+        return delay, ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        delay, result = self._next(messages, tools)
+        time.sleep(delay)
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, tools=None, **kwargs) -> ChatResult:
+        delay, result = self._next(messages, tools)
+        await asyncio.sleep(delay)
+        return result
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def reset_bench_user() -> User:
+    """Benchmark user with a fixed set of tasks, so every run sees the same data."""
+    with Session(get_engine()) as session:
+        user = session.get(User, BENCH_USER_ID)
+        if user is None:
+            user = User(id=BENCH_USER_ID, email="benchmark-chat@example.com",
+                        name="Chat Benchmark", password_hash="!")
+            session.add(user)
+            session.flush()
+        session.execute(delete(TaskTag).where(TaskTag.task_id.in_(
+            select(Task.id).where(Task.user_id == BENCH_USER_ID)
+        )))
+        session.execute(delete(Task).where(Task.user_id == BENCH_USER_ID))
+        rng, now = random.Random(7), datetime.utcnow()
+        session.execute(insert(Task), [task_row(rng, BENCH_USER_ID, now) for _ in range(BENCH_TASK_COUNT)])
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
+        return user
+
+
+async def run_scenario(scenario: Dict[str, Any], user: User, args) -> Dict[str, Any]:
+    llm = TranscriptChatModel(
+        responses=scenario["llm_responses"],
+        time_scale=args.time_scale,
+        prefill_ms_per_token=args.prefill_ms_per_token,
+    )
+    agent = create_agent(None, user, llm=llm)
+
+    start = time.perf_counter()
+    result = await run_agent(agent, scenario["input"], scenario.get("chat_history") or [])
+    wall = time.perf_counter() - start
+
+    return {
+        "llm_calls": llm.calls,
+        "prompt_tokens": llm.prompt_tokens,
+        "completion_tokens": llm.completion_tokens,
+        "tool_calls": len(result.get("tool_calls") or []),
+        "wall_ms": wall * 1000,
+        "error": result.get("error"),
+    }
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Scenarios needing more LLM/tool calls, or more tokens / time than allowed."""
+    regressions = []
+    for name, row in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key in ("llm_calls", "tool_calls"):
+            if row[key] > base[key]:
+                regressions.append(f"{name}: {key} {base[key]} -> {row[key]}")
+        if row["prompt_tokens"] > base["prompt_tokens"] * (1 + tolerance / 4):
+            regressions.append(f"{name}: prompt_tokens {base['prompt_tokens']} -> {row['prompt_tokens']}")
+        if base["wall_ms"] and row["wall_ms"] > base["wall_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: wall_ms {base['wall_ms']:.0f} -> {row['wall_ms']:.0f}")
+    return regressions
+
+
+async def main_async(args) -> int:
+    with open(args.transcripts) as f:
+        scenarios = json.load(f)
+    if args.scenario:
+        scenarios = [s for s in scenarios if s["scenario"] in args.scenario]
+
+    user = reset_bench_user()
+    report: Dict[str, Dict[str, Any]] = {}
+    for scenario in scenarios:
+        runs = []
+        for _ in range(args.repeat):
+            runs.append(await run_scenario(scenario, user, args))
+            user = reset_bench_user()  # Writes of one run must not leak into the next
+        row = dict(runs[-1])
+        row["wall_ms"] = round(statistics.median(run["wall_ms"] for run in runs), 1)
+        report[scenario["scenario"]] = row
+
+    print(f"{'scenario':<28} {'llm':>4} {'prompt tok':>10} {'compl tok':>9} {'tools':>5} {'wall ms':>9}")
+    for name, row in report.items():
+        error = f"  ERROR: {row['error']}" if row["error"] else ""
+        print(f"{name:<28} {row['llm_calls']:>4} {row['prompt_tokens']:>10} {row['completion_tokens']:>9} "
+              f"{row['tool_calls']:>5} {row['wall_ms']:>9}{error}")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({"time_scale": args.time_scale, "scenarios": report}, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("time_scale") != args.time_scale:
+            print(f"\nBaseline was recorded with --time-scale {baseline.get('time_scale')}; wall times not comparable")
+            for row in baseline["scenarios"].values():
+                row["wall_ms"] = 0
+        regressions = compare(report, baseline["scenarios"], args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded LLM transcripts through the chat agent")
+    parser.add_argument("--transcripts", default=TRANSCRIPTS)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--scenario", action="append", help="Only run this scenario (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiplier for recorded LLM latency")
+    parser.add_argument("--prefill-ms-per-token", type=float, default=0.1,
+                        help="Extra latency per prompt token above the recording")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed wall time increase (0.2 = 20%%)")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# File: backend/benchmarks/startup_imports.py
+# Startup import-time benchmark (python -X importtime, per module)
+#
+# Usage (from backend/, with DATABASE_URL and JWT_SECRET set):
+#   python benchmarks/startup_imports.py
+#   python benchmarks/startup_imports.py --module app.services.agent_service --top 30
+#
+# Each run imports the target in a fresh interpreter, so numbers are cold
+# (apart from the OS page cache). Reports the median wall time, peak RSS,
+# the slowest modules by cumulative time and self time per top-level package.
+
+import argparse
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(module: str) -> Tuple[float, int, List[Tuple[str, int, int]]]:
+    """
+    Import `module` in a child interpreter.
+
+    Returns (wall seconds, child peak RSS in KB, [(module, self_us, cumulative_us)]).
+    """
+    before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        sys.exit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    # ru_maxrss for children is the max over all children waited for so far
+    peak_rss = max(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss, before)
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return wall, peak_rss, rows
+
+
+def by_package(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Sum self time per top-level package (fastapi, langchain, app, ...)."""
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to run")
+    parser.add_argument("--top", type=int, default=15, help="Rows per table")
+    args = parser.parse_args()
+
+    walls = []
+    peak_rss = 0
+    last_rows: List[Tuple[str, int, int]] = []
+    for _ in range(args.repeat):
+        wall, peak_rss, last_rows = run_once(args.module)
+        walls.append(wall)
+
+    print(f"import {args.module}: median {statistics.median(walls) * 1000:.0f} ms "
+          f"(min {min(walls) * 1000:.0f}, max {max(walls) * 1000:.0f}, n={args.repeat}), "
+          f"peak RSS {peak_rss / 1024:.1f} MB")
+
+    print("\nSlowest modules (cumulative, last run):")
+    for name, _, cumulative_us in sorted(last_rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:9.1f} ms  {name}")
+
+    print("\nSelf time by top-level package (last run):")
+    for package, self_us in sorted(by_package(last_rows).items(), key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:9.1f} ms  {package}")
+
+    heavy = [name for name, _, _ in last_rows
+             if name.split(".")[0] in ("langchain", "langchain_core", "langchain_groq",
+                                       "langchain_ollama", "google")]
+    print(f"\nLLM stack modules imported: {len(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
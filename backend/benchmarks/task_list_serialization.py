@@ -0,0 +1,151 @@
+# File: backend/benchmarks/task_list_serialization.py
+# Per-row cost of building a GET /tasks response: ORM + Pydantic vs row tuples + orjson
+#
+# Usage (from backend/, DATABASE_URL and JWT_SECRET set):
+#   python benchmarks/task_list_serialization.py                # 1000 rows, in memory
+#   python benchmarks/task_list_serialization.py --rows 5000 --db  # also fetch from Postgres
+#
+# In memory, the same rows are encoded three ways:
+#   stdlib   TaskListResponse(from_attributes) -> jsonable_encoder -> json.dumps
+#   pydantic TaskListResponse(from_attributes) -> model_dump_json
+#   orjson   row tuples -> task_list_json (what GET /tasks does now)
+# With --db, the fetch is included: select(Task) ORM entities + Pydantic vs
+# select(*TASK_RESPONSE_COLUMNS) tuples + orjson, on a temporary user.
+# Every path is checked to produce the same JSON document.
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, insert
+from sqlmodel import Session, select
+
+from app.database import get_engine
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskListResponse
+from app.services.task_json import TASK_RESPONSE_COLUMNS, task_list_json
+from loadtest.seed import task_row
+
+BENCH_USER_ID = "benchmark-serialization-user"
+
+
+def synthetic_tasks(count: int) -> List[Task]:
+    rng, now = random.Random(7), datetime.utcnow()
+    tasks = []
+    for task_id in range(1, count + 1):
+        row = task_row(rng, BENCH_USER_ID, now)
+        row.setdefault("updated_at", row["created_at"])
+        tasks.append(Task(id=task_id, **row))
+    return tasks
+
+
+def as_rows(tasks: List[Task]) -> List[tuple]:
+    return [tuple(getattr(task, column.key) for column in TASK_RESPONSE_COLUMNS) for task in tasks]
+
+
+def via_stdlib(tasks) -> bytes:
+    model = TaskListResponse(tasks=tasks, total=len(tasks), completed=0, pending=len(tasks))
+    return json.dumps(jsonable_encoder(model)).encode()
+
+
+def via_pydantic(tasks) -> bytes:
+    return TaskListResponse(tasks=tasks, total=len(tasks), completed=0, pending=len(tasks)).model_dump_json().encode()
+
+
+def via_orjson(rows) -> bytes:
+    return task_list_json(rows, len(rows), 0, len(rows))
+
+
+def per_row_us(fn: Callable[[], bytes], rows: int, repeat: int) -> float:
+    fn()  # Warm up (imports, schema caches)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) / rows * 1e6
+
+
+def report(title: str, results: dict) -> None:
+    base = next(iter(results.values()))
+    print(f"\n{title}")
+    print(f"{'path':<28} {'us/row':>8} {'speedup':>8}")
+    for name, us in results.items():
+        print(f"{name:<28} {us:>8.2f} {base / us:>7.1f}x")
+
+
+def bench_in_memory(count: int, repeat: int) -> None:
+    tasks = synthetic_tasks(count)
+    rows = as_rows(tasks)
+    expected = json.loads(via_pydantic(tasks))
+    assert json.loads(via_stdlib(tasks)) == expected
+    assert orjson.loads(via_orjson(rows)) == expected, "fast path JSON differs from TaskListResponse"
+
+    report(f"Encode {count} rows (no database)", {
+        "stdlib (jsonable_encoder)": per_row_us(lambda: via_stdlib(tasks), count, repeat),
+        "pydantic (model_dump_json)": per_row_us(lambda: via_pydantic(tasks), count, repeat),
+        "orjson (row tuples)": per_row_us(lambda: via_orjson(rows), count, repeat),
+    })
+
+
+def bench_with_db(count: int, repeat: int) -> None:
+    engine = get_engine()
+    with Session(engine) as session:
+        if session.get(User, BENCH_USER_ID) is None:
+            session.add(User(id=BENCH_USER_ID, email="benchmark-serialization@example.com", password_hash="!"))
+            session.flush()
+        session.execute(delete(Task).where(Task.user_id == BENCH_USER_ID))
+        rng, now = random.Random(7), datetime.utcnow()
+        session.execute(insert(Task), [task_row(rng, BENCH_USER_ID, now) for _ in range(count)])
+        session.commit()
+
+    def orm_pydantic() -> bytes:
+        with Session(engine) as session:
+            tasks = session.exec(select(Task).where(Task.user_id == BENCH_USER_ID).order_by(Task.id)).all()
+            return via_pydantic(tasks)
+
+    def tuples_orjson() -> bytes:
+        with Session(engine) as session:
+            rows = session.exec(
+                select(*TASK_RESPONSE_COLUMNS).where(Task.user_id == BENCH_USER_ID).order_by(Task.id)
+            ).all()
+            return via_orjson(rows)
+
+    try:
+        assert orjson.loads(tuples_orjson()) == json.loads(orm_pydantic())
+        report(f"Fetch + encode {count} rows (Postgres)", {
+            "select(Task) + pydantic": per_row_us(orm_pydantic, count, repeat),
+            "select(columns) + orjson": per_row_us(tuples_orjson, count, repeat),
+        })
+    finally:
+        with Session(engine) as session:
+            session.execute(delete(Task).where(Task.user_id == BENCH_USER_ID))
+            session.execute(delete(User).where(User.id == BENCH_USER_ID))
+            session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /tasks serialization microbenchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--db", action="store_true", help="Include fetching the rows from Postgres")
+    args = parser.parse_args()
+
+    bench_in_memory(args.rows, args.repeat)
+    if args.db:
+        bench_with_db(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# File: backend/loadtest/run.py
+# Asyncio load test: auth, task CRUD, filtered list/search, bulk ops, tags, chat
+#
+# Usage (API running with seeded data, see loadtest/README.md):
+#   python -m loadtest.run --base-url http://127.0.0.1:8000 --users 20 --duration 60
+#   python -m loadtest.run --save baseline.json
+#   python -m loadtest.run --compare baseline.json --tolerance 0.25
+#
+# Each virtual user logs in as a seeded user (or signs up, --signup-fraction),
+# then runs a weighted mix of requests back to back until the deadline.
+# Reports count, errors, RPS and p50/p95/p99 per endpoint (route template).
+# --compare exits with status 1 when an endpoint's p95 got slower than the
+# baseline by more than --tolerance (or its error rate went up).
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from loadtest.seed import EMAIL_TEMPLATE, PASSWORD
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+class Results:
+    """Latencies (seconds) and error counts per endpoint label."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        self.latencies[endpoint].append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for endpoint, samples in sorted(self.latencies.items()):
+            samples = sorted(samples)
+            report[endpoint] = {
+                "count": len(samples),
+                "errors": self.errors[endpoint],
+                "rps": round(len(samples) / elapsed, 2),
+                "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                "max_ms": round(samples[-1] * 1000, 1),
+            }
+        return report
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+# ============================================================================
+# VIRTUAL USER
+# ============================================================================
+
+SEARCH_TERMS = ["report", "groceries", "bill", "meeting", "trip", "gift"]
+CHAT_MESSAGES = ["list my tasks", "add Buy milk", "hello", "show my tasks", "add Call the bank"]
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, results: Results, rng: random.Random):
+        self.client = client
+        self.results = results
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+        self.own_task_ids: List[int] = []  # Tasks this VU created (safe to delete)
+        self.seen_task_ids: List[int] = []
+        self.tag_ids: List[int] = []
+
+    async def request(self, endpoint: str, method: str, url: str, expected=(200,), **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.results.record(endpoint, time.perf_counter() - start, ok=False)
+            return None
+        self.results.record(endpoint, time.perf_counter() - start, ok=response.status_code in expected)
+        return response
+
+    # Auth ----------------------------------------------------------------
+
+    async def signup(self) -> bool:
+        email = f"loadtest-signup-{uuid.uuid4().hex[:12]}@example.com"
+        response = await self.request("POST /auth/signup", "POST", "/auth/signup", expected=(201,),
+                                      json={"email": email, "password": PASSWORD, "name": "Load Test"})
+        return self._use_token(response)
+
+    async def login(self, user_index: int) -> bool:
+        response = await self.request("POST /auth/login", "POST", "/auth/login",
+                                      json={"email": EMAIL_TEMPLATE.format(user_index), "password": PASSWORD})
+        return self._use_token(response)
+
+    def _use_token(self, response: Optional[httpx.Response]) -> bool:
+        if response is None or response.status_code >= 400:
+            return False
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        return True
+
+    # Tasks ---------------------------------------------------------------
+
+    async def list_tasks(self):
+        response = await self.request("GET /tasks/", "GET", "/tasks/", params={"limit": 50})
+        if response is not None and response.status_code == 200:
+            self.seen_task_ids = [task["id"] for task in response.json()["tasks"]]
+
+    async def list_filtered(self):
+        params = {"limit": 50, "priority": self.rng.choice(["high", "medium", "low"]),
+                  "completed": self.rng.choice(["true", "false"])}
+        if self.rng.random() < 0.5:
+            params["category"] = self.rng.choice(["work", "personal", "home"])
+        await self.request("GET /tasks/ (filtered)", "GET", "/tasks/", params=params)
+
+    async def search_tasks(self):
+        await self.request("GET /tasks/ (search)", "GET", "/tasks/",
+                           params={"search": self.rng.choice(SEARCH_TERMS), "limit": 50})
+
+    async def create_task(self):
+        body = {"title": f"Load test task {self.rng.randint(0, 10**6)}",
+                "priority": self.rng.choice(["high", "medium", "low"]), "category": "work"}
+        if self.tag_ids and self.rng.random() < 0.3:
+            body["tag_ids"] = self.rng.sample(self.tag_ids, 1)
+        response = await self.request("POST /tasks/", "POST", "/tasks/", expected=(201,), json=body)
+        if response is not None and response.status_code == 201:
+            self.own_task_ids.append(response.json()["id"])
+
+    async def get_task(self):
+        if self.seen_task_ids:
+            await self.request("GET /tasks/{task_id}", "GET", f"/tasks/{self.rng.choice(self.seen_task_ids)}")
+
+    async def update_task(self):
+        if self.seen_task_ids:
+            await self.request("PATCH /tasks/{task_id}", "PATCH", f"/tasks/{self.rng.choice(self.seen_task_ids)}",
+                               json={"completed": self.rng.random() < 0.5})
+
+    async def delete_task(self):
+        if self.own_task_ids:
+            task_id = self.own_task_ids.pop(self.rng.randrange(len(self.own_task_ids)))
+            if task_id in self.seen_task_ids:
+                self.seen_task_ids.remove(task_id)
+            await self.request("DELETE /tasks/{task_id}", "DELETE", f"/tasks/{task_id}", expected=(204,))
+
+    async def bulk_update(self):
+        if len(self.seen_task_ids) >= 5:
+            ids = self.rng.sample(self.seen_task_ids, 5)
+            await self.request("PATCH /tasks/bulk-update", "PATCH", "/tasks/bulk-update",
+                               params=[("task_ids", task_id) for task_id in ids],
+                               json={"priority": self.rng.choice(["high", "medium", "low"])})
+
+    async def bulk_by_filter(self):
+        await self.request("PATCH /tasks/bulk-by-filter", "PATCH", "/tasks/bulk-by-filter",
+                           json={"filter": {"category": "work", "completed": False},
+                                 "action": "update", "changes": {"priority": "high"},
+                                 "dry_run": True})
+
+    # Tags & chat ---------------------------------------------------------
+
+    async def list_tags(self):
+        response = await self.request("GET /tags/", "GET", "/tags/")
+        if response is not None and response.status_code == 200:
+            self.tag_ids = [tag["id"] for tag in response.json()]
+
+    async def create_tag(self):
+        await self.request("POST /tags/", "POST", "/tags/", expected=(201, 400),
+                           json={"name": f"lt-{self.rng.randint(0, 10**6)}", "color": "#3B82F6"})
+
+    async def chat(self):
+        await self.request("POST /chat", "POST", "/chat", json={"message": self.rng.choice(CHAT_MESSAGES)})
+
+
+# Relative weights of the request mix
+ACTIONS: List[Tuple[Callable, int]] = [
+    (VirtualUser.list_tasks, 25),
+    (VirtualUser.list_filtered, 15),
+    (VirtualUser.search_tasks, 10),
+    (VirtualUser.create_task, 10),
+    (VirtualUser.get_task, 8),
+    (VirtualUser.update_task, 8),
+    (VirtualUser.delete_task, 4),
+    (VirtualUser.bulk_update, 3),
+    (VirtualUser.bulk_by_filter, 2),
+    (VirtualUser.list_tags, 6),
+    (VirtualUser.create_tag, 1),
+]
+
+
+async def run_virtual_user(index: int, args, results: Results, deadline: float) -> None:
+    rng = random.Random(args.seed + index)
+    limits = httpx.Limits(max_connections=1)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        vu = VirtualUser(client, results, rng)
+        signed_in = await (vu.signup() if rng.random() < args.signup_fraction else vu.login(index % args.seeded_users))
+        if not signed_in:
+            return
+        await vu.list_tags()
+        await vu.list_tasks()
+
+        actions = ACTIONS + [(VirtualUser.chat, args.chat_weight)]
+        functions = [action for action, _ in actions]
+        weights = [weight for _, weight in actions]
+        while time.monotonic() < deadline:
+            await rng.choices(functions, weights=weights)[0](vu)
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_report(report: Dict[str, Dict[str, float]], elapsed: float) -> None:
+    header = f"{'endpoint':<28} {'count':>7} {'err':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    print(header)
+    print("-" * len(header))
+    for endpoint, row in report.items():
+        print(f"{endpoint:<28} {row['count']:>7} {row['errors']:>5} {row['rps']:>8} "
+              f"{row['p50_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8} {row['max_ms']:>8}")
+    total = sum(row["count"] for row in report.values())
+    errors = sum(row["errors"] for row in report.values())
+    print("-" * len(header))
+    print(f"{'TOTAL':<28} {total:>7} {errors:>5} {total / elapsed:>8.1f}   ({elapsed:.1f}s)")
+
+
+def compare(report: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Endpoints whose p95 or error rate regressed against the baseline."""
+    regressions = []
+    for endpoint, row in report.items():
+        base = baseline.get(endpoint)
+        if not base:
+            continue
+        if base["p95_ms"] and row["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{endpoint}: p95 {base['p95_ms']} -> {row['p95_ms']} ms")
+        if row["errors"] / row["count"] > base["errors"] / max(base["count"], 1) + 0.01:
+            regressions.append(f"{endpoint}: errors {base['errors']}/{base['count']} -> {row['errors']}/{row['count']}")
+    return regressions
+
+
+async def main_async(args) -> int:
+    results = Results()
+    start = time.monotonic()
+    deadline = start + args.duration
+    await asyncio.gather(*(run_virtual_user(i, args, results, deadline) for i in range(args.users)))
+    elapsed = time.monotonic() - start
+
+    report = results.summary(elapsed)
+    print_report(report, elapsed)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved report to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.compare} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {args.compare}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Todo API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds")
+    parser.add_argument("--seeded-users", type=int, default=50, help="Users created by loadtest.seed")
+    parser.add_argument("--signup-fraction", type=float, default=0.1, help="VUs that sign up instead of logging in")
+    parser.add_argument("--chat-weight", type=int, default=3, help="Weight of POST /chat in the mix (0 = off)")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="Write the report as JSON (baseline)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
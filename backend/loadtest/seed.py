@@ -0,0 +1,147 @@
+# File: backend/loadtest/seed.py
+# Seed Postgres with load-test users, tags and realistic task volumes
+#
+# Usage (from backend/, DATABASE_URL and JWT_SECRET set, migrations applied):
+#   python -m loadtest.seed --users 50 --tasks-per-user 400
+#   python -m loadtest.seed --reset          # remove previously seeded users first
+#
+# Users are loadtest-0000@example.com ... with password PASSWORD (below).
+# Task counts per user are skewed like real usage (most users have a few
+# dozen tasks, some have thousands); --tasks-per-user is the mean.
+# Rows are written with multi-row INSERT ... RETURNING in batches.
+
+import argparse
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import delete, insert, select
+from sqlmodel import Session
+
+from app.database import get_engine
+from app.models.conversation import Conversation, Message
+from app.models.tag import Tag, TaskTag
+from app.models.task import Task
+from app.models.user import User
+from app.utils.security import hash_password
+
+EMAIL_TEMPLATE = "loadtest-{:04d}@example.com"
+PASSWORD = "loadtest-password"
+BATCH_SIZE = 1000
+
+CATEGORIES = ["work", "personal", "shopping", "health", "finance", "home", "learning", None]
+VERBS = ["Buy", "Call", "Email", "Review", "Fix", "Plan", "Book", "Pay", "Clean", "Write", "Prepare", "Schedule"]
+OBJECTS = [
+    "groceries", "dentist", "quarterly report", "team meeting notes", "car insurance", "birthday gift",
+    "flight tickets", "rent", "kitchen", "blog post", "tax documents", "gym session", "client proposal",
+    "pull request", "electricity bill", "weekend trip", "project roadmap", "doctor appointment",
+]
+TAG_NAMES = ["urgent", "errand", "deep-work", "waiting", "someday", "family", "admin", "quick"]
+TAG_COLORS = ["#EF4444", "#F59E0B", "#10B981", "#3B82F6", "#8B5CF6", "#EC4899", "#6B7280", "#14B8A6"]
+
+
+def loadtest_user_id(index: int) -> str:
+    """Stable user id, so re-seeding and --reset find the same users."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, EMAIL_TEMPLATE.format(index)))
+
+
+def task_count(rng: random.Random, mean: int) -> int:
+    """Skewed per-user volume: lognormal around the requested mean."""
+    return max(1, min(int(rng.lognormvariate(0, 1) * mean / 1.65), mean * 20))
+
+
+def task_row(rng: random.Random, user_id: str, now: datetime) -> dict:
+    created_at = now - timedelta(days=rng.uniform(0, 365))
+    completed = rng.random() < 0.4
+    return {
+        "user_id": user_id,
+        "title": f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}",
+        "description": "Seeded by loadtest/seed.py" if rng.random() < 0.3 else None,
+        "completed": completed,
+        "priority": rng.choices(["high", "medium", "low"], weights=[2, 5, 3])[0],
+        "category": rng.choice(CATEGORIES),
+        "due_date": now + timedelta(days=rng.uniform(-30, 60)) if rng.random() < 0.6 else None,
+        "estimated_minutes": rng.choice([15, 30, 45, 60, 90, 120]) if rng.random() < 0.5 else None,
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(days=rng.uniform(0, 5)) if completed else created_at,
+    }
+
+
+def reset(session: Session, user_ids: List[str]) -> None:
+    """Delete seeded users and everything they own (children first)."""
+    task_ids = select(Task.id).where(Task.user_id.in_(user_ids))
+    conversation_ids = select(Conversation.id).where(Conversation.user_id.in_(user_ids))
+    session.execute(delete(TaskTag).where(TaskTag.task_id.in_(task_ids)))
+    session.execute(delete(Task).where(Task.user_id.in_(user_ids)))
+    session.execute(delete(Tag).where(Tag.user_id.in_(user_ids)))
+    session.execute(delete(Message).where(Message.conversation_id.in_(conversation_ids)))
+    session.execute(delete(Conversation).where(Conversation.user_id.in_(user_ids)))
+    session.execute(delete(User).where(User.id.in_(user_ids)))
+
+
+def seed(users: int, tasks_per_user: int, tagged_fraction: float, seed_value: int, do_reset: bool) -> None:
+    rng = random.Random(seed_value)
+    now = datetime.utcnow()
+    user_ids = [loadtest_user_id(i) for i in range(users)]
+    password_hash = hash_password(PASSWORD)  # bcrypt once, shared by all seeded users
+
+    with Session(get_engine()) as session:
+        if do_reset:
+            reset(session, user_ids)
+            session.commit()
+
+        existing = set(session.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+        new_users = [i for i in range(users) if user_ids[i] not in existing]
+        if not new_users:
+            print(f"All {users} load-test users already exist (use --reset to re-seed)")
+            return
+
+        session.execute(insert(User), [
+            {"id": user_ids[i], "email": EMAIL_TEMPLATE.format(i), "name": f"Load Test {i}",
+             "password_hash": password_hash, "created_at": now}
+            for i in new_users
+        ])
+
+        total_tasks = total_links = 0
+        for i in new_users:
+            user_id = user_ids[i]
+            tag_ids = session.execute(
+                insert(Tag).returning(Tag.id),
+                [{"user_id": user_id, "name": name, "color": color, "created_at": now}
+                 for name, color in zip(TAG_NAMES, TAG_COLORS)]
+            ).scalars().all()
+
+            rows = [task_row(rng, user_id, now) for _ in range(task_count(rng, tasks_per_user))]
+            for start in range(0, len(rows), BATCH_SIZE):
+                task_ids = session.execute(
+                    insert(Task).values(rows[start:start + BATCH_SIZE]).returning(Task.id)
+                ).scalars().all()
+                links = [
+                    {"task_id": task_id, "tag_id": tag_id, "created_at": now}
+                    for task_id in task_ids if rng.random() < tagged_fraction
+                    for tag_id in rng.sample(tag_ids, rng.randint(1, 2))
+                ]
+                if links:
+                    session.execute(insert(TaskTag), links)
+                total_links += len(links)
+            total_tasks += len(rows)
+            session.commit()
+
+    print(f"Seeded {len(new_users)} users, {total_tasks} tasks, {total_links} task tags "
+          f"(login: {EMAIL_TEMPLATE.format(0)} / {PASSWORD})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed load-test data")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tasks-per-user", type=int, default=400, help="Mean tasks per user")
+    parser.add_argument("--tagged-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (reproducible data)")
+    parser.add_argument("--reset", action="store_true", help="Delete existing load-test users first")
+    args = parser.parse_args()
+    seed(args.users, args.tasks_per_user, args.tagged_fraction, args.seed, args.reset)
+
+
+if __name__ == "__main__":
+    main()
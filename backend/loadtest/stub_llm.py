@@ -0,0 +1,163 @@
+# File: backend/loadtest/stub_llm.py
+# Deterministic stub LLM server speaking the Ollama HTTP API
+#
+# Lets the chat endpoint run under load with no model and no network:
+#   python -m loadtest.stub_llm --port 11435 --latency-ms 300
+#   LLM_PROVIDER=ollama OLLAMA_BASE_URL=http://127.0.0.1:11435 uvicorn app.main:app
+#
+# Replies are a pure function of the conversation, so runs are reproducible:
+#   "add <title>" / "create <title>"   -> add_task(title)
+#   "list ..." / "show ..."            -> list_tasks()
+#   "complete <id>" / "done <id>"      -> complete_task(task_id)
+#   "delete <id>" / "remove <id>"      -> delete_task(task_id)
+#   after a tool result                -> short confirmation, no tool call
+#   anything else                      -> small-talk answer
+# A tool call is only emitted when the request offered that tool.
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+app = FastAPI(title="Stub LLM (Ollama API)")
+
+# Set from the command line (or env by the importer) before serving
+LATENCY_MS = 300.0  # Base latency of one call
+JITTER_MS = 100.0  # Deterministic per-request jitter in [0, JITTER_MS)
+MODEL = "llama3.2"
+
+
+# ============================================================================
+# DETERMINISTIC REPLIES
+# ============================================================================
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _tool_call_for(text: str, offered: List[str]) -> Optional[Dict[str, Any]]:
+    """Map a user utterance to one tool call, if the tool was offered."""
+    lowered = text.strip().lower()
+    number = re.search(r"\d+", lowered)
+
+    if re.match(r"^(add|create)\b", lowered):
+        title = re.sub(r"^(add|create)\s+(a\s+)?(task\s+)?(to\s+)?", "", text.strip(), flags=re.I) or "New task"
+        call = ("add_task", {"title": title[:200]})
+    elif re.match(r"^(list|show)\b", lowered):
+        call = ("list_tasks", {})
+    elif re.match(r"^(complete|done|finish)\b", lowered) and number:
+        call = ("complete_task", {"task_id": int(number.group())})
+    elif re.match(r"^(delete|remove)\b", lowered) and number:
+        call = ("delete_task", {"task_id": int(number.group())})
+    else:
+        return None
+
+    name, arguments = call
+    if name not in offered:
+        return None
+    return {"function": {"name": name, "arguments": arguments}}
+
+
+def build_reply(messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The assistant message for a chat request (content and optional tool_calls)."""
+    offered = [tool.get("function", {}).get("name") for tool in tools or []]
+    last = messages[-1] if messages else {"role": "user", "content": ""}
+
+    if last.get("role") == "tool":
+        return {"role": "assistant", "content": "Done. Let me know if you need anything else."}
+
+    call = _tool_call_for(str(last.get("content", "")), offered)
+    if call:
+        return {"role": "assistant", "content": "", "tool_calls": [call]}
+    return {"role": "assistant", "content": "Hello! I can add, list, complete or delete your tasks."}
+
+
+def _latency_seconds(body: Dict[str, Any]) -> float:
+    """LATENCY_MS plus a jitter derived from the request, so it's reproducible."""
+    digest = hashlib.sha256(json.dumps(body, sort_keys=True, default=str).encode()).digest()
+    return (LATENCY_MS + JITTER_MS * digest[0] / 256) / 1000
+
+
+def _usage(messages: List[Dict[str, Any]], reply: Dict[str, Any]) -> Dict[str, Any]:
+    prompt = sum(_estimate_tokens(str(m.get("content", ""))) for m in messages)
+    completion = _estimate_tokens(reply.get("content", "") + json.dumps(reply.get("tool_calls", [])))
+    return {"prompt_eval_count": prompt, "eval_count": completion}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ============================================================================
+# OLLAMA API
+# ============================================================================
+
+@app.get("/api/tags")
+async def tags():
+    return {"models": [{"name": f"{MODEL}:latest", "model": f"{MODEL}:latest", "size": 0}]}
+
+
+@app.get("/api/version")
+async def version():
+    return {"version": "0.0.0-stub"}
+
+
+@app.post("/api/generate")
+async def generate(request: Request):
+    """Warm-up calls (see app/services/ollama_warmup.py)."""
+    body = await request.json()
+    await asyncio.sleep(_latency_seconds(body))
+    return {"model": body.get("model", MODEL), "created_at": _now(), "response": "ok", "done": True}
+
+
+@app.post("/api/chat")
+async def chat(request: Request):
+    body = await request.json()
+    messages = body.get("messages", [])
+    reply = build_reply(messages, body.get("tools"))
+    await asyncio.sleep(_latency_seconds(body))
+
+    final = {
+        "model": body.get("model", MODEL),
+        "created_at": _now(),
+        "message": reply,
+        "done": True,
+        "done_reason": "stop",
+        **_usage(messages, reply),
+    }
+    if not body.get("stream", True):
+        return JSONResponse(final)
+
+    # Streaming: one content chunk, then the final (done) chunk with usage
+    async def ndjson():
+        yield json.dumps({**final, "done": False, "done_reason": None,
+                          "prompt_eval_count": None, "eval_count": None}) + "\n"
+        yield json.dumps({**final, "message": {"role": "assistant", "content": ""}}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+def main():
+    global LATENCY_MS, JITTER_MS
+
+    parser = argparse.ArgumentParser(description="Deterministic stub LLM (Ollama API)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS, help="Base latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=JITTER_MS, help="Max deterministic jitter")
+    args = parser.parse_args()
+
+    LATENCY_MS, JITTER_MS = args.latency_ms, args.jitter_ms
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
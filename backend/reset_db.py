@@ -1,8 +1,8 @@
 from sqlmodel import create_engine, text
-from app.config import settings
+from app.config import get_settings
 
 # Create engine
-engine = create_engine(settings.database_url)
+engine = create_engine(get_settings().database_url)
 
 def reset_db():
     print("Resetting database...")
@@ -16,22 +16,8 @@ echo "=========================="
 echo "Starting Ollama service..."
 ollama serve > /tmp/ollama.log 2>&1 &
 
-# Wait for Ollama to start
-echo "Waiting for Ollama API to be ready on 127.0.0.1:11434..."
-MAX_RETRIES=30
-RETRY_COUNT=0
-while [ $RETRY_COUNT -lt $MAX_RETRIES ]; do
-    if curl -s http://127.0.0.1:11434/api/tags > /dev/null; then
-        echo "Ollama API is UP!"
-        break
-    fi
-    RETRY_COUNT=$((RETRY_COUNT+1))
-    sleep 1
-done
-
-# Ensure model is verified
-echo "Verifying llama3.2 model..."
-ollama list
+# Don't wait for Ollama here: the app starts immediately and its lifespan
+# waits for the API and preloads the model in the background (see /ready)
 
 # Start the FastAPI application
 echo "Starting FastAPI app..."
@@ -0,0 +1,88 @@
+# File: backend/tests/conftest.py
+# Integration tests: they run against a real Postgres migrated to head,
+# because the behavior under test lives in SQL (triggers, SAVEPOINTs).
+#
+#   cd backend && alembic upgrade head
+#   DATABASE_URL=postgresql://... JWT_SECRET=... python -m pytest
+#
+# Without DATABASE_URL (or with an unreachable database) every test is skipped.
+# Each test gets its own user; everything it created is deleted afterwards.
+# N+1 queries fail the request here (SQL_N_PLUS_ONE_RAISE) instead of being logged.
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+os.environ.setdefault("SQL_N_PLUS_ONE_RAISE", "true")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not os.getenv("DATABASE_URL") or not os.getenv("JWT_SECRET"):
+        pytest.skip("DATABASE_URL and JWT_SECRET are required")
+    from sqlalchemy import text
+    from app.database import get_engine
+
+    engine = get_engine()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        pytest.skip(f"Database not reachable: {e}")
+    return engine
+
+
+@pytest.fixture
+def user(engine):
+    from sqlalchemy import delete
+    from sqlmodel import Session, select
+    from app.models import Conversation, Message, Tag, Task, TaskSyncOp, TaskTag, TaskTombstone, User
+
+    user_id = f"test-{uuid.uuid4().hex[:12]}"
+    with Session(engine) as session:
+        session.add(User(id=user_id, email=f"{user_id}@example.com", password_hash="!"))
+        session.commit()
+        user = session.get(User, user_id)
+        session.expunge(user)
+
+    yield user
+
+    with Session(engine) as session:
+        session.execute(delete(TaskTag).where(
+            TaskTag.task_id.in_(select(Task.id).where(Task.user_id == user_id))
+        ))
+        # task_sync_ops and task_tombstones have no foreign key to users
+        for model in (Task, Tag, Message, Conversation, TaskSyncOp, TaskTombstone):
+            session.execute(delete(model).where(model.user_id == user_id))
+        session.execute(delete(User).where(User.id == user_id))
+        session.commit()
+
+
+@pytest.fixture
+def client(engine):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)  # No `with`: lifespan background tasks are not started
+
+
+@pytest.fixture
+def auth_headers(user):
+    from app.utils.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token(user.id)[0]}"}
+
+
+def run_async(coro):
+    """Run a coroutine on a fresh loop; async pool connections do not outlive it."""
+    from app.database import get_async_engine
+
+    async def run():
+        try:
+            return await coro
+        finally:
+            await get_async_engine().dispose()
+
+    return asyncio.run(run())
@@ -0,0 +1,77 @@
+# File: backend/tests/test_bulk_by_filter.py
+# PATCH /tasks/bulk-by-filter: the guards in front of the single UPDATE/DELETE
+
+import pytest
+from sqlmodel import Session, func, select
+
+
+def _add_tasks(engine, user, *specs):
+    from app.models import Task
+
+    with Session(engine) as session:
+        tasks = [Task(user_id=user.id, **spec) for spec in specs]
+        session.add_all(tasks)
+        session.commit()
+        return [task.id for task in tasks]
+
+
+def _count_tasks(engine, user) -> int:
+    from app.models import Task
+
+    with Session(engine) as session:
+        return session.exec(select(func.count()).where(Task.user_id == user.id)).one()
+
+
+@pytest.mark.parametrize("task_filter", [
+    {},
+    {"completed": None, "priority": None},
+    {"tag_ids": []},
+    {"search": ""},
+    {"category": ""},
+])
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_delete_without_filter_is_rejected(engine, user, client, auth_headers, task_filter, dry_run):
+    _add_tasks(engine, user, {"title": "one"}, {"title": "two", "completed": True})
+
+    response = client.patch(
+        "/tasks/bulk-by-filter",
+        json={"filter": task_filter, "action": "delete", "dry_run": dry_run},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+    assert _count_tasks(engine, user) == 2
+
+
+def test_delete_by_filter_only_deletes_matches(engine, user, client, auth_headers):
+    from app.models import Task
+
+    pending_id, _ = _add_tasks(engine, user, {"title": "open"}, {"title": "done", "completed": True})
+
+    response = client.patch(
+        "/tasks/bulk-by-filter",
+        json={"filter": {"completed": True}, "action": "delete"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["matched"] == 1
+    with Session(engine) as session:
+        remaining = session.exec(select(Task.id).where(Task.user_id == user.id)).all()
+    assert remaining == [pending_id]
+
+
+def test_update_to_null_is_rejected(engine, user, client, auth_headers):
+    from app.models import Task
+
+    (task_id,) = _add_tasks(engine, user, {"title": "keep me"})
+
+    response = client.patch(
+        "/tasks/bulk-by-filter",
+        json={"filter": {}, "action": "update", "changes": {"title": None}},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 422
+    with Session(engine) as session:
+        assert session.get(Task, task_id).title == "keep me"
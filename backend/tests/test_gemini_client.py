@@ -0,0 +1,14 @@
+# File: backend/tests/test_gemini_client.py
+# Gemini agent configuration (no API calls)
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+
+def test_system_instruction_names_every_declared_tool():
+    from app.mcp.todo_tools import GEMINI_TOOLS
+    from app.utils.gemini_client import SYSTEM_INSTRUCTION
+
+    for tool in GEMINI_TOOLS:
+        assert f"Use {tool['name']} tool" in SYSTEM_INSTRUCTION
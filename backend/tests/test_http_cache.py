@@ -0,0 +1,52 @@
+# File: backend/tests/test_http_cache.py
+# GET /tasks conditional requests: ETag from users.data_version, 304 on a match
+
+import pytest
+
+
+@pytest.fixture(params=["cached", "uncached"])
+def list_cache(request, monkeypatch):
+    """Run each test with the per-worker response cache on and off."""
+    from app.services.task_list_cache import task_list_cache
+
+    if request.param == "uncached":
+        monkeypatch.setattr(task_list_cache, "_max_entries", 0)
+    return request.param
+
+
+def _list(client, auth_headers, etag=None):
+    headers = dict(auth_headers, **({"If-None-Match": etag} if etag else {}))
+    return client.get("/tasks/", headers=headers)
+
+
+def test_matching_if_none_match_is_not_modified(user, client, auth_headers, list_cache):
+    first = _list(client, auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}', "*"):
+        response = _list(client, auth_headers, if_none_match)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    assert _list(client, auth_headers, 'W/"other"').status_code == 200
+
+
+@pytest.mark.parametrize("write", ["task", "tag"])
+def test_write_changes_the_etag(user, client, auth_headers, list_cache, write):
+    etag = _list(client, auth_headers).headers["ETag"]
+
+    if write == "task":
+        response = client.post("/tasks/", json={"title": "new"}, headers=auth_headers)
+    else:
+        response = client.post("/tags/", json={"name": "new"}, headers=auth_headers)
+    assert response.status_code == 201
+
+    response = _list(client, auth_headers, etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    if write == "task":
+        assert [task["title"] for task in response.json()["tasks"]] == ["new"]
+
+    assert _list(client, auth_headers, response.headers["ETag"]).status_code == 304
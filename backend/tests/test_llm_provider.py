@@ -0,0 +1,58 @@
+# File: backend/tests/test_llm_provider.py
+# LLM provider selection shared by create_llm and the Ollama warm-up (no network)
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def provider_env(monkeypatch):
+    """Set LLM_PROVIDER, the API keys and whether Ollama answers."""
+    from app.services import llm_provider
+
+    def configure(provider="auto", groq="", gemini="", ollama_up=False):
+        monkeypatch.setattr(llm_provider, "get_settings", lambda: SimpleNamespace(llm_provider=provider))
+        monkeypatch.setenv("GROQ_API_KEY", groq)
+        monkeypatch.setenv("GEMINI_API_KEY", gemini)
+        monkeypatch.setattr(llm_provider, "ollama_available", lambda: ollama_up)
+
+    return configure
+
+
+@pytest.mark.parametrize("config, selected, ollama_selected", [
+    ({"groq": "key", "ollama_up": True}, "groq", False),
+    ({"gemini": "key", "ollama_up": True}, "ollama", True),
+    # Gemini configured, Ollama not running: no warm-up
+    ({"gemini": "key"}, "gemini", False),
+    # Nothing else configured: Ollama is the only candidate (may still be starting)
+    ({}, None, True),
+    ({"provider": "ollama", "groq": "key"}, "ollama", True),
+    ({"provider": "groq", "ollama_up": True}, None, False),
+    ({"provider": "gemini", "gemini": "key", "ollama_up": True}, "gemini", False),
+])
+def test_select_llm_provider(provider_env, config, selected, ollama_selected):
+    from app.services.llm_provider import ollama_is_selected, select_llm_provider
+
+    provider_env(**config)
+
+    assert select_llm_provider() == selected
+    assert ollama_is_selected() is ollama_selected
+
+
+@pytest.mark.parametrize("selected", [True, False])
+def test_startup_warms_ollama_only_when_selected(monkeypatch, selected):
+    import asyncio
+    from app import main
+
+    warmed = []
+
+    async def warm_ollama_model():
+        warmed.append(True)
+
+    monkeypatch.setattr(main, "ollama_is_selected", lambda: selected)
+    monkeypatch.setattr(main, "warm_ollama_model", warm_ollama_model)
+
+    asyncio.run(main._warm_ollama_if_selected())
+
+    assert warmed == ([True] if selected else [])
@@ -0,0 +1,70 @@
+# File: backend/tests/test_query_stats.py
+# Task endpoints touching many rows run a fixed number of statements
+# (the suite raises on N+1 queries, see conftest.py)
+
+from sqlmodel import Session, select
+
+N = 15  # More than SQL_N_PLUS_ONE_THRESHOLD
+
+
+def _add(engine, rows):
+    with Session(engine) as session:
+        session.add_all(rows)
+        session.commit()
+        return [row.id for row in rows]
+
+
+def _add_tasks(engine, user, count):
+    from app.models import Task
+
+    return _add(engine, [Task(user_id=user.id, title=f"task {i}") for i in range(count)])
+
+
+def _add_tags(engine, user, count):
+    from app.models import Tag
+
+    return _add(engine, [Tag(user_id=user.id, name=f"tag {i}") for i in range(count)])
+
+
+def test_create_and_update_with_many_tags(engine, user, client, auth_headers):
+    from app.models import TaskTag
+
+    tag_ids = _add_tags(engine, user, N)
+
+    response = client.post("/tasks/", json={"title": "tagged", "tag_ids": tag_ids}, headers=auth_headers)
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    response = client.patch(f"/tasks/{task_id}", json={"tag_ids": tag_ids[:N - 1]}, headers=auth_headers)
+    assert response.status_code == 200
+    with Session(engine) as session:
+        linked = session.exec(select(TaskTag.tag_id).where(TaskTag.task_id == task_id)).all()
+    assert sorted(linked) == sorted(tag_ids[:N - 1])
+
+
+def test_bulk_update_many_tasks(engine, user, client, auth_headers):
+    task_ids = _add_tasks(engine, user, N)
+
+    response = client.patch(
+        "/tasks/bulk-update", params={"task_ids": task_ids}, json={"completed": True}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert [task["completed"] for task in response.json()] == [True] * N
+
+
+def test_bulk_delete_many_tagged_tasks(engine, user, client, auth_headers):
+    from app.models import Task, TaskTag
+
+    task_ids = _add_tasks(engine, user, N)
+    (tag_id,) = _add_tags(engine, user, 1)
+    with Session(engine) as session:
+        session.add_all(TaskTag(task_id=task_id, tag_id=tag_id) for task_id in task_ids)
+        session.commit()
+
+    response = client.post("/tasks/bulk-delete", json=task_ids, headers=auth_headers)
+
+    assert response.status_code == 204
+    with Session(engine) as session:
+        assert session.exec(select(Task).where(Task.user_id == user.id)).all() == []
+        assert session.exec(select(TaskTag).where(TaskTag.tag_id == tag_id)).all() == []
@@ -0,0 +1,114 @@
+# File: backend/tests/test_task_changes.py
+# GET /tasks/changes: the change_seq cursor over live tasks and tombstones
+
+import base64
+import time
+
+from sqlmodel import Session, select
+
+
+def _add_task(engine, user, title):
+    from app.models import Task
+
+    with Session(engine) as session:
+        task = Task(user_id=user.id, title=title)
+        session.add(task)
+        session.commit()
+        return task.id
+
+
+def _changes(client, auth_headers, since=None, limit=500):
+    params = {"limit": limit}
+    if since is not None:
+        params["since"] = since
+    response = client.get("/tasks/changes", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _cursor(change_seq, issued_at):
+    raw = f"{change_seq}:{int(issued_at)}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_paging_across_a_delete(engine, user, client, auth_headers):
+    first, deleted, last = (_add_task(engine, user, title) for title in ("first", "deleted", "last"))
+    initial = _changes(client, auth_headers)
+    assert sorted(task["id"] for task in initial["changed"]) == sorted([first, deleted, last])
+    assert not initial["has_more"]
+
+    # One change of each kind, in this order: update, delete, update
+    assert client.patch(f"/tasks/{first}", json={"title": "first v2"}, headers=auth_headers).status_code == 200
+    assert client.delete(f"/tasks/{deleted}", headers=auth_headers).status_code == 204
+    assert client.patch(f"/tasks/{last}", json={"title": "last v2"}, headers=auth_headers).status_code == 200
+
+    pages, cursor = [], initial["cursor"]
+    while True:
+        page = _changes(client, auth_headers, since=cursor, limit=1)
+        pages.append(([task["id"] for task in page["changed"]], page["deleted"]))
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            break
+
+    assert pages == [([first], []), ([], [deleted]), ([last], [])]
+
+    # The cursor moved past the tombstone: nothing is returned again
+    page = _changes(client, auth_headers, since=cursor)
+    assert (page["changed"], page["deleted"], page["has_more"]) == ([], [], False)
+
+
+def test_full_sync_skips_tombstones(engine, user, client, auth_headers):
+    kept = _add_task(engine, user, "kept")
+    deleted = _add_task(engine, user, "deleted")
+    assert client.delete(f"/tasks/{deleted}", headers=auth_headers).status_code == 204
+
+    page = _changes(client, auth_headers)
+
+    assert [task["id"] for task in page["changed"]] == [kept]
+    assert page["deleted"] == []
+
+
+def test_cursor_older_than_tombstone_retention_is_gone(engine, user, client, auth_headers):
+    from app.config import get_settings
+
+    _add_task(engine, user, "task")
+    retention = get_settings().task_tombstone_retention_days * 86400
+    fresh = _changes(client, auth_headers)["cursor"]
+    change_seq = int(base64.urlsafe_b64decode(fresh + "=" * (-len(fresh) % 4)).decode().split(":")[0])
+
+    expired = _cursor(change_seq, time.time() - retention - 60)
+    response = client.get("/tasks/changes", params={"since": expired}, headers=auth_headers)
+    assert response.status_code == 410
+
+    response = client.get("/tasks/changes", params={"since": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 410
+
+    # Just inside the horizon the same position is still usable
+    page = _changes(client, auth_headers, since=_cursor(change_seq, time.time() - retention + 60))
+    assert page["changed"] == []
+
+
+def test_prune_drops_tombstones_past_retention(engine, user, client, auth_headers):
+    from datetime import datetime, timedelta
+    from sqlalchemy import update
+    from app.config import get_settings
+    from app.models import TaskTombstone
+    from app.services.task_changes import prune_tombstones
+
+    old, recent = _add_task(engine, user, "old"), _add_task(engine, user, "recent")
+    for task_id in (old, recent):
+        assert client.delete(f"/tasks/{task_id}", headers=auth_headers).status_code == 204
+    retention = timedelta(days=get_settings().task_tombstone_retention_days)
+    with Session(engine) as session:
+        session.execute(
+            update(TaskTombstone)
+            .where(TaskTombstone.task_id == old)
+            .values(deleted_at=datetime.utcnow() - retention - timedelta(hours=1))
+        )
+        session.commit()
+
+    prune_tombstones()
+
+    with Session(engine) as session:
+        remaining = session.exec(select(TaskTombstone.task_id).where(TaskTombstone.user_id == user.id)).all()
+    assert remaining == [recent]
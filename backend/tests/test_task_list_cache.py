@@ -0,0 +1,51 @@
+# File: backend/tests/test_task_list_cache.py
+# Invalidation hooks of the task list cache (services/task_list_cache.py)
+#
+# SQLAlchemy fires before_commit/after_commit/after_rollback for SAVEPOINTs
+# too (one per tool write in a unit-of-work chat turn); only the outermost
+# commit may invalidate, and a failed SAVEPOINT must not drop what earlier
+# ones recorded.
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from tests.conftest import run_async
+
+
+def test_savepoints_invalidate_on_the_outer_commit_only(engine, user):
+    from app.database import AsyncSessionLocal
+    from app.mcp.todo_tools import _write_scope, add_task_async
+    from app.services.task_list_cache import _PENDING_KEY, task_list_cache
+
+    async def turn():
+        async with AsyncSessionLocal() as db:
+            before = task_list_cache.generation(user.id)
+
+            result = await add_task_async(db, user, "first", commit=False)
+            assert result["success"]
+            assert task_list_cache.generation(user.id) == before
+            assert (user.id, "tasks") in db.sync_session.info[_PENDING_KEY]
+
+            # A failing write rolls back its SAVEPOINT only
+            try:
+                async with _write_scope(db, user, commit=False):
+                    await db.exec(text("SELECT 1 / 0"))
+            except Exception:
+                pass
+            assert (user.id, "tasks") in db.sync_session.info[_PENDING_KEY]
+
+            result = await add_task_async(db, user, "second", commit=False)
+            assert result["success"]
+            assert task_list_cache.generation(user.id) == before
+
+            await db.commit()
+            assert task_list_cache.generation(user.id) != before
+            assert _PENDING_KEY not in db.sync_session.info
+
+    run_async(turn())
+
+    from app.models import Task
+
+    with Session(engine) as session:
+        titles = session.exec(select(Task.title).where(Task.user_id == user.id)).all()
+    assert sorted(titles) == ["first", "second"]
@@ -0,0 +1,75 @@
+# File: backend/tests/test_task_stats.py
+# GET /tasks/stats: decoding the GROUPING SETS rows into the response buckets
+
+from datetime import datetime, timedelta
+
+from sqlmodel import Session
+
+
+def _add_tasks(engine, user, *specs):
+    from app.models import Task
+
+    with Session(engine) as session:
+        session.add_all(Task(user_id=user.id, **spec) for spec in specs)
+        session.commit()
+
+
+def test_every_bucket(engine, user, client, auth_headers):
+    now = datetime.utcnow()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    _add_tasks(
+        engine, user,
+        # Overdue
+        {"title": "t1", "priority": "high", "category": "work", "due_date": now - timedelta(days=3), "estimated_minutes": 30},
+        # Completed: counted, but in no due-date bucket or estimate
+        {"title": "t2", "priority": "high", "category": "work", "completed": True,
+         "due_date": now - timedelta(days=3), "estimated_minutes": 100},
+        # Due today (and this week), still ahead of now
+        {"title": "t3", "priority": "medium", "category": "home",
+         "due_date": now + (today + timedelta(days=1) - now) / 2, "estimated_minutes": 15},
+        # Due this week, no category
+        {"title": "t4", "priority": "low", "due_date": today + timedelta(days=3)},
+        {"title": "t5", "priority": "low", "category": "home", "completed": True},
+        # Due after this week
+        {"title": "t6", "priority": "medium", "category": "work", "due_date": today + timedelta(days=10)},
+    )
+
+    response = client.get("/tasks/stats", params={"tz": "UTC"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "total": 6, "completed": 2, "pending": 4,
+        "by_priority": {
+            "high": {"total": 2, "completed": 1, "pending": 1},
+            "medium": {"total": 2, "completed": 0, "pending": 2},
+            "low": {"total": 2, "completed": 1, "pending": 1},
+        },
+        # Largest first, then by name; no category last
+        "by_category": [
+            {"category": "work", "total": 3, "completed": 1, "pending": 2},
+            {"category": "home", "total": 2, "completed": 1, "pending": 1},
+            {"category": None, "total": 1, "completed": 0, "pending": 1},
+        ],
+        "overdue": 1,
+        "due_today": 1,
+        "due_this_week": 2,
+        "estimated_minutes_remaining": 45,
+    }
+
+
+def test_no_tasks(user, client, auth_headers):
+    response = client.get("/tasks/stats", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "total": 0, "completed": 0, "pending": 0,
+        "by_priority": {}, "by_category": [],
+        "overdue": 0, "due_today": 0, "due_this_week": 0,
+        "estimated_minutes_remaining": 0,
+    }
+
+
+def test_unknown_time_zone(user, client, auth_headers):
+    response = client.get("/tasks/stats", params={"tz": "Mars/Olympus"}, headers=auth_headers)
+
+    assert response.status_code == 400
@@ -0,0 +1,119 @@
+# File: backend/tests/test_task_sync.py
+# POST /tasks/sync: folding a batch into set-based statements, idempotency
+# keys, client_id resolution and the per-operation results
+
+from sqlmodel import Session, select
+
+
+def _add_task(engine, user, title):
+    from app.models import Task
+
+    with Session(engine) as session:
+        task = Task(user_id=user.id, title=title)
+        session.add(task)
+        session.commit()
+        return task.id
+
+
+def _tasks(engine, user):
+    """{id: (title, completed)} of the user's tasks."""
+    from app.models import Task
+
+    with Session(engine) as session:
+        tasks = session.exec(select(Task).where(Task.user_id == user.id)).all()
+        return {task.id: (task.title, task.completed) for task in tasks}
+
+
+def _sync(client, auth_headers, *operations):
+    response = client.post("/tasks/sync", json={"operations": list(operations)}, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _statuses(body):
+    return [result["status"] for result in body["results"]]
+
+
+MIXED_BATCH = [
+    {"op": "create", "idempotency_key": "k1", "client_id": "a", "task": {"title": "draft"}},
+    {"op": "update", "idempotency_key": "k2", "client_id": "a", "changes": {"title": "final"}},
+    {"op": "complete", "idempotency_key": "k3", "client_id": "a"},
+    {"op": "create", "idempotency_key": "k4", "client_id": "b", "task": {"title": "scratch"}},
+    {"op": "delete", "idempotency_key": "k5", "client_id": "b"},
+    {"op": "update", "idempotency_key": "k6", "client_id": "unknown", "changes": {"title": "x"}},
+    {"op": "update", "idempotency_key": "k7", "client_id": "a"},
+]
+
+
+def test_mixed_batch_is_folded(engine, user, client, auth_headers):
+    body = _sync(client, auth_headers, *MIXED_BATCH)
+
+    assert _statuses(body) == ["applied", "applied", "applied", "applied", "applied", "not_found", "invalid"]
+    task_id = body["id_map"]["a"]
+    assert "b" not in body["id_map"]  # Created and deleted in the same batch: never inserted
+    assert [result["task_id"] for result in body["results"][:3]] == [task_id] * 3
+    assert _tasks(engine, user) == {task_id: ("final", True)}
+
+
+def test_existing_tasks_are_updated_and_deleted(engine, user, client, auth_headers):
+    kept = _add_task(engine, user, "kept")
+    deleted = _add_task(engine, user, "deleted")
+
+    body = _sync(
+        client, auth_headers,
+        {"op": "update", "idempotency_key": "k1", "task_id": kept, "changes": {"title": "renamed"}},
+        {"op": "complete", "idempotency_key": "k2", "task_id": kept},
+        {"op": "delete", "idempotency_key": "k3", "task_id": deleted},
+        {"op": "complete", "idempotency_key": "k4", "task_id": deleted},
+    )
+
+    assert _statuses(body) == ["applied", "applied", "applied", "not_found"]
+    assert _tasks(engine, user) == {kept: ("renamed", True)}
+
+
+def test_replayed_batch_is_not_applied_twice(engine, user, client, auth_headers):
+    first = _sync(client, auth_headers, *MIXED_BATCH)
+    before = _tasks(engine, user)
+
+    replay = _sync(client, auth_headers, *MIXED_BATCH)
+
+    # not_found and invalid operations were not recorded: they are retried
+    assert _statuses(replay) == ["duplicate"] * 5 + ["not_found", "invalid"]
+    assert replay["id_map"] == first["id_map"]
+    assert replay["results"][0]["task_id"] == first["id_map"]["a"]
+    assert _tasks(engine, user) == before
+
+
+def test_client_id_resolves_across_batches(engine, user, client, auth_headers):
+    first = _sync(
+        client, auth_headers,
+        {"op": "create", "idempotency_key": "k1", "client_id": "a", "task": {"title": "offline"}},
+    )
+    task_id = first["id_map"]["a"]
+
+    body = _sync(
+        client, auth_headers,
+        # A new key for an already created client_id is still a duplicate create
+        {"op": "create", "idempotency_key": "k2", "client_id": "a", "task": {"title": "again"}},
+        {"op": "update", "idempotency_key": "k3", "client_id": "a", "changes": {"title": "synced"}},
+    )
+
+    assert _statuses(body) == ["duplicate", "applied"]
+    assert body["id_map"] == {"a": task_id}
+    assert [result["task_id"] for result in body["results"]] == [task_id, task_id]
+    assert _tasks(engine, user) == {task_id: ("synced", False)}
+
+
+def test_null_for_not_null_column_is_invalid(engine, user, client, auth_headers):
+    task_id = _add_task(engine, user, "keep me")
+
+    body = _sync(
+        client, auth_headers,
+        {"op": "update", "idempotency_key": "k1", "task_id": task_id, "changes": {"title": None}},
+        {"op": "update", "idempotency_key": "k2", "task_id": task_id, "changes": {"priority": None}},
+        {"op": "complete", "idempotency_key": "k3", "task_id": task_id},
+    )
+
+    assert _statuses(body) == ["invalid", "invalid", "applied"]
+    assert "title" in body["results"][0]["error"]
+    assert _tasks(engine, user) == {task_id: ("keep me", True)}
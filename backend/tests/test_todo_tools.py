@@ -0,0 +1,137 @@
+# File: backend/tests/test_todo_tools.py
+# AI agent tools (mcp/todo_tools.py)
+#
+# In unit-of-work mode (CHAT_SINGLE_TRANSACTION=true) each tool write runs
+# in a SAVEPOINT of the turn's transaction (_write_scope), committed once:
+# a rejected tool call must leave nothing for the next one to flush, and a
+# failed turn rolls back its tool writes.
+
+import pytest
+from sqlmodel import Session, select
+
+from tests.conftest import run_async
+
+
+def _add_task(engine, user, title="task"):
+    from app.models import Task
+
+    with Session(engine) as session:
+        task = Task(user_id=user.id, title=title)
+        session.add(task)
+        session.commit()
+        return task.id
+
+
+def _get_task(engine, task_id):
+    from app.models import Task
+
+    with Session(engine) as session:
+        return session.get(Task, task_id)
+
+
+def test_invalid_update_changes_nothing(engine, user):
+    from app.database import AsyncSessionLocal
+    from app.mcp.todo_tools import complete_task_async, update_task_async
+
+    task_id = _add_task(engine, user, "original")
+
+    async def turn():
+        async with AsyncSessionLocal() as db:
+            result = await update_task_async(
+                db, user, task_id, title="renamed", priority="urgent", commit=False
+            )
+            assert not result["success"]
+            result = await update_task_async(
+                db, user, task_id, title="renamed", due_date="tomorrow", commit=False
+            )
+            assert not result["success"]
+
+            # A later write in the same turn must not flush the rejected changes
+            result = await complete_task_async(db, user, task_id, commit=False)
+            assert result["success"]
+            await db.commit()
+
+    run_async(turn())
+
+    task = _get_task(engine, task_id)
+    assert task.title == "original"
+    assert task.priority == "medium"
+    assert task.completed
+
+
+def test_failed_chat_turn_rolls_back_tool_writes(engine, user, client, auth_headers, monkeypatch):
+    from app.config import get_settings
+    from app.mcp.todo_tools import add_task_async
+    from app.models import Conversation, Task
+    from app.services import agent_service
+
+    monkeypatch.setattr(get_settings(), "chat_single_transaction", True)
+    monkeypatch.setattr(agent_service, "create_agent", lambda llm, user, unit_of_work=None: unit_of_work)
+
+    async def run_agent(agent_executor, user_message, chat_history):
+        result = await add_task_async(agent_executor, user, "half done", commit=False)
+        assert result["success"]
+        return {"response": "Something went wrong", "tool_calls": [], "error": "boom"}
+
+    monkeypatch.setattr(agent_service, "run_agent", run_agent)
+
+    try:
+        response = client.post("/chat", json={"message": "add a task"}, headers=auth_headers)
+    finally:
+        run_async(_noop())
+
+    assert response.status_code == 200
+    with Session(engine) as session:
+        assert session.exec(select(Task).where(Task.user_id == user.id)).all() == []
+        conversation = session.get(Conversation, response.json()["conversation_id"])
+    assert conversation.user_id == user.id
+
+
+async def _noop():
+    """run_async() disposes the async pool the request's event loop used."""
+
+
+def _list_tasks(engine, user, mode, **kwargs):
+    """list_tasks or list_tasks_async, same arguments and result."""
+    from app.database import AsyncSessionLocal
+    from app.mcp.todo_tools import list_tasks, list_tasks_async
+
+    if mode == "sync":
+        with Session(engine) as session:
+            return list_tasks(session, user, **kwargs)
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            return await list_tasks_async(db, user, **kwargs)
+
+    return run_async(run())
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_list_tasks_paging(engine, user, mode):
+    for title in ("a", "b", "c"):
+        _add_task(engine, user, title)
+
+    page = _list_tasks(engine, user, mode, limit=2)
+    assert (page["count"], page["total"], page["more"], page["next_offset"]) == (2, 3, 1, 2)
+
+    page = _list_tasks(engine, user, mode, limit=2, offset=2)
+    assert (page["count"], page["total"]) == (1, 3)
+    assert "more" not in page
+
+    # Past the end: the real total, not 0, so the model retries from offset=0
+    for offset in (3, 10):
+        page = _list_tasks(engine, user, mode, limit=2, offset=offset)
+        assert (page["count"], page["total"], page["tasks"]) == (0, 3, [])
+        assert "past the end" in page["message"]
+        assert "more" not in page
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_list_tasks_past_the_end_without_matches(engine, user, mode):
+    _add_task(engine, user, "open")
+
+    page = _list_tasks(engine, user, mode, status="completed", offset=5)
+
+    assert (page["count"], page["total"]) == (0, 0)
+    assert page["message"] == "Found 0 task(s), showing 0"